@@ -0,0 +1,109 @@
+"""
+Build time and query latency of ``FuzzyIndex`` on vocabulary-shaped keys.
+
+Run from the repository root::
+
+    python benchmarks/fuzzy_index.py [--keys 300000] [--queries 2000]
+
+Clinical vocabularies repeat long stems across thousands of concepts
+("malignant neoplasm of ...", "fracture of ...", "closed fracture of ..."),
+which is the worst case for candidate generation: a scheme that only looks
+at the start of a key sees most of a stem family as candidates. The keys
+here are generated from such stems, the queries are keys with one or two
+typos, and the script reports the build time, the mean and p99 query time
+and the mean number of candidates verified per query.
+"""
+
+import argparse
+import random
+import statistics
+import string
+import time
+
+from omop_alchemy.cdm.handlers.vocabs_and_mappers.fuzzy_index import FuzzyIndex
+
+STEMS = [
+    "malignant neoplasm of",
+    "secondary malignant neoplasm of",
+    "benign neoplasm of",
+    "carcinoma in situ of",
+    "closed fracture of",
+    "open fracture of",
+    "fracture of",
+    "injury of",
+    "laceration of",
+    "congenital anomaly of",
+    "disorder of",
+    "inflammation of",
+]
+QUALIFIERS = ["", "left", "right", "bilateral", "upper", "lower", "overlapping sites of", "posterior", "anterior"]
+SITES = [
+    "breast", "lung", "bronchus", "colon", "rectum", "stomach", "liver", "pancreas", "kidney", "bladder",
+    "prostate", "ovary", "uterus", "cervix", "thyroid", "brain", "skin", "bone", "femur", "tibia", "fibula",
+    "humerus", "radius", "ulna", "clavicle", "scapula", "pelvis", "spine", "rib", "skull", "mandible",
+    "maxilla", "tongue", "larynx", "pharynx", "esophagus", "duodenum", "jejunum", "ileum", "appendix",
+]
+DETAILS = ["", "nos", "unspecified", "initial encounter", "subsequent encounter", "sequela", "with complication"]
+
+
+def vocabulary_keys(n: int, rng: random.Random) -> list[str]:
+    keys: set[str] = set()
+    while len(keys) < n:
+        parts = [rng.choice(STEMS), rng.choice(QUALIFIERS), rng.choice(SITES), rng.choice(DETAILS)]
+        key = " ".join(p for p in parts if p)
+        if rng.random() < 0.5:
+            key += f" {rng.randint(1, 999)}"
+        keys.add(key)
+    return sorted(keys)
+
+
+def typo(term: str, rng: random.Random, edits: int) -> str:
+    chars = list(term)
+    for _ in range(edits):
+        i = rng.randrange(len(chars))
+        op = rng.choice(("sub", "del", "ins", "swap"))
+        if op == "sub":
+            chars[i] = rng.choice(string.ascii_lowercase)
+        elif op == "del" and len(chars) > 1:
+            del chars[i]
+        elif op == "ins":
+            chars.insert(i, rng.choice(string.ascii_lowercase))
+        elif i + 1 < len(chars):
+            chars[i], chars[i + 1] = chars[i + 1], chars[i]
+    return "".join(chars)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--keys", type=int, default=300_000)
+    parser.add_argument("--queries", type=int, default=2_000)
+    parser.add_argument("--max-edit-distance", type=int, default=2)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    keys = vocabulary_keys(args.keys, rng)
+
+    start = time.perf_counter()
+    fuzzy = FuzzyIndex(keys, max_edit_distance=args.max_edit_distance)
+    build = time.perf_counter() - start
+
+    queries = [typo(rng.choice(keys), rng, rng.randint(1, args.max_edit_distance)) for _ in range(args.queries)]
+    timings: list[float] = []
+    fan_out: list[int] = []
+    for query in queries:
+        start = time.perf_counter()
+        fuzzy.best_match(query)
+        timings.append(time.perf_counter() - start)
+        fan_out.append(len(fuzzy.candidates(query)))
+
+    timings.sort()
+    print(f"keys              {len(keys):>12,}")
+    print(f"build             {build:>11.2f}s")
+    print(f"query mean        {statistics.fmean(timings) * 1000:>10.3f}ms")
+    print(f"query p99         {timings[int(len(timings) * 0.99)] * 1000:>10.3f}ms")
+    print(f"candidates mean   {statistics.fmean(fan_out):>12,.1f}")
+
+
+if __name__ == "__main__":
+    main()
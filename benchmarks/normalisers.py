@@ -0,0 +1,105 @@
+"""
+Throughput of composed vs compiled concept normalisers.
+
+Run from the repository root::
+
+    python benchmarks/normalisers.py [--terms 200000] [--repeat 5]
+
+Each term set mimics a hot ETL path: free-text AJCC/UICC stage groupings,
+ICD-O topography codes and condition names as they arrive from source
+systems (mixed case, stray whitespace, roman numerals, ``NOS`` suffixes).
+For each chain the script checks that both normalisers agree on every term
+and reports terms/second for ``compose_normalizers`` and
+``compile_normalizers``.
+"""
+
+import argparse
+import random
+import timeit
+
+from omop_alchemy.cdm.handlers.vocabs_and_mappers.concept_normalisers import (
+    compile_normalizers,
+    compose_normalizers,
+    make_stage,
+    normalize_default,
+    strip_uicc,
+)
+
+
+def stage_terms(n: int, rng: random.Random) -> list[str]:
+    groups = ["0", "I", "IA", "IB", "II", "IIA", "IIB", "IIC", "III", "IIIA", "IIIB", "IIIC", "IV", "IVA", "IVB"]
+    prefixes = ["Stage", "stage", "AJCC Stage", "ajcc stage", "UICC stage", "Clinical stage", "Pathologic Stage"]
+    out = []
+    for _ in range(n):
+        term = f"{rng.choice(prefixes)}-{rng.choice(groups)}"
+        if rng.random() < 0.2:
+            term += " NOS"
+        if rng.random() < 0.3:
+            term = f"  {term} "
+        out.append(term)
+    return out
+
+
+def site_terms(n: int, rng: random.Random) -> list[str]:
+    return [
+        f"{' ' * rng.randint(0, 2)}C{rng.randint(0, 80):02d}.{rng.randint(0, 9)}{' ' * rng.randint(0, 2)}"
+        for _ in range(n)
+    ]
+
+
+def condition_terms(n: int, rng: random.Random) -> list[str]:
+    names = [
+        "Malignant neoplasm of breast",
+        "Type 2 diabetes mellitus",
+        "Adenocarcinoma of lung, NOS",
+        "Squamous cell carcinoma of skin",
+        "Chronic kidney disease stage-iii",
+        "Essential hypertension",
+        "Non-small cell lung cancer, stage-iv",
+    ]
+    out = []
+    for _ in range(n):
+        name = rng.choice(names)
+        name = name.upper() if rng.random() < 0.3 else name
+        out.append(f"{' ' * rng.randint(0, 3)}{name}{' ' * rng.randint(0, 3)}")
+    return out
+
+
+CHAINS = {
+    "stage": ((normalize_default, make_stage), stage_terms),
+    "ajcc/uicc stage": ((normalize_default, strip_uicc, make_stage), stage_terms),
+    "site": ((normalize_default,), site_terms),
+    "condition": ((normalize_default, make_stage), condition_terms),
+}
+
+
+def bench(fn, terms: list[str], repeat: int) -> float:
+    """Best-of-``repeat`` throughput in terms per second."""
+    best = min(timeit.repeat(lambda: [fn(t) for t in terms], number=1, repeat=repeat))
+    return len(terms) / best
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--terms", type=int, default=200_000)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    print(f"{'chain':<18}{'composed/s':>14}{'compiled/s':>14}{'speedup':>10}")
+    for label, (fns, make_terms) in CHAINS.items():
+        terms = make_terms(args.terms, rng)
+        composed = compose_normalizers(*fns)
+        compiled = compile_normalizers(*fns)
+        mismatches = sum(composed(t) != compiled(t) for t in terms)
+        if mismatches:
+            raise SystemExit(f"{label}: compiled normaliser disagrees on {mismatches} terms")
+
+        slow = bench(composed, terms, args.repeat)
+        fast = bench(compiled, terms, args.repeat)
+        print(f"{label:<18}{slow:>14,.0f}{fast:>14,.0f}{fast / slow:>9.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -167,6 +167,24 @@ class Backend(ABC):
         """
         conn.exec_driver_sql(f'DROP INDEX IF EXISTS "{index_name}"')
 
+    @property
+    def supports_concurrent_index_builds(self) -> bool:
+        """True when separate connections can build indexes at the same time.
+
+        False by default: e.g. SQLite serialises all writers, so building
+        indexes from several connections only adds lock waits.
+        """
+        return False
+
+    def configure_index_build_session(
+        self,
+        conn: sa.Connection,
+        *,
+        maintenance_work_mem: str | None = None,
+        max_parallel_maintenance_workers: int | None = None,
+    ) -> None:
+        pass  # no-op by default; PostgreSQL overrides with transaction-local settings
+
     def truncate_table_batch(
         self,
         conn: sa.Connection,
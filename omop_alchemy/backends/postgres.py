@@ -173,6 +173,30 @@ class PostgresBackend(Backend):
     def drop_index_if_exists(self, conn: sa.Connection, index_name: str, db_schema: str | None) -> None:
         conn.exec_driver_sql(f"DROP INDEX IF EXISTS {_qualified_index(index_name, db_schema)}")
 
+    @property
+    def supports_concurrent_index_builds(self) -> bool:
+        return True
+
+    def configure_index_build_session(
+        self,
+        conn: sa.Connection,
+        *,
+        maintenance_work_mem: str | None = None,
+        max_parallel_maintenance_workers: int | None = None,
+    ) -> None:
+        # set_config(..., true) is SET LOCAL: the values end with the build's
+        # transaction and never leak into pooled connections.
+        settings = {
+            "maintenance_work_mem": maintenance_work_mem,
+            "max_parallel_maintenance_workers": max_parallel_maintenance_workers,
+        }
+        for name, value in settings.items():
+            if value is not None:
+                conn.execute(
+                    sa.text("SELECT set_config(:name, :value, true)"),
+                    {"name": name, "value": str(value)},
+                )
+
     def truncate_table_batch(
         self,
         conn: sa.Connection,
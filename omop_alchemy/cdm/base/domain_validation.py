@@ -1,7 +1,6 @@
 from sqlalchemy import orm as so
-from orm_loader.helpers import get_model_by_tablename
 #from .domain_rule import DomainRule
-from typing import FrozenSet
+from typing import FrozenSet, Iterable
 from dataclasses import dataclass
 from typing import Optional
 
@@ -137,6 +136,9 @@ class DomainValidationMixin:
         - concept_id is 0
         - object is detached
         - concept domain matches expectation
+
+        Concept domains are read through the process-wide concept attribute
+        cache; see ``prefetch_domains`` for warming it for a batch.
         """
         expected = self.__expected_domains__.get(field)
         if not expected:
@@ -149,12 +151,34 @@ class DomainValidationMixin:
         session = so.object_session(self)
         if session is None:
             return True  # detached; best-effort
-        # need to be able to query concept table but can't import directly here to avoid circular imports
-        ConceptCls = get_model_by_tablename("Concept")
-        if ConceptCls is None:
+        if concept_id is None:
             return False
-        concept = session.get(ConceptCls, concept_id)
-        return concept.domain_id in expected.domains if concept else False  # type: ignore[union-attr]
+        # the cache imports Concept, which can't be imported here without a circular import
+        from ..handlers.vocabs_and_mappers.concept_cache import concept_attribute_cache
+        concept = concept_attribute_cache(session.get_bind()).get(session, concept_id)
+        return concept.domain_id in expected.domains if concept else False
+
+    @classmethod
+    def prefetch_domains(cls, session: so.Session, objects: Iterable["DomainValidationMixin"]) -> int:
+        """
+        Load the concepts referenced by ``objects`` into the concept attribute cache.
+
+        Call this before validating a batch so that ``domain_violations`` on
+        each object is answered from memory instead of one query per field.
+
+        Returns
+        -------
+        int
+            Number of concept ids that had to be fetched.
+        """
+        from ..handlers.vocabs_and_mappers.concept_cache import concept_attribute_cache
+        ids = {
+            concept_id
+            for obj in objects
+            for field in cls.__expected_domains__
+            if (concept_id := getattr(obj, field, None))
+        }
+        return concept_attribute_cache(session.get_bind()).prefetch(session, ids)
 
 
     @property
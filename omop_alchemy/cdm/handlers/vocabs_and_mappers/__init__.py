@@ -1,16 +1,50 @@
-from .vocab_handlers import LookupIndex, LookupSpec, ConceptResolver, make_concept_resolver
-from .concept_normalisers import compose_normalizers, normalize_default, strip_uicc, make_stage, site_to_NOS
-from .concept_registry import ConceptResolverRegistry
+from .vocab_handlers import LookupIndex, LookupDelta, LookupSpec, LookupCollision, LookupCollisionError, ConceptResolver, BatchLookupResult, LookupStats, make_concept_resolver
+from .concept_normalisers import compose_normalizers, compile_normalizers, normalize_default, strip_uicc, make_stage, site_to_NOS
+from .concept_cache import ConceptAttributeCache, ConceptAttributes, concept_attribute_cache
+from .concept_hierarchy import ConceptHierarchy
+from .concept_mapper import ConceptMapper, SourceMapping
+from .drug_strength_index import DrugStrengthIndex
+from .concept_registry import ConceptResolverRegistry, ResolverRefreshResult, ResolverWarmResult
+from .fuzzy_index import FuzzyIndex, FuzzyMatch
+from .lookup_snapshot import (
+    LookupSnapshotCache,
+    SharedLookupMapping,
+    open_lookup_snapshot,
+    read_lookup_snapshot,
+    write_lookup_snapshot,
+)
 
 __all__ = [
     "LookupIndex",
+    "LookupDelta",
+    "LookupCollision",
+    "LookupCollisionError",
     "LookupSpec",
     "ConceptResolver",
+    "BatchLookupResult",
+    "LookupStats",
     "make_concept_resolver",
     "compose_normalizers",
+    "compile_normalizers",
     "normalize_default",
     "strip_uicc",
     "make_stage",
     "site_to_NOS",
+    "ConceptAttributeCache",
+    "ConceptAttributes",
+    "concept_attribute_cache",
+    "ConceptHierarchy",
+    "ConceptMapper",
+    "SourceMapping",
+    "DrugStrengthIndex",
     "ConceptResolverRegistry",
+    "ResolverRefreshResult",
+    "ResolverWarmResult",
+    "FuzzyIndex",
+    "FuzzyMatch",
+    "LookupSnapshotCache",
+    "SharedLookupMapping",
+    "open_lookup_snapshot",
+    "read_lookup_snapshot",
+    "write_lookup_snapshot",
 ]
\ No newline at end of file
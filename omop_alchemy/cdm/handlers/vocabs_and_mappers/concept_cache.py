@@ -0,0 +1,257 @@
+"""
+Process-wide cache of concept attributes.
+
+Row-level checks such as ``OMOPConceptResolver.are_standard`` and
+``DomainValidationMixin._check_domain`` ask the same few questions about the
+same concept ids over and over: is it standard, which domain, is it valid.
+``ConceptAttributeCache`` answers them from memory, fetching unseen ids in one
+query per batch. One cache is shared per database engine (see
+``concept_attribute_cache``), so every session in the process benefits.
+
+Entries always reflect committed data. Once a session flushes a change to a
+``Concept`` row, its lookups bypass the cache (neither reading nor storing
+entries) until its transaction ends; committing such a change clears every
+cache, and rolling it back leaves them untouched, so an uncommitted or
+rolled-back change is never served to anyone. Changes made outside the ORM
+unit of work - bulk loads, Core ``insert``/``update`` statements, other
+processes - are not seen: after them, call ``clear`` (or
+``concept_attribute_cache(engine).clear()``). ``load_vocab_source`` does
+this for the engine it loads into.
+"""
+
+import threading
+import weakref
+from collections import OrderedDict
+from collections.abc import Iterable
+from dataclasses import dataclass
+
+import sqlalchemy as sa
+import sqlalchemy.event as sae
+import sqlalchemy.orm as so
+
+from ...model.vocabulary.concept import Concept, StandardConceptFlag
+from ...query import id_in
+
+DEFAULT_MAXSIZE = 100_000
+# session.info flag: the session has flushed Concept changes in its current transaction
+_CONCEPTS_CHANGED = "omop_alchemy.concepts_changed"
+
+
+@dataclass(frozen=True)
+class ConceptAttributes:
+    """The concept columns consulted by validation and standardness checks."""
+    concept_id: int
+    domain_id: str
+    vocabulary_id: str
+    concept_class_id: str
+    standard_concept: str | None
+    invalid_reason: str | None
+
+    @property
+    def is_standard(self) -> bool:
+        """Same semantics as ``Concept.is_standard`` ('S' or 'C', blanks ignored)."""
+        value = self.standard_concept.strip() if self.standard_concept is not None else ""
+        return bool(value) and value in StandardConceptFlag.values
+
+    @property
+    def is_valid(self) -> bool:
+        """Same semantics as ``Concept.is_valid`` (no invalid_reason, blanks ignored)."""
+        return not (self.invalid_reason or "").strip()
+
+
+@dataclass(frozen=True)
+class ConceptCacheInfo:
+    hits: int
+    misses: int
+    maxsize: int | None
+    currsize: int
+
+
+class ConceptAttributeCache:
+    """
+    Bounded, thread-safe LRU cache of ``concept_id -> ConceptAttributes``.
+
+    Parameters
+    ----------
+    maxsize:
+        Maximum number of ids kept. The least recently used entries are
+        evicted first. ``None`` disables eviction; ``0`` disables caching, so
+        every call queries the database.
+    cache_missing:
+        If True, ids that do not exist are remembered too, so repeated misses
+        stay in memory. Off by default: a cached miss would hide a concept
+        added to the vocabulary later until the cache is cleared.
+
+    Examples
+    --------
+    >>> cache = concept_attribute_cache(session.get_bind())
+    >>> cache.prefetch(session, df["condition_concept_id"].unique())
+    >>> cache.get(session, 201826).domain_id
+    'Condition'
+    """
+
+    def __init__(self, maxsize: int | None = DEFAULT_MAXSIZE, *, cache_missing: bool = False):
+        if maxsize is not None and maxsize < 0:
+            raise ValueError("maxsize must be non-negative or None")
+        self.maxsize = maxsize
+        self.cache_missing = cache_missing
+        # None marks an id known not to exist (only stored with cache_missing)
+        self._entries: OrderedDict[int, ConceptAttributes | None] = OrderedDict()
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+
+    def get(self, session: so.Session, concept_id: int) -> ConceptAttributes | None:
+        """Return the attributes of one concept, or None if it does not exist."""
+        return self.get_many(session, (concept_id,)).get(int(concept_id))
+
+    def get_many(self, session: so.Session, concept_ids: Iterable[int]) -> dict[int, ConceptAttributes]:
+        """
+        Return attributes for every existing concept in ``concept_ids``.
+
+        Ids not yet cached are fetched together in a single query. Ids that do
+        not exist are absent from the result.
+        """
+        wanted = list(dict.fromkeys(int(cid) for cid in concept_ids))
+        if _concepts_changed(session):
+            return self._fetch(session, wanted)
+        found: dict[int, ConceptAttributes] = {}
+        missing: list[int] = []
+        with self._lock:
+            for cid in wanted:
+                if cid not in self._entries:
+                    missing.append(cid)
+                    continue
+                self._entries.move_to_end(cid)
+                entry = self._entries[cid]
+                if entry is not None:
+                    found[cid] = entry
+            self._hits += len(wanted) - len(missing)
+            self._misses += len(missing)
+
+        if missing:
+            fetched = self._fetch(session, missing)
+            found.update(fetched)
+            # the fetch may have autoflushed a concept change
+            if not _concepts_changed(session):
+                self._store(missing, fetched)
+        return found
+
+    def prefetch(self, session: so.Session, concept_ids: Iterable[int]) -> int:
+        """
+        Load every uncached id in ``concept_ids`` with one query.
+
+        Returns the number of ids that had to be fetched. Prefetching more
+        ids than ``maxsize`` evicts the earliest of them again. Nothing is
+        loaded (and 0 is returned) while ``session`` has uncommitted concept
+        changes.
+        """
+        if _concepts_changed(session):
+            return 0
+        with self._lock:
+            missing = [cid for cid in dict.fromkeys(int(c) for c in concept_ids) if cid not in self._entries]
+        if missing:
+            fetched = self._fetch(session, missing)
+            if _concepts_changed(session):
+                return 0
+            self._store(missing, fetched)
+        return len(missing)
+
+    def _fetch(self, session: so.Session, concept_ids: list[int]) -> dict[int, ConceptAttributes]:
+        rows = session.execute(
+            sa.select(
+                Concept.concept_id,
+                Concept.domain_id,
+                Concept.vocabulary_id,
+                Concept.concept_class_id,
+                Concept.standard_concept,
+                Concept.invalid_reason,
+            ).where(id_in(Concept.concept_id, concept_ids))
+        )
+        return {int(row[0]): ConceptAttributes(int(row[0]), *row[1:]) for row in rows}
+
+    def _store(self, requested: list[int], fetched: dict[int, ConceptAttributes]) -> None:
+        if self.maxsize == 0:
+            return
+        with self._lock:
+            for cid in requested:
+                entry = fetched.get(cid)
+                if entry is None and not self.cache_missing:
+                    continue
+                self._entries[cid] = entry
+                self._entries.move_to_end(cid)
+            if self.maxsize is not None:
+                while len(self._entries) > self.maxsize:
+                    self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """Drop every cached entry and reset the statistics."""
+        with self._lock:
+            self._entries.clear()
+            self._hits = self._misses = 0
+
+    def info(self) -> ConceptCacheInfo:
+        with self._lock:
+            return ConceptCacheInfo(self._hits, self._misses, self.maxsize, len(self._entries))
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __repr__(self) -> str:
+        return f"<ConceptAttributeCache size={len(self._entries)} maxsize={self.maxsize}>"
+
+
+_caches: "weakref.WeakKeyDictionary[sa.Engine, ConceptAttributeCache]" = weakref.WeakKeyDictionary()
+_caches_lock = threading.Lock()
+
+
+def concept_attribute_cache(
+    bind: sa.Engine | sa.Connection,
+    *,
+    maxsize: int | None = None,
+) -> ConceptAttributeCache:
+    """
+    Return the process-wide cache for the database behind ``bind``.
+
+    The cache is created on first use with ``maxsize`` (``DEFAULT_MAXSIZE`` if
+    not given). Passing ``maxsize`` for an existing cache resizes it; the
+    excess is evicted on the next insertion. ``None`` here means "keep the
+    current size"; set ``cache.maxsize = None`` to disable eviction.
+    """
+    engine = bind.engine
+    with _caches_lock:
+        cache = _caches.get(engine)
+        if cache is None:
+            cache = _caches[engine] = ConceptAttributeCache(DEFAULT_MAXSIZE if maxsize is None else maxsize)
+        elif maxsize is not None:
+            if maxsize < 0:
+                raise ValueError("maxsize must be non-negative or None")
+            cache.maxsize = maxsize
+    return cache
+
+
+def _concepts_changed(session: so.Session) -> bool:
+    return session.info.get(_CONCEPTS_CHANGED, False)
+
+
+@sae.listens_for(so.Session, "after_flush")
+def _note_concept_changes(session: so.Session, flush_context) -> None:
+    if not session.info.get(_CONCEPTS_CHANGED) and any(
+        isinstance(obj, Concept) for obj in (*session.new, *session.dirty, *session.deleted)
+    ):
+        session.info[_CONCEPTS_CHANGED] = True
+
+
+@sae.listens_for(so.Session, "after_commit")
+def _clear_after_concept_commit(session: so.Session) -> None:
+    if session.info.pop(_CONCEPTS_CHANGED, False):
+        with _caches_lock:
+            caches = list(_caches.values())
+        for cache in caches:
+            cache.clear()
+
+
+@sae.listens_for(so.Session, "after_rollback")
+def _forget_concept_changes(session: so.Session) -> None:
+    # nothing was stored while the flag was set, so the caches are still clean
+    session.info.pop(_CONCEPTS_CHANGED, None)
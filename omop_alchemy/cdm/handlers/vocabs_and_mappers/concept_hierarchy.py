@@ -0,0 +1,400 @@
+from __future__ import annotations
+
+import bisect
+import functools
+import hashlib
+import json
+import os
+import struct
+import sys
+from array import array
+from collections.abc import Iterable, Sequence
+from dataclasses import dataclass
+from pathlib import Path
+
+import sqlalchemy as sa
+import sqlalchemy.orm as so
+
+from ...model.vocabulary import Concept, Concept_Ancestor
+from .lookup_snapshot import (
+    LookupSnapshotError,
+    _int_view,
+    _IntFormat,
+    _open_mmap,
+    vocabulary_versions,
+)
+
+"""
+In-process index over the ``concept_ancestor`` closure.
+
+``concept_ancestor`` already stores the transitive closure of the hierarchy,
+so "all descendants of X" is a single adjacency row rather than a traversal.
+``ConceptHierarchy`` keeps that closure in compressed sparse row (CSR) form in
+both directions - ancestor to descendants and descendant to ancestors - with
+the min/max levels of separation of every pair alongside. Expanding a parent
+set is then a handful of binary searches and array slices, with no database
+round trip.
+
+The arrays can be written to a cache file and memory-mapped, so the closure is
+read from the database once per vocabulary release and every process on the
+machine shares one copy through the page cache.
+
+File layout (all integers little-endian)::
+
+    magic          8 bytes   b"OAHIER01"
+    header_len     uint32
+    header         JSON      fingerprint, pairs, down_nodes, up_nodes, non_standard
+    padding        to an 8-byte boundary
+    down_nodes     int64  * down_nodes         ancestors, ascending
+    down_offsets   uint64 * (down_nodes + 1)
+    down_targets   int64  * pairs              descendants, ascending within a row
+    up_nodes       int64  * up_nodes           descendants, ascending
+    up_offsets     uint64 * (up_nodes + 1)
+    up_targets     int64  * pairs              ancestors, ascending within a row
+    non_standard   int64  * non_standard       closure members that are not standard
+    down_min       int32  * pairs              levels, aligned with down_targets
+    down_max       int32  * pairs
+    up_min         int32  * pairs              levels, aligned with up_targets
+    up_max         int32  * pairs
+"""
+
+HIERARCHY_MAGIC = b"OAHIER01"
+HIERARCHY_SUFFIX = ".oahier"
+
+_HEADER_LEN = struct.Struct("<I")
+
+
+@dataclass(frozen=True)
+class _Adjacency:
+    """One direction of the closure in CSR form."""
+    nodes: Sequence[int]
+    offsets: Sequence[int]
+    targets: Sequence[int]
+    min_levels: Sequence[int]
+    max_levels: Sequence[int]
+
+    def row(self, concept_id: int) -> tuple[int, int]:
+        i = bisect.bisect_left(self.nodes, concept_id)
+        if i == len(self.nodes) or self.nodes[i] != concept_id:
+            return 0, 0
+        return self.offsets[i], self.offsets[i + 1]
+
+    def find(self, source: int, target: int) -> int | None:
+        start, end = self.row(source)
+        i = bisect.bisect_left(self.targets, target, start, end)
+        return i if i < end and self.targets[i] == target else None
+
+
+def _build_adjacency(
+    session: so.Session,
+    source: so.InstrumentedAttribute[int],
+    target: so.InstrumentedAttribute[int],
+    batch_size: int,
+) -> _Adjacency:
+    nodes, offsets, targets = array("q"), array("Q"), array("q")
+    min_levels, max_levels = array("i"), array("i")
+    q = (
+        sa.select(
+            source,
+            target,
+            Concept_Ancestor.min_levels_of_separation,
+            Concept_Ancestor.max_levels_of_separation,
+        )
+        .order_by(source, target)
+        .execution_options(yield_per=batch_size)
+    )
+    for partition in session.execute(q).partitions():
+        for src, tgt, lo, hi in partition:
+            if not nodes or nodes[-1] != src:
+                nodes.append(src)
+                offsets.append(len(targets))
+            targets.append(tgt)
+            min_levels.append(lo)
+            max_levels.append(hi)
+    offsets.append(len(targets))
+    return _Adjacency(nodes, offsets, targets, min_levels, max_levels)
+
+
+class ConceptHierarchy:
+    """
+    Read-only, in-memory view of ``concept_ancestor``.
+
+    Build one with ``from_database`` (in memory), ``open`` (memory-mapped from
+    a file written by ``write``), or ``load``, which manages a cache file per
+    vocabulary release. Queries mirror the database semantics of
+    ``OMOPConceptSource.descendants``: a concept is its own descendant only if
+    ``concept_ancestor`` holds the self-link (as the OMOP release does), and
+    non-standard concepts are excluded unless asked for.
+
+    Separation filters use ``min_levels_of_separation``: ``max_separation=1``
+    keeps direct children (and the concept itself), ``min_separation=1``
+    drops the self-link.
+
+    Instances opened from a file pickle as their path, so they can be handed
+    to worker processes without copying the closure.
+
+    Examples
+    --------
+    >>> hierarchy = ConceptHierarchy.load(session, cache_dir="~/.cache/omop_alchemy")
+    >>> hierarchy.descendants([201820])
+    [201254, 201820, 201826, ...]
+    >>> hierarchy.is_descendant_of(201826, [201820])
+    True
+    """
+
+    def __init__(
+        self,
+        down: _Adjacency,
+        up: _Adjacency,
+        non_standard: Sequence[int],
+        *,
+        path: Path | None = None,
+        fingerprint: str = "",
+    ):
+        self._down = down
+        self._up = up
+        self._non_standard_ids = non_standard
+        self.path = path
+        self.fingerprint = fingerprint
+
+    @classmethod
+    def from_database(cls, session: so.Session, *, batch_size: int = 100_000) -> ConceptHierarchy:
+        """
+        Read the closure from ``concept_ancestor`` into memory.
+
+        The table is streamed twice, once ordered per direction, so no sort
+        happens in Python.
+        """
+        down = _build_adjacency(
+            session, Concept_Ancestor.ancestor_concept_id, Concept_Ancestor.descendant_concept_id, batch_size
+        )
+        up = _build_adjacency(
+            session, Concept_Ancestor.descendant_concept_id, Concept_Ancestor.ancestor_concept_id, batch_size
+        )
+        members = sa.union(
+            sa.select(Concept_Ancestor.ancestor_concept_id),
+            sa.select(Concept_Ancestor.descendant_concept_id),
+        )
+        non_standard = array(
+            "q",
+            session.scalars(
+                sa.select(Concept.concept_id)
+                .where(Concept.concept_id.in_(members))
+                .where(sa.or_(Concept.standard_concept.is_(None), Concept.standard_concept != "S"))
+                .order_by(Concept.concept_id)
+            ),
+        )
+        return cls(down, up, non_standard)
+
+    @classmethod
+    def open(cls, path: str | Path) -> ConceptHierarchy:
+        """Memory-map a hierarchy file written by ``write``."""
+        path = Path(path)
+        buf = _open_mmap(path)
+        if buf[: len(HIERARCHY_MAGIC)] != HIERARCHY_MAGIC:
+            raise LookupSnapshotError(f"{path} is not a concept hierarchy file (bad magic)")
+
+        start = len(HIERARCHY_MAGIC)
+        (header_len,) = _HEADER_LEN.unpack_from(buf, start)
+        start += _HEADER_LEN.size
+        header = json.loads(buf[start : start + header_len].decode("utf-8"))
+        start += header_len
+        start += -start % 8
+
+        pairs = int(header["pairs"])
+        sections: list[tuple[_IntFormat, int]] = [
+            ("q", int(header["down_nodes"])),
+            ("Q", int(header["down_nodes"]) + 1),
+            ("q", pairs),
+            ("q", int(header["up_nodes"])),
+            ("Q", int(header["up_nodes"]) + 1),
+            ("q", pairs),
+            ("q", int(header["non_standard"])),
+            ("i", pairs),
+            ("i", pairs),
+            ("i", pairs),
+            ("i", pairs),
+        ]
+        views = []
+        for fmt, count in sections:
+            end = start + array(fmt).itemsize * count
+            if end > len(buf):
+                raise LookupSnapshotError(f"{path} is truncated")
+            views.append(_int_view(buf, start, end, fmt))
+            start = end
+
+        down_nodes, down_offsets, down_targets, up_nodes, up_offsets, up_targets, non_standard = views[:7]
+        down_min, down_max, up_min, up_max = views[7:]
+        return cls(
+            _Adjacency(down_nodes, down_offsets, down_targets, down_min, down_max),
+            _Adjacency(up_nodes, up_offsets, up_targets, up_min, up_max),
+            non_standard,
+            path=path,
+            fingerprint=str(header.get("fingerprint", "")),
+        )
+
+    def write(self, path: str | Path, *, fingerprint: str = "") -> Path:
+        """
+        Serialise the hierarchy to ``path``.
+
+        As with lookup snapshots, the file is written to a temporary sibling
+        and atomically renamed into place.
+        """
+        path = Path(path)
+        header = json.dumps(
+            {
+                "fingerprint": fingerprint,
+                "pairs": len(self),
+                "down_nodes": len(self._down.nodes),
+                "up_nodes": len(self._up.nodes),
+                "non_standard": len(self._non_standard_ids),
+            },
+            separators=(",", ":"),
+        ).encode("utf-8")
+        preamble = len(HIERARCHY_MAGIC) + _HEADER_LEN.size + len(header)
+        sections = [
+            ("q", self._down.nodes),
+            ("Q", self._down.offsets),
+            ("q", self._down.targets),
+            ("q", self._up.nodes),
+            ("Q", self._up.offsets),
+            ("q", self._up.targets),
+            ("q", self._non_standard_ids),
+            ("i", self._down.min_levels),
+            ("i", self._down.max_levels),
+            ("i", self._up.min_levels),
+            ("i", self._up.max_levels),
+        ]
+
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+        try:
+            with open(tmp_path, "wb") as f:
+                f.write(HIERARCHY_MAGIC)
+                f.write(_HEADER_LEN.pack(len(header)))
+                f.write(header)
+                f.write(b"\0" * (-preamble % 8))
+                for fmt, values in sections:
+                    values = values if isinstance(values, array) else array(fmt, values)
+                    if sys.byteorder != "little":
+                        values = array(fmt, values)
+                        values.byteswap()
+                    values.tofile(f)
+            os.replace(tmp_path, path)
+        finally:
+            tmp_path.unlink(missing_ok=True)
+        return path
+
+    @classmethod
+    def load(
+        cls,
+        session: so.Session,
+        *,
+        cache_dir: str | Path | None = None,
+        batch_size: int = 100_000,
+    ) -> ConceptHierarchy:
+        """
+        Return the hierarchy for the session's vocabulary release.
+
+        Without ``cache_dir`` this is ``from_database``. With it, the closure
+        is read from a cache file keyed by the ``vocabulary`` versions when
+        one exists, and otherwise built, written there and memory-mapped.
+        """
+        if cache_dir is None:
+            return cls.from_database(session, batch_size=batch_size)
+
+        payload = json.dumps(
+            {"format": HIERARCHY_MAGIC.decode("ascii"), "vocabularies": [list(v) for v in vocabulary_versions(session)]},
+            sort_keys=True,
+            separators=(",", ":"),
+        ).encode("utf-8")
+        fingerprint = hashlib.sha256(payload).hexdigest()
+        path = Path(cache_dir).expanduser() / f"concept_ancestor-{fingerprint[:16]}{HIERARCHY_SUFFIX}"
+        if path.exists():
+            try:
+                cached = cls.open(path)
+            except (LookupSnapshotError, ValueError, KeyError):
+                # corrupt or foreign file - rebuild it
+                pass
+            else:
+                if cached.fingerprint == fingerprint:
+                    return cached
+        cls.from_database(session, batch_size=batch_size).write(path, fingerprint=fingerprint)
+        return cls.open(path)
+
+    def __reduce__(self):
+        if self.path is not None:
+            return (type(self).open, (self.path,))
+        return (type(self), (self._down, self._up, self._non_standard_ids))
+
+    def __len__(self) -> int:
+        return len(self._down.targets)
+
+    @functools.cached_property
+    def _non_standard(self) -> frozenset[int]:
+        return frozenset(self._non_standard_ids)
+
+    def _expand(
+        self,
+        adjacency: _Adjacency,
+        concept_ids: Iterable[int],
+        include_non_standard: bool,
+        min_separation: int,
+        max_separation: int | None,
+    ) -> list[int]:
+        found: set[int] = set()
+        unfiltered = min_separation <= 0 and max_separation is None
+        for concept_id in concept_ids:
+            start, end = adjacency.row(concept_id)
+            if unfiltered:
+                found.update(adjacency.targets[start:end])
+                continue
+            levels = adjacency.min_levels
+            for i in range(start, end):
+                level = levels[i]
+                if level >= min_separation and (max_separation is None or level <= max_separation):
+                    found.add(adjacency.targets[i])
+        if not include_non_standard and self._non_standard_ids:
+            found -= self._non_standard
+        return sorted(found)
+
+    def descendants(
+        self,
+        parents: Iterable[int],
+        *,
+        include_non_standard: bool = False,
+        min_separation: int = 0,
+        max_separation: int | None = None,
+    ) -> list[int]:
+        """Return the sorted union of the descendants of every concept in ``parents``."""
+        return self._expand(self._down, parents, include_non_standard, min_separation, max_separation)
+
+    def ancestors(
+        self,
+        concepts: Iterable[int],
+        *,
+        include_non_standard: bool = False,
+        min_separation: int = 0,
+        max_separation: int | None = None,
+    ) -> list[int]:
+        """Return the sorted union of the ancestors of every concept in ``concepts``."""
+        return self._expand(self._up, concepts, include_non_standard, min_separation, max_separation)
+
+    def is_descendant_of(self, concept_id: int, parents: Iterable[int]) -> bool:
+        """True if ``concept_id`` descends from (or, via its self-link, is) any of ``parents``."""
+        return any(self._up.find(concept_id, parent) is not None for parent in parents)
+
+    def separation(self, ancestor: int, descendant: int) -> tuple[int, int] | None:
+        """Return (min, max) levels of separation for the pair, or None if unrelated."""
+        i = self._down.find(ancestor, descendant)
+        if i is None:
+            return None
+        return self._down.min_levels[i], self._down.max_levels[i]
+
+    def __repr__(self) -> str:
+        source = f" path={str(self.path)!r}" if self.path is not None else ""
+        return (
+            f"<ConceptHierarchy pairs={len(self)} "
+            f"ancestors={len(self._down.nodes)} "
+            f"descendants={len(self._up.nodes)}{source}>"
+        )
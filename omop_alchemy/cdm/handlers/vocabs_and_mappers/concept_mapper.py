@@ -0,0 +1,294 @@
+import threading
+from collections.abc import Iterable, Iterator, Sequence
+from dataclasses import dataclass
+from typing import Any
+
+import sqlalchemy as sa
+import sqlalchemy.orm as so
+
+from ...model.vocabulary import (
+    Concept,
+    Concept_Relationship,
+    Source_To_Concept_Map,
+    normalised_flag_expr,
+)
+from ...query import id_in
+
+"""
+Set-wise source-to-standard concept mapping.
+
+``ConceptMapper`` follows ``concept_relationship`` ("Maps to", and optionally
+"Maps to value") and ``source_to_concept_map`` for whole batches of source
+codes or source concept ids: each chunk of inputs is sent as an inline table
+and resolved by one query, instead of one query per code. Mapping tables for
+frequently used vocabularies can be preloaded into memory, after which codes
+from those vocabularies are mapped without touching the database.
+"""
+
+MAPS_TO = "Maps to"
+MAPS_TO_VALUE = "Maps to value"
+
+SourceCode = tuple[str, str]  # (vocabulary_id, concept_code)
+# a key column of a mapping select: a mapped attribute or a CTE column
+_KeyColumn = so.InstrumentedAttribute[Any] | sa.ColumnElement[Any]
+
+
+@dataclass(frozen=True)
+class SourceMapping:
+    """
+    Standard concepts a single source code or concept maps to.
+
+    Attributes
+    ----------
+    targets:
+        Concepts reached via "Maps to" or ``source_to_concept_map``, ascending.
+        OMOP allows more than one (e.g. combination diagnoses).
+    value_targets:
+        Concepts reached via "Maps to value", ascending; typically used as
+        ``value_as_concept_id``.
+    """
+    targets: tuple[int, ...] = ()
+    value_targets: tuple[int, ...] = ()
+
+    @property
+    def target(self) -> int | None:
+        """The single mapped concept, or None if unmapped or one-to-many."""
+        return self.targets[0] if len(self.targets) == 1 else None
+
+    def merge(self, other: "SourceMapping") -> "SourceMapping":
+        return SourceMapping(
+            targets=tuple(sorted({*self.targets, *other.targets})),
+            value_targets=tuple(sorted({*self.value_targets, *other.value_targets})),
+        )
+
+
+def _collect(rows: Iterable[Sequence[Any]], n_key: int) -> dict:
+    """Group (key..., target, relationship_id) rows into SourceMappings."""
+    targets: dict = {}
+    values: dict = {}
+    for row in rows:
+        key = tuple(row[:n_key]) if n_key > 1 else row[0]
+        target, relationship = int(row[n_key]), row[n_key + 1]
+        bucket = values if relationship == MAPS_TO_VALUE else targets
+        bucket.setdefault(key, set()).add(target)
+    return {
+        key: SourceMapping(
+            targets=tuple(sorted(targets.get(key, ()))),
+            value_targets=tuple(sorted(values.get(key, ()))),
+        )
+        for key in targets.keys() | values.keys()
+    }
+
+
+class ConceptMapper:
+    """
+    Bulk mapper from source codes / source concept ids to standard concepts.
+
+    Parameters
+    ----------
+    relationships:
+        ``concept_relationship.relationship_id`` values to follow. "Maps to
+        value" targets are reported separately in ``SourceMapping.value_targets``.
+    use_source_to_concept_map:
+        Also consult ``source_to_concept_map`` (site-specific mappings); its
+        targets are merged with those from ``concept_relationship``.
+    valid_only:
+        Ignore mapping rows with an ``invalid_reason``.
+    chunk_size:
+        Maximum number of inputs resolved per query.
+
+    Examples
+    --------
+    >>> mapper = ConceptMapper()
+    >>> mapper.preload(session, ["ICD10CM"])
+    >>> mapper.map_codes(session, [("ICD10CM", "E11.9"), ("ICD9CM", "250.00")])
+    {('ICD10CM', 'E11.9'): SourceMapping(targets=(201826,), value_targets=()), ...}
+    """
+
+    def __init__(
+        self,
+        *,
+        relationships: Iterable[str] = (MAPS_TO, MAPS_TO_VALUE),
+        use_source_to_concept_map: bool = True,
+        valid_only: bool = True,
+        chunk_size: int = 10_000,
+    ):
+        self.relationships = tuple(relationships)
+        self.use_source_to_concept_map = use_source_to_concept_map
+        self.valid_only = valid_only
+        self.chunk_size = chunk_size
+        self._codes: dict[str, dict[str, SourceMapping]] = {}
+        self._concepts: dict[int, SourceMapping] = {}
+        self._lock = threading.Lock()
+
+    def _relationship_select(self, *keys: _KeyColumn) -> sa.Select:
+        q = (
+            sa.select(*keys, Concept_Relationship.concept_id_2, Concept_Relationship.relationship_id)
+            .where(Concept_Relationship.relationship_id.in_(self.relationships))
+        )
+        if self.valid_only:
+            q = q.where(normalised_flag_expr(Concept_Relationship.invalid_reason).is_(None))
+        return q
+
+    def _stcm_select(self, *keys: _KeyColumn) -> sa.Select:
+        q = sa.select(
+            *keys,
+            Source_To_Concept_Map.target_concept_id,
+            sa.literal(MAPS_TO).label("relationship_id"),
+        )
+        if self.valid_only:
+            q = q.where(normalised_flag_expr(Source_To_Concept_Map.invalid_reason).is_(None))
+        return q
+
+    def _code_rows(self, session: so.Session, codes: list[SourceCode]) -> Iterator[sa.Row[Any]]:
+        source = (
+            sa.values(
+                sa.column("vocabulary_id", sa.String),
+                sa.column("concept_code", sa.String),
+                name="source_codes",
+            )
+            .data(codes)
+            .cte("source_codes")
+        )
+        q: sa.Select | sa.CompoundSelect = (
+            self._relationship_select(source.c.vocabulary_id, source.c.concept_code)
+            .select_from(source)
+            .join(
+                Concept,
+                sa.and_(
+                    Concept.vocabulary_id == source.c.vocabulary_id,
+                    Concept.concept_code == source.c.concept_code,
+                ),
+            )
+            .join(Concept_Relationship, Concept_Relationship.concept_id_1 == Concept.concept_id)
+        )
+        if self.use_source_to_concept_map:
+            q = sa.union_all(
+                q,
+                self._stcm_select(source.c.vocabulary_id, source.c.concept_code)
+                .select_from(source)
+                .join(
+                    Source_To_Concept_Map,
+                    sa.and_(
+                        Source_To_Concept_Map.source_vocabulary_id == source.c.vocabulary_id,
+                        Source_To_Concept_Map.source_code == source.c.concept_code,
+                    ),
+                ),
+            )
+        return iter(session.execute(q))
+
+    def _concept_rows(self, session: so.Session, concept_ids: list[int]) -> Iterator[sa.Row[Any]]:
+        q: sa.Select | sa.CompoundSelect = self._relationship_select(Concept_Relationship.concept_id_1).where(
+            id_in(Concept_Relationship.concept_id_1, concept_ids)
+        )
+        if self.use_source_to_concept_map:
+            q = sa.union_all(
+                q,
+                self._stcm_select(Source_To_Concept_Map.source_concept_id).where(
+                    id_in(Source_To_Concept_Map.source_concept_id, concept_ids)
+                ),
+            )
+        return iter(session.execute(q))
+
+    def map_codes(self, session: so.Session, codes: Iterable[SourceCode]) -> dict[SourceCode, SourceMapping]:
+        """
+        Map ``(vocabulary_id, concept_code)`` pairs to standard concepts.
+
+        Codes from preloaded vocabularies are answered from memory; the rest
+        are resolved in one query per ``chunk_size`` codes. Unmapped codes
+        are absent from the result.
+        """
+        result: dict[SourceCode, SourceMapping] = {}
+        pending: list[SourceCode] = []
+        for vocabulary_id, code in dict.fromkeys((str(v), str(c)) for v, c in codes):
+            table = self._codes.get(vocabulary_id)
+            if table is None:
+                pending.append((vocabulary_id, code))
+            elif code in table:
+                result[(vocabulary_id, code)] = table[code]
+
+        for start in range(0, len(pending), self.chunk_size):
+            result.update(_collect(self._code_rows(session, pending[start : start + self.chunk_size]), 2))
+        return result
+
+    def map_concept_ids(self, session: so.Session, concept_ids: Iterable[int]) -> dict[int, SourceMapping]:
+        """
+        Map source concept ids to standard concepts.
+
+        Ids mapped in a preloaded vocabulary are answered from memory; the rest
+        are resolved in one query per ``chunk_size`` ids. Unmapped ids are
+        absent from the result.
+        """
+        result: dict[int, SourceMapping] = {}
+        pending: list[int] = []
+        for concept_id in dict.fromkeys(int(c) for c in concept_ids):
+            mapping = self._concepts.get(concept_id)
+            if mapping is not None:
+                result[concept_id] = mapping
+            elif concept_id:
+                pending.append(concept_id)
+
+        for start in range(0, len(pending), self.chunk_size):
+            result.update(_collect(self._concept_rows(session, pending[start : start + self.chunk_size]), 1))
+        return result
+
+    def preload(self, session: so.Session, vocabulary_ids: Iterable[str]) -> int:
+        """
+        Load the complete mapping table of ``vocabulary_ids`` into memory.
+
+        Afterwards ``map_codes`` answers every code of those vocabularies
+        (mapped or not) without a query, and ``map_concept_ids`` answers their
+        mapped source concepts. Returns the number of mapped codes loaded.
+        """
+        vocabularies = sorted(set(vocabulary_ids) - self._codes.keys())
+        if not vocabularies:
+            return 0
+
+        rel = (
+            self._relationship_select(Concept.vocabulary_id, Concept.concept_code, Concept.concept_id)
+            .select_from(Concept_Relationship)
+            .join(Concept, Concept.concept_id == Concept_Relationship.concept_id_1)
+            .where(Concept.vocabulary_id.in_(vocabularies))
+        )
+        q: sa.Select | sa.CompoundSelect = rel
+        if self.use_source_to_concept_map:
+            q = sa.union_all(
+                rel,
+                self._stcm_select(
+                    Source_To_Concept_Map.source_vocabulary_id,
+                    Source_To_Concept_Map.source_code,
+                    Source_To_Concept_Map.source_concept_id,
+                ).where(Source_To_Concept_Map.source_vocabulary_id.in_(vocabularies)),
+            )
+        rows = session.execute(q).all()
+
+        by_code = _collect(((v, c, t, r) for v, c, _, t, r in rows), 2)
+        by_concept = _collect(((cid, t, r) for _, _, cid, t, r in rows if cid), 1)
+        codes: dict[str, dict[str, SourceMapping]] = {v: {} for v in vocabularies}
+        for (vocabulary_id, code), mapping in by_code.items():
+            codes[vocabulary_id][code] = mapping
+
+        with self._lock:
+            for concept_id, mapping in by_concept.items():
+                existing = self._concepts.get(concept_id)
+                self._concepts[concept_id] = existing.merge(mapping) if existing else mapping
+            self._codes.update(codes)
+        return len(by_code)
+
+    @property
+    def preloaded(self) -> frozenset[str]:
+        """Vocabularies whose mapping tables are held in memory."""
+        return frozenset(self._codes)
+
+    def clear(self) -> None:
+        """Drop all preloaded mapping tables."""
+        with self._lock:
+            self._codes.clear()
+            self._concepts.clear()
+
+    def __repr__(self) -> str:
+        return (
+            f"<ConceptMapper relationships={list(self.relationships)} "
+            f"preloaded={sorted(self._codes)} "
+            f"codes={sum(len(t) for t in self._codes.values())}>"
+        )
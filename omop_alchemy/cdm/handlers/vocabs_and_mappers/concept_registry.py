@@ -1,8 +1,66 @@
-from typing import Callable
+import asyncio
+import os
+import shutil
+import tempfile
+import threading
+import time
+import weakref
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass
+from datetime import date
+from pathlib import Path
+from typing import Callable, Iterable, Mapping
 import sqlalchemy as sa
 import sqlalchemy.orm as so
 
-from .vocab_handlers import ConceptResolver
+from .concept_hierarchy import ConceptHierarchy
+from .vocab_handlers import ConceptResolver, LookupSpec, Normaliser, OMOPConceptSource
+from .lookup_snapshot import (
+    SNAPSHOT_SUFFIX,
+    LookupSnapshotCache,
+    _safe_stem,
+    open_lookup_snapshot,
+    spec_fingerprint,
+    vocabulary_versions,
+    write_lookup_snapshot,
+)
+
+@dataclass(frozen=True)
+class ResolverWarmResult:
+    """
+    Outcome of warming one resolver via ``ConceptResolverRegistry.warm``.
+
+    ``duration_seconds`` is the wall time this call spent obtaining the
+    resolver (near zero if it was already cached). ``keys`` and ``concepts``
+    describe the size of its LookupIndex; both are 0 when the build failed,
+    in which case ``error`` holds the exception message.
+    """
+    name: str
+    duration_seconds: float
+    keys: int = 0
+    concepts: int = 0
+    already_built: bool = False
+    error: str | None = None
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+
+@dataclass(frozen=True)
+class ResolverRefreshResult:
+    """
+    Outcome of refreshing one resolver via ``ConceptResolverRegistry.refresh``.
+
+    ``upserted`` and ``removed`` count concepts in the applied delta; ``keys``
+    is the size of the refreshed index.
+    """
+    name: str
+    duration_seconds: float
+    upserted: int
+    removed: int
+    keys: int
+
 
 class ConceptResolverRegistry:
     """
@@ -11,14 +69,37 @@ class ConceptResolverRegistry:
     Resolvers are constructed on first access and cached for the lifetime
     of this registry instance. The registry is scoped to a SQLAlchemy Engine,
     ensuring vocab lookups are built once per database.
+
+    If ``snapshot_dir`` is provided, resolvers registered declaratively via
+    ``register_spec`` persist their LookupIndex to disk (see
+    ``LookupSnapshotCache``), so that other processes - and later runs - load
+    the ready index instead of re-querying the vocabulary. Snapshots are
+    rebuilt automatically when the vocabulary version changes.
+
+    For multiprocess ETL, ``share`` exports spec-registered indexes to
+    memory-mapped files and ``attach`` (called in each worker) makes the
+    worker's registry serve those resolvers from the shared files instead of
+    building private copies.
+
+    The registry is safe to share between threads. Builds are single-flight:
+    if several threads ask for the same resolver while it is being built,
+    one thread runs the builder and the others wait for its result. A failed
+    build is reported to every waiter and is not cached, so a later ``get``
+    retries it.
     """
 
-    def __init__(self, engine: sa.Engine):
+    def __init__(self, engine: sa.Engine, *, snapshot_dir: str | Path | None = None):
         self.engine = engine
+        self.snapshots = LookupSnapshotCache(snapshot_dir) if snapshot_dir is not None else None
         self._cache: dict[str, ConceptResolver] = {}
         self._builders: dict[str, Callable[[so.Session], ConceptResolver]] = {}
+        self._inflight: dict[str, Future[ConceptResolver]] = {}
+        self._specs: dict[str, LookupSpec] = {}
+        self._shared: dict[str, Path] = {}
+        self._hierarchy: ConceptHierarchy | None = None
+        self._lock = threading.Lock()
+        self._hierarchy_lock = threading.Lock()
 
-    
     def register(self, name: str, builder: Callable[[so.Session], ConceptResolver]) -> None:
         """
         Register a named resolver builder.
@@ -26,36 +107,324 @@ class ConceptResolverRegistry:
         This does not construct the resolver immediately; it only records
         how to build it when first requested.
         """
-        if name in self._builders:
-            raise KeyError(f"Resolver '{name}' is already registered")
+        with self._lock:
+            if name in self._builders:
+                raise KeyError(f"Resolver '{name}' is already registered")
+
+            self._builders[name] = builder
+
+    def register_spec(
+        self,
+        name: str,
+        spec: LookupSpec,
+        *,
+        runtime_normalizer: Normaliser | None = None,
+        corrections: list[Callable[[str], str]] | None = None,
+        cache_size: int | None = None,
+        fuzzy_threshold: float | None = None,
+    ) -> None:
+        """
+        Register a resolver declared by a LookupSpec.
+
+        Unlike ``register``, the registry knows what the resolver is built
+        from, so the index can be served from the snapshot cache when one
+        is configured.
+        """
+        def _build(session: so.Session) -> ConceptResolver:
+            shared = self._shared.get(name)
+            if shared is not None:
+                index = open_lookup_snapshot(shared)
+            elif self.snapshots is not None:
+                index = self.snapshots.get_or_build(session, spec)
+            else:
+                index = OMOPConceptSource.build_lookup(session, spec)
+            return ConceptResolver(
+                index,
+                normalizer=runtime_normalizer or spec.normalizer,
+                corrections=corrections,
+                cache_size=cache_size,
+                fuzzy_threshold=fuzzy_threshold,
+            )
 
-        self._builders[name] = builder
+        self.register(name, _build)
+        self._specs[name] = spec
 
     def get(self, name: str) -> ConceptResolver:
         """
         Return a cached resolver by name, building it lazily if required.
 
-        The resolver must have been registered via ``register``.
+        The resolver must have been registered via ``register``. Concurrent
+        calls for a resolver that is still being built wait for that build
+        rather than starting their own.
         """
-        if name in self._cache:
-            return self._cache[name]
+        resolver = self._cache.get(name)
+        if resolver is not None:
+            return resolver
 
-        if name not in self._builders:
-            raise KeyError(
-                f"No resolver named '{name}' is registered. "
-                f"Available resolvers: {sorted(self._builders)}"
+        with self._lock:
+            resolver = self._cache.get(name)
+            if resolver is not None:
+                return resolver
+
+            if name not in self._builders:
+                raise KeyError(
+                    f"No resolver named '{name}' is registered. "
+                    f"Available resolvers: {sorted(self._builders)}"
+                )
+
+            future = self._inflight.get(name)
+            if future is None:
+                future = self._inflight[name] = Future()
+                builder = self._builders[name]
+            else:
+                builder = None
+
+        if builder is None:
+            return future.result()
+
+        try:
+            with so.Session(self.engine) as session:
+                resolver = builder(session)
+        except BaseException as exc:
+            with self._lock:
+                del self._inflight[name]
+            future.set_exception(exc)
+            raise
+
+        with self._lock:
+            self._cache[name] = resolver
+            del self._inflight[name]
+        future.set_result(resolver)
+        return resolver
+
+    async def aget(self, name: str) -> ConceptResolver:
+        """
+        Async variant of ``get``.
+
+        Cached resolvers are returned immediately; otherwise the build (or the
+        wait on another caller's in-flight build) runs in a worker thread so
+        the event loop is not blocked.
+        """
+        resolver = self._cache.get(name)
+        if resolver is not None:
+            return resolver
+        return await asyncio.to_thread(self.get, name)
+
+    def warm(
+        self,
+        names: Iterable[str] | None = None,
+        *,
+        max_workers: int | None = None,
+    ) -> list[ResolverWarmResult]:
+        """
+        Build registered resolvers concurrently ahead of first use.
+
+        Each build runs ``get`` on a worker thread with its own Session from
+        the registry's engine, so single-flight and caching behave exactly as
+        for lazy access. A failing build does not stop the others; its error
+        is reported in the corresponding result.
+
+        Parameters
+        ----------
+        names:
+            Resolvers to build. Defaults to every registered resolver.
+        max_workers:
+            Thread pool size. Defaults to the number of resolvers, capped at the
+            engine's connection pool size where one is configured.
+        """
+        targets = list(self._builders) if names is None else list(names)
+        if not targets:
+            return []
+        for name in targets:
+            if name not in self._builders:
+                raise KeyError(
+                    f"No resolver named '{name}' is registered. "
+                    f"Available resolvers: {sorted(self._builders)}"
+                )
+
+        if max_workers is None:
+            pool_size = getattr(self.engine.pool, "size", None)
+            max_workers = min(len(targets), pool_size()) if callable(pool_size) else len(targets)
+
+        def _warm(name: str) -> ResolverWarmResult:
+            already_built = name in self._cache
+            start = time.perf_counter()
+            try:
+                resolver = self.get(name)
+            except Exception as exc:
+                return ResolverWarmResult(
+                    name=name,
+                    duration_seconds=time.perf_counter() - start,
+                    already_built=already_built,
+                    error=str(exc) or type(exc).__name__,
+                )
+            return ResolverWarmResult(
+                name=name,
+                duration_seconds=time.perf_counter() - start,
+                keys=len(resolver.index.mapping),
+                concepts=len(resolver.all_concepts),
+                already_built=already_built,
             )
 
-        builder = self._builders[name]
+        with ThreadPoolExecutor(max_workers=max(1, max_workers), thread_name_prefix="resolver-warm") as pool:
+            return list(pool.map(_warm, targets))
+
+    def refresh(
+        self,
+        names: Iterable[str] | None = None,
+        *,
+        since: date,
+    ) -> list[ResolverRefreshResult]:
+        """
+        Bring built resolvers up to date with a vocabulary refresh, in place.
+
+        For each resolver the concepts changed since ``since`` are read (see
+        ``OMOPConceptSource.lookup_delta``), applied to its current index, and
+        the resolver is switched to the new index - existing references to the
+        resolver keep working and see the new data. Specs whose
+        ``collision_policy`` is not ``"last_wins"`` are rebuilt from scratch
+        instead, since ``apply_delta`` cannot rank a changed concept against
+        the unchanged ones sharing its keys. If a snapshot directory is
+        configured, rebuilt indexes are also stored under the new vocabulary
+        fingerprint so other processes pick them up; delta-applied indexes are
+        not, since a snapshot must match what ``build_lookup`` would produce.
+
+        Resolvers that have not been built yet are skipped: their first ``get``
+        builds from the current vocabulary anyway.
+
+        Parameters
+        ----------
+        names:
+            Resolvers to refresh. Defaults to every built, spec-registered resolver.
+        since:
+            Date of the previous vocabulary release (or of the last refresh).
+        """
+        if names is None:
+            targets = [name for name in self._specs if name in self._cache]
+        else:
+            targets = list(names)
+            for name in targets:
+                self._require_spec(name)
 
+        results: list[ResolverRefreshResult] = []
         with so.Session(self.engine) as session:
-            resolver = builder(session)
+            versions = vocabulary_versions(session) if self.snapshots is not None else ()
+            for name in targets:
+                resolver = self._cache.get(name)
+                if resolver is None:
+                    continue
+                spec = self._specs[name]
+                start = time.perf_counter()
+                delta = OMOPConceptSource.lookup_delta(session, spec, since=since)
+                if spec.collision_policy == "last_wins":
+                    index = resolver.index.apply_delta(delta)
+                else:
+                    # other policies depend on every claimant of a key, not just the changed ones
+                    index = OMOPConceptSource.build_lookup(session, spec)
+                    if self.snapshots is not None:
+                        self.snapshots.store(spec, spec_fingerprint(spec, versions), index)
+                resolver.replace_index(index)
+                results.append(
+                    ResolverRefreshResult(
+                        name=name,
+                        duration_seconds=time.perf_counter() - start,
+                        upserted=len(delta.upserts),
+                        removed=len(delta.removed),
+                        keys=len(index.mapping),
+                    )
+                )
+        return results
 
-        self._cache[name] = resolver
-        return resolver
+    def share(
+        self,
+        names: Iterable[str] | None = None,
+        *,
+        directory: str | Path | None = None,
+    ) -> dict[str, Path]:
+        """
+        Export resolver indexes for zero-copy use by worker processes.
+
+        Each resolver is built (or taken from the cache) and its LookupIndex
+        written in snapshot format. The returned ``{name: path}`` mapping is
+        cheap to pickle; pass it to ``attach`` in each worker, typically from
+        a pool initialiser.
+
+        Only resolvers registered with ``register_spec`` can be shared, since
+        workers must be able to reconstruct the rest of the resolver.
+
+        Parameters
+        ----------
+        names:
+            Resolvers to share. Defaults to every spec-registered resolver.
+        directory:
+            Where to write the files. Defaults to a ``shared`` folder under the
+            snapshot directory, or otherwise a temporary directory (in
+            ``/dev/shm`` where available) removed when this registry is
+            garbage collected. Workers that have already attached keep working
+            after the files are removed.
+        """
+        targets = list(self._specs) if names is None else list(names)
+        for name in targets:
+            self._require_spec(name)
+
+        if directory is None:
+            if self.snapshots is not None:
+                directory = self.snapshots.directory / "shared"
+            else:
+                shm = "/dev/shm" if os.path.isdir("/dev/shm") else None
+                directory = tempfile.mkdtemp(prefix="omop_alchemy_lookups_", dir=shm)
+                weakref.finalize(self, shutil.rmtree, directory, True)
+
+        return {
+            name: write_lookup_snapshot(
+                self.get(name).index,
+                Path(directory) / f"{_safe_stem(name)}{SNAPSHOT_SUFFIX}",
+            )
+            for name in targets
+        }
+
+    def attach(self, shared: Mapping[str, str | Path]) -> None:
+        """
+        Serve resolvers from indexes exported by ``share``.
+
+        The named resolvers must be registered here with ``register_spec``
+        (normally by running the same registration code as the parent). Their
+        next ``get`` memory-maps the shared file - no database access and no
+        per-process copy of the keys - and applies this registry's runtime
+        normaliser, corrections and cache settings.
+        """
+        for name in shared:
+            self._require_spec(name)
+        with self._lock:
+            for name, path in shared.items():
+                self._shared[name] = Path(path)
+                self._cache.pop(name, None)
+
+    def hierarchy(self) -> ConceptHierarchy:
+        """
+        Return the in-process ``concept_ancestor`` closure, loading it on first use.
+
+        The closure is read once per registry; with a ``snapshot_dir`` it is
+        cached there as a memory-mapped file (see ``ConceptHierarchy.load``),
+        so later runs and other processes skip the database entirely.
+        """
+        if self._hierarchy is None:
+            with self._hierarchy_lock:
+                if self._hierarchy is None:
+                    cache_dir = self.snapshots.directory if self.snapshots is not None else None
+                    with so.Session(self.engine) as session:
+                        self._hierarchy = ConceptHierarchy.load(session, cache_dir=cache_dir)
+        return self._hierarchy
+
+    def _require_spec(self, name: str) -> None:
+        if name not in self._specs:
+            raise KeyError(
+                f"Resolver '{name}' was not registered with register_spec. "
+                f"Spec-registered resolvers: {sorted(self._specs)}"
+            )
 
     def __getitem__(self, name: str) -> ConceptResolver:
         return self.get(name)
 
     def __contains__(self, name: str) -> bool:
-        return name in self._builders
\ No newline at end of file
+        return name in self._builders
@@ -1,28 +1,29 @@
 import sqlalchemy as sa
 import sqlalchemy.orm as so
 from ...model.vocabulary.concept import Concept
+from .concept_cache import ConceptAttributeCache, concept_attribute_cache
 
 
 class OMOPConceptResolver:
-    def __init__(self, session):
+    """
+    Answers standardness questions about concept ids.
+
+    Lookups go through a ``ConceptAttributeCache`` - by default the
+    process-wide cache for the session's engine - so ids already seen in this
+    process are not queried again.
+    """
+
+    def __init__(self, session, *, cache: ConceptAttributeCache | None = None):
         self.session = session
+        self.cache = cache if cache is not None else concept_attribute_cache(session.get_bind())
 
     def are_standard(self, concept_ids):
         if not concept_ids:
             return {}
 
-        rows = (
-            self.session.query(
-                Concept.concept_id,
-                Concept.standard_concept,
-            )
-            .filter(Concept.concept_id.in_(set(concept_ids)))
-            .all()
-        )
-
         return {
-            cid: (std == "S")
-            for cid, std in rows
+            cid: (attributes.standard_concept == "S")
+            for cid, attributes in self.cache.get_many(self.session, concept_ids).items()
         }
 
 
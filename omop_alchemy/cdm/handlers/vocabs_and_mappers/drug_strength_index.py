@@ -0,0 +1,189 @@
+from typing import TYPE_CHECKING, Iterable
+import sqlalchemy as sa
+import sqlalchemy.orm as so
+
+from ...model.vocabulary import Drug_Strength, normalised_flag_expr
+from ...query import id_in
+
+if TYPE_CHECKING:
+    import pandas as pd
+
+"""
+Columnar, in-memory view of ``drug_strength`` for dose calculations.
+
+``DrugStrengthIndex`` reads the table once and keeps it as a DataFrame sorted
+by ``(drug_concept_id, ingredient_concept_id)``. Because the rows of each drug
+are contiguous, a batch of exposures is matched with two binary searches over
+the sorted drug ids (``numpy.searchsorted``) and the strength columns are
+gathered with a single ``take`` per column - no per-row queries and no hash
+join.
+"""
+
+STRENGTH_COLUMNS = (
+    "ingredient_concept_id",
+    "amount_value",
+    "amount_unit_concept_id",
+    "numerator_value",
+    "numerator_unit_concept_id",
+    "denominator_value",
+    "denominator_unit_concept_id",
+    "box_size",
+)
+
+_INTEGER_COLUMNS = frozenset(
+    {
+        "ingredient_concept_id",
+        "amount_unit_concept_id",
+        "numerator_unit_concept_id",
+        "denominator_unit_concept_id",
+        "box_size",
+    }
+)
+
+
+class DrugStrengthIndex:
+    """
+    Preloaded ingredient and strength lookup keyed by ``drug_concept_id``.
+
+    Build with ``from_database``; then use ``attach`` to add ingredient and
+    strength columns to a batch of drug exposures, or ``lookup`` for a single
+    drug. Missing values are ``pd.NA`` (nullable ``Int64``/``Float64`` columns).
+
+    Examples
+    --------
+    >>> strengths = DrugStrengthIndex.from_database(session)
+    >>> enriched = strengths.attach(exposures_df)
+    >>> enriched["dose"] = enriched["quantity"] * enriched["amount_value"]
+    """
+
+    def __init__(self, frame: "pd.DataFrame"):
+        frame = frame.sort_values(["drug_concept_id", "ingredient_concept_id"], kind="stable", ignore_index=True)
+        self.frame = frame
+        self._drug_ids = frame["drug_concept_id"].to_numpy(dtype="int64")
+
+    @classmethod
+    def from_database(
+        cls,
+        session: so.Session,
+        *,
+        drug_concept_ids: Iterable[int] | None = None,
+        valid_only: bool = True,
+        batch_size: int = 100_000,
+    ) -> "DrugStrengthIndex":
+        """
+        Load ``drug_strength`` in one streamed scan.
+
+        Parameters
+        ----------
+        drug_concept_ids:
+            Restrict the index to these drugs (e.g. the distinct drugs of an
+            ETL batch). Defaults to the whole table.
+        valid_only:
+            Skip rows with an ``invalid_reason``.
+        """
+        import pandas as pd
+
+        columns = ("drug_concept_id", *STRENGTH_COLUMNS)
+        q = sa.select(*(getattr(Drug_Strength, c) for c in columns))
+        if drug_concept_ids is not None:
+            q = q.where(id_in(Drug_Strength.drug_concept_id, drug_concept_ids))
+        if valid_only:
+            q = q.where(normalised_flag_expr(Drug_Strength.invalid_reason).is_(None))
+        q = q.order_by(Drug_Strength.drug_concept_id, Drug_Strength.ingredient_concept_id)
+
+        values: list[list] = [[] for _ in columns]
+        result = session.execute(q.execution_options(yield_per=batch_size))
+        for partition in result.partitions():
+            for row in partition:
+                for bucket, value in zip(values, row):
+                    bucket.append(value)
+
+        frame = pd.DataFrame(
+            {
+                name: pd.array(
+                    data,
+                    dtype="Int64" if name in _INTEGER_COLUMNS or name == "drug_concept_id" else "Float64",
+                )
+                for name, data in zip(columns, values)
+            }
+        )
+        return cls(frame)
+
+    def __len__(self) -> int:
+        return len(self.frame)
+
+    def __contains__(self, drug_concept_id: object) -> bool:
+        import numpy as np
+
+        if not isinstance(drug_concept_id, (int, np.integer)):
+            return False
+        i = np.searchsorted(self._drug_ids, drug_concept_id)
+        return bool(i < len(self._drug_ids) and self._drug_ids[i] == drug_concept_id)
+
+    @property
+    def drug_count(self) -> int:
+        import numpy as np
+
+        return len(np.unique(self._drug_ids))
+
+    def lookup(self, drug_concept_id: int) -> "pd.DataFrame":
+        """Return the ingredient/strength rows of one drug (empty if unknown)."""
+        import numpy as np
+
+        start = np.searchsorted(self._drug_ids, drug_concept_id, side="left")
+        end = np.searchsorted(self._drug_ids, drug_concept_id, side="right")
+        return self.frame.iloc[start:end].reset_index(drop=True)
+
+    def attach(
+        self,
+        exposures: "pd.DataFrame",
+        *,
+        drug_column: str = "drug_concept_id",
+        keep_unmatched: bool = True,
+    ) -> "pd.DataFrame":
+        """
+        Add ingredient and strength columns to a batch of drug exposures.
+
+        Each exposure is repeated once per ingredient of its drug, so a
+        combination product yields one row per ingredient; the original index
+        labels are kept so results can be grouped back per exposure.
+
+        Parameters
+        ----------
+        exposures:
+            DataFrame with a drug concept column.
+        drug_column:
+            Name of that column.
+        keep_unmatched:
+            Keep exposures whose drug has no strength rows, with the strength
+            columns set to ``pd.NA``. If False they are dropped.
+
+        Raises
+        ------
+        ValueError
+            If ``exposures`` already has a column named like a strength column.
+        """
+        import numpy as np
+        import pandas as pd
+
+        clashes = [c for c in STRENGTH_COLUMNS if c in exposures.columns]
+        if clashes:
+            raise ValueError(f"exposures already has strength columns: {clashes}")
+
+        drugs = pd.to_numeric(exposures[drug_column]).astype("Int64").to_numpy(dtype="int64", na_value=-1)
+        left = np.searchsorted(self._drug_ids, drugs, side="left")
+        counts = np.searchsorted(self._drug_ids, drugs, side="right") - left
+        repeats = np.maximum(counts, 1) if keep_unmatched else counts
+
+        rows = np.repeat(np.arange(len(exposures)), repeats)
+        # position of each output row within its exposure's run of ingredients
+        within = np.arange(len(rows)) - np.repeat(np.cumsum(repeats) - repeats, repeats)
+        positions = np.where(np.repeat(counts > 0, repeats), np.repeat(left, repeats) + within, -1)
+
+        out = exposures.iloc[rows].copy()
+        for name in STRENGTH_COLUMNS:
+            out[name] = self.frame[name].array.take(positions, allow_fill=True)
+        return out
+
+    def __repr__(self) -> str:
+        return f"<DrugStrengthIndex rows={len(self)} drugs={self.drug_count}>"
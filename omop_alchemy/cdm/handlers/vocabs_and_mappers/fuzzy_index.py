@@ -0,0 +1,222 @@
+"""
+Approximate string matching over LookupIndex keys.
+
+``FuzzyIndex`` implements the symmetric-delete scheme popularised by SymSpell:
+at build time every key prefix is expanded into all strings reachable by up
+to ``max_edit_distance`` deletions, and each of those deletes points back to
+the keys that produced it. At query time the same expansion is applied to
+the query prefix, so candidate keys are found with a handful of dict probes
+instead of a scan over the whole index. Candidates are then verified with a
+bounded optimal-string-alignment (Damerau-Levenshtein) distance.
+
+Restricting the expansion to a fixed-length prefix keeps the delete table
+small on indexes with hundreds of thousands of keys, but clinical terms share
+long stems ("malignant neoplasm of ...", "fracture of ..."), so a prefix alone
+admits thousands of candidates per query. The same expansion is therefore
+applied to every key's suffix as well: a key within ``max_edit_distance`` of
+the query matches on both ends, and only keys whose prefix *and* suffix are
+reachable are verified, after a length check.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterable
+from dataclasses import dataclass
+
+
+@dataclass(frozen=True)
+class FuzzyMatch:
+    """
+    Best approximate match for a query string.
+
+    ``similarity`` is ``1 - distance / max(len(query), len(key))`` and is
+    therefore 1.0 only for exact matches.
+    """
+    key: str
+    distance: int
+    similarity: float
+
+
+def _deletes(term: str, max_distance: int) -> set[str]:
+    out = {term}
+    frontier = {term}
+    for _ in range(max_distance):
+        frontier = {t[:i] + t[i + 1 :] for t in frontier for i in range(len(t))} - out
+        if not frontier:
+            break
+        out |= frontier
+    return out
+
+
+def bounded_distance(a: str, b: str, max_distance: int) -> int | None:
+    """
+    Optimal string alignment distance between ``a`` and ``b``, or None if it
+    exceeds ``max_distance``.
+
+    Adjacent transpositions count as a single edit. The common prefix and
+    suffix are stripped first (they never change the distance), only the
+    diagonal band of cells within ``max_distance`` is computed, and rows are
+    abandoned as soon as every cell exceeds the bound, so keys sharing a long
+    stem cost little more than their differing middle.
+    """
+    if a == b:
+        return 0
+    la, lb = len(a), len(b)
+    if abs(la - lb) > max_distance:
+        return None
+
+    start = 0
+    while start < la and start < lb and a[start] == b[start]:
+        start += 1
+    while la > start and lb > start and a[la - 1] == b[lb - 1]:
+        la -= 1
+        lb -= 1
+    a, b = a[start:la], b[start:lb]
+    la, lb = la - start, lb - start
+    if not la or not lb:
+        return la or lb
+
+    k = max_distance
+    over = k + 1  # any cell above the bound is as good as infinite
+    prev2: list[int] = []
+    prev = [j if j <= k else over for j in range(lb + 1)]
+    for i in range(1, la + 1):
+        cur = [over] * (lb + 1)
+        cur[0] = i if i <= k else over
+        ca = a[i - 1]
+        row_min = cur[0]
+        for j in range(max(1, i - k), min(lb, i + k) + 1):
+            cb = b[j - 1]
+            v = min(prev[j - 1] + (ca != cb), prev[j] + 1, cur[j - 1] + 1, over)
+            if i > 1 and j > 1 and ca == b[j - 2] and a[i - 2] == cb:
+                v = min(v, prev2[j - 2] + 1)
+            cur[j] = v
+            row_min = min(row_min, v)
+        if row_min > k:
+            return None
+        prev2, prev = prev, cur
+
+    d = prev[lb]
+    return d if d <= k else None
+
+
+class FuzzyIndex:
+    """
+    Symmetric-delete candidate index over a fixed set of keys.
+
+    Parameters
+    ----------
+    keys:
+        Normalised lookup keys (typically ``LookupIndex.mapping`` keys).
+    max_edit_distance:
+        Largest edit distance a match may have. Build cost grows combinatorially
+        with this value; 1 or 2 is appropriate for typo-level noise.
+    prefix_length:
+        Number of leading (and trailing) characters expanded into deletes.
+        Longer affixes give fewer, more precise candidates at the cost of a
+        larger table.
+
+    Examples
+    --------
+    >>> fuzzy = FuzzyIndex(["stage iii", "stage ii"])
+    >>> fuzzy.best_match("stgae iii")
+    FuzzyMatch(key='stage iii', distance=1, similarity=0.888...)
+    """
+
+    def __init__(
+        self,
+        keys: Iterable[str],
+        *,
+        max_edit_distance: int = 2,
+        prefix_length: int = 7,
+    ):
+        if max_edit_distance < 0:
+            raise ValueError("max_edit_distance must be non-negative")
+        if prefix_length <= max_edit_distance:
+            raise ValueError("prefix_length must be greater than max_edit_distance")
+
+        self.max_edit_distance = max_edit_distance
+        self.prefix_length = prefix_length
+        self._keys: list[str] = list(keys)
+
+        # keys sharing an affix (common in clinical vocabularies) share one expansion
+        buckets: dict[str, dict[str, list[int]]] = {}
+        for i, key in enumerate(self._keys):
+            buckets.setdefault(key[:prefix_length], {}).setdefault(key[-prefix_length:], []).append(i)
+        suffixes = {suffix for by_suffix in buckets.values() for suffix in by_suffix}
+
+        self._buckets = buckets
+        self._prefix_deletes = self._expand(buckets)
+        self._suffix_deletes = self._expand(suffixes)
+
+    def _expand(self, affixes: Iterable[str]) -> dict[str, list[str]]:
+        deletes: dict[str, list[str]] = {}
+        for affix in affixes:
+            for d in _deletes(affix, self.max_edit_distance):
+                deletes.setdefault(d, []).append(affix)
+        return deletes
+
+    def _reachable(self, deletes: dict[str, list[str]], affix: str) -> set[str]:
+        found: set[str] = set()
+        for d in _deletes(affix, self.max_edit_distance):
+            hits = deletes.get(d)
+            if hits:
+                found.update(hits)
+        return found
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+    def candidates(self, term: str) -> set[int]:
+        """Return positions of keys that may lie within ``max_edit_distance`` of ``term``."""
+        prefixes = self._reachable(self._prefix_deletes, term[: self.prefix_length])
+        if not prefixes:
+            return set()
+        suffixes = self._reachable(self._suffix_deletes, term[-self.prefix_length :])
+        found: set[int] = set()
+        for prefix in prefixes:
+            by_suffix = self._buckets[prefix]
+            # probe from whichever side is smaller
+            if len(by_suffix) < len(suffixes):
+                for suffix, positions in by_suffix.items():
+                    if suffix in suffixes:
+                        found.update(positions)
+            else:
+                for suffix in suffixes:
+                    positions = by_suffix.get(suffix)
+                    if positions:
+                        found.update(positions)
+        return found
+
+    def best_match(self, term: str, *, threshold: float = 0.0) -> FuzzyMatch | None:
+        """
+        Return the closest key to ``term`` with similarity >= ``threshold``.
+
+        Ties on distance are broken by higher similarity (i.e. longer keys),
+        then lexicographically, so results are deterministic.
+        """
+        if not term:
+            return None
+
+        best: tuple[int, float, str] | None = None
+        bound = self.max_edit_distance
+        n = len(term)
+        for i in self.candidates(term):
+            key = self._keys[i]
+            if abs(len(key) - n) > bound:
+                continue
+            dist = bounded_distance(term, key, bound)
+            if dist is None:
+                continue
+            sim = 1.0 - dist / max(len(term), len(key))
+            rank = (dist, -sim, key)
+            if best is None or rank < (best[0], -best[1], best[2]):
+                best = (dist, sim, key)
+                # nothing closer than an exact match; tighten the bound otherwise
+                if dist == 0:
+                    break
+                bound = dist
+
+        if best is None or best[1] < threshold:
+            return None
+        return FuzzyMatch(key=best[2], distance=best[0], similarity=best[1])
@@ -0,0 +1,471 @@
+from __future__ import annotations
+
+import bisect
+import hashlib
+import json
+import mmap
+import os
+import re
+import struct
+import sys
+from array import array
+from collections.abc import Iterator, Mapping, Sequence
+from collections.abc import Set as AbstractSet
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Literal, TypeVar, overload
+
+import sqlalchemy as sa
+import sqlalchemy.orm as so
+
+from ...model.vocabulary import Vocabulary
+from .vocab_handlers import LookupCollision, LookupIndex, LookupSpec, OMOPConceptSource
+
+"""
+On-disk snapshots of materialised LookupIndex objects.
+
+Building a LookupIndex means scanning ``concept`` (and optionally
+``concept_synonym``), which on a full Athena load costs every worker process
+minutes at startup. A snapshot is a compact binary dump of a built index that
+can be memory-mapped and turned back into a LookupIndex in milliseconds.
+
+Snapshots are keyed by a fingerprint of the LookupSpec *and* the rows of the
+``vocabulary`` table (vocabulary_id + vocabulary_version), so a vocabulary
+refresh invalidates every snapshot automatically.
+
+The same files double as a shared, read-only index for multiprocess workers:
+``open_lookup_snapshot`` memory-maps a snapshot and serves lookups by binary
+search straight from the mapped pages, so every process attached to the file
+shares one physical copy instead of holding its own dict.
+
+File layout (all integers little-endian)::
+
+    magic          8 bytes   b"OALKIX02"
+    header_len     uint32
+    header         JSON      name, unknown, count, concepts, fingerprint,
+                             collisions ([key, concept_id, [candidates]], ...)
+    padding        to an 8-byte boundary
+    concept_ids    int64  * count
+    key_offsets    uint64 * (count + 1)
+    by_concept     uint64 * count, key positions ordered by (concept_id, key)
+    keys           utf-8 blob, keys sorted by their encoded bytes
+"""
+
+_T = TypeVar("_T")
+
+SNAPSHOT_MAGIC = b"OALKIX02"
+SNAPSHOT_SUFFIX = ".oaidx"
+
+_HEADER_LEN = struct.Struct("<I")
+_UNSAFE_FILENAME_CHARS = re.compile(r"[^A-Za-z0-9_.-]+")
+
+
+class LookupSnapshotError(RuntimeError):
+    """Raised when a snapshot file is missing, truncated or in an unknown format."""
+
+
+def _safe_stem(name: str) -> str:
+    return _UNSAFE_FILENAME_CHARS.sub("_", name) or "lookup"
+
+
+def _callable_id(fn: object) -> str:
+    module = getattr(fn, "__module__", None) or ""
+    qualname = getattr(fn, "__qualname__", None) or repr(fn)
+    return f"{module}.{qualname}"
+
+
+def vocabulary_versions(session: so.Session) -> tuple[tuple[str, str | None], ...]:
+    """
+    Return (vocabulary_id, vocabulary_version) pairs for every loaded vocabulary.
+
+    The result is sorted so that it can be hashed deterministically.
+    """
+    rows = session.execute(
+        sa.select(Vocabulary.vocabulary_id, Vocabulary.vocabulary_version)
+        .order_by(Vocabulary.vocabulary_id)
+    ).all()
+    return tuple((str(vid), version) for vid, version in rows)
+
+
+def spec_fingerprint(
+    spec: LookupSpec,
+    versions: tuple[tuple[str, str | None], ...],
+) -> str:
+    """
+    Return a stable hex digest identifying a LookupSpec against a vocabulary release.
+
+    Normalisers are identified by their qualified name, so two distinct lambdas
+    (which share the name ``<lambda>``) cannot be told apart - give normalisers
+    used with snapshots a proper name.
+    """
+    payload = {
+        "format": SNAPSHOT_MAGIC.decode("ascii"),
+        "name": spec.name,
+        "unknown": spec.unknown,
+        "domain_id": spec.domain_id,
+        "concept_class_id": sorted(spec.concept_class_id) if spec.concept_class_id else None,
+        "vocabulary_id": sorted(spec.vocabulary_id) if spec.vocabulary_id else None,
+        "standard_only": spec.standard_only,
+        "code_filter": spec.code_filter,
+        "parents": sorted(spec.parents) if spec.parents else None,
+        "include_non_standard_descendants": spec.include_non_standard_descendants,
+        "include_synonyms": spec.include_synonyms,
+        "normalizer": _callable_id(spec.normalizer),
+        "include": list(spec.include),
+        "collision_policy": spec.collision_policy,
+        "vocabularies": [list(v) for v in versions],
+    }
+    encoded = json.dumps(payload, sort_keys=True, separators=(",", ":")).encode("utf-8")
+    return hashlib.sha256(encoded).hexdigest()
+
+
+def write_lookup_snapshot(
+    index: LookupIndex,
+    path: str | Path,
+    *,
+    fingerprint: str = "",
+) -> Path:
+    """
+    Serialise a LookupIndex to ``path``.
+
+    The file is written to a temporary sibling and atomically renamed into
+    place, so concurrent readers never observe a partially written snapshot.
+    """
+    path = Path(path)
+    encoded = sorted(
+        (key.encode("utf-8"), concept_id)
+        for key, concept_id in index.mapping.items()
+    )
+
+    concept_ids = array("q", (concept_id for _, concept_id in encoded))
+    offsets = array("Q", [0])
+    position = 0
+    for key, _ in encoded:
+        position += len(key)
+        offsets.append(position)
+    by_concept = array("Q", sorted(range(len(encoded)), key=lambda i: (concept_ids[i], i)))
+    distinct = len(set(concept_ids))
+    if sys.byteorder != "little":
+        concept_ids.byteswap()
+        offsets.byteswap()
+        by_concept.byteswap()
+
+    header = json.dumps(
+        {
+            "name": index.name,
+            "unknown": index.unknown,
+            "count": len(encoded),
+            "concepts": distinct,
+            "fingerprint": fingerprint,
+            "collisions": [[c.key, c.concept_id, list(c.candidates)] for c in index.collisions],
+        },
+        separators=(",", ":"),
+    ).encode("utf-8")
+    preamble = len(SNAPSHOT_MAGIC) + _HEADER_LEN.size + len(header)
+    padding = b"\0" * (-preamble % 8)
+
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+    try:
+        with open(tmp_path, "wb") as f:
+            f.write(SNAPSHOT_MAGIC)
+            f.write(_HEADER_LEN.pack(len(header)))
+            f.write(header)
+            f.write(padding)
+            concept_ids.tofile(f)
+            offsets.tofile(f)
+            by_concept.tofile(f)
+            for key, _ in encoded:
+                f.write(key)
+        os.replace(tmp_path, path)
+    finally:
+        tmp_path.unlink(missing_ok=True)
+    return path
+
+
+@dataclass(frozen=True)
+class _Layout:
+    header: dict
+    count: int
+    ids: int
+    offsets: int
+    by_concept: int
+    keys: int
+
+
+def _parse_layout(buf: mmap.mmap, path: Path) -> _Layout:
+    if buf[: len(SNAPSHOT_MAGIC)] != SNAPSHOT_MAGIC:
+        raise LookupSnapshotError(f"{path} is not a lookup snapshot (bad magic)")
+
+    start = len(SNAPSHOT_MAGIC)
+    (header_len,) = _HEADER_LEN.unpack_from(buf, start)
+    start += _HEADER_LEN.size
+    header = json.loads(buf[start : start + header_len].decode("utf-8"))
+    start += header_len
+    start += -start % 8
+
+    count = int(header["count"])
+    offsets = start + 8 * count
+    by_concept = offsets + 8 * (count + 1)
+    keys = by_concept + 8 * count
+    if keys > len(buf):
+        raise LookupSnapshotError(f"{path} is truncated")
+    (blob_len,) = struct.unpack_from("<Q", buf, by_concept - 8)
+    if keys + blob_len > len(buf):
+        raise LookupSnapshotError(f"{path} is truncated")
+    return _Layout(header=header, count=count, ids=start, offsets=offsets, by_concept=by_concept, keys=keys)
+
+
+def _open_mmap(path: Path) -> mmap.mmap:
+    try:
+        with open(path, "rb") as f:
+            if os.fstat(f.fileno()).st_size == 0:
+                raise LookupSnapshotError(f"{path} is empty")
+            return mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    except FileNotFoundError as exc:
+        raise LookupSnapshotError(f"Lookup snapshot not found: {path}") from exc
+
+
+def read_lookup_snapshot(path: str | Path) -> tuple[LookupIndex, str]:
+    """
+    Load a snapshot written by ``write_lookup_snapshot``.
+
+    Returns the reconstructed LookupIndex and the fingerprint it was stored with.
+    The index owns an ordinary dict; see ``open_lookup_snapshot`` for a
+    shared, memory-mapped alternative.
+    """
+    path = Path(path)
+    with _open_mmap(path) as buf:
+        layout = _parse_layout(buf, path)
+        count = layout.count
+
+        concept_ids = array("q", buf[layout.ids : layout.offsets])
+        offsets = array("Q", buf[layout.offsets : layout.by_concept])
+        if sys.byteorder != "little":
+            concept_ids.byteswap()
+            offsets.byteswap()
+        blob = buf[layout.keys : layout.keys + offsets[-1]]
+
+    text = blob.decode("utf-8")
+    if len(text) == len(blob):
+        # pure ASCII: byte offsets are character offsets, slice the str directly
+        keys = [text[offsets[i] : offsets[i + 1]] for i in range(count)]
+    else:
+        keys = [blob[offsets[i] : offsets[i + 1]].decode("utf-8") for i in range(count)]
+
+    index = LookupIndex(
+        name=layout.header["name"],
+        unknown=layout.header["unknown"],
+        mapping=dict(zip(keys, concept_ids.tolist())),
+        collisions=_collisions(layout.header),
+    )
+    return index, str(layout.header.get("fingerprint", ""))
+
+
+def _collisions(header: dict) -> tuple[LookupCollision, ...]:
+    return tuple(
+        LookupCollision(key=key, concept_id=concept_id, candidates=tuple(candidates))
+        for key, concept_id, candidates in header.get("collisions", ())
+    )
+
+
+_IntFormat = Literal["q", "Q", "i"]
+
+
+def _int_view(buf: mmap.mmap, start: int, end: int, fmt: _IntFormat) -> Sequence[int]:
+    if start == end:
+        return array(fmt)
+    if sys.byteorder == "little":
+        return memoryview(buf)[start:end].cast(fmt)
+    values = array(fmt, buf[start:end])
+    values.byteswap()
+    return values
+
+
+class SharedLookupMapping(Mapping[str, int]):
+    """
+    Read-only ``str -> concept_id`` mapping served from a memory-mapped snapshot.
+
+    Keys are located by binary search over the sorted key blob, so nothing is
+    materialised per process: workers that open the same file share the
+    operating system's page cache. The mapping also carries a reverse index
+    (``concept_ids`` and ``keys_by_concept``), which LookupIndex uses instead
+    of building its own.
+
+    Lookups cost O(log n) byte comparisons rather than a dict probe; pair the
+    resolver with ``cache_size`` on hot paths. Instances pickle as their file
+    path, so a LookupIndex or ConceptResolver backed by one can be sent to
+    child processes without copying the data.
+    """
+
+    def __init__(self, path: str | Path):
+        self.path = Path(path)
+        self._buf = _open_mmap(self.path)
+        layout = _parse_layout(self._buf, self.path)
+        self.header = layout.header
+        self._count = layout.count
+        self._ids = _int_view(self._buf, layout.ids, layout.offsets, "q")
+        self._offsets = _int_view(self._buf, layout.offsets, layout.by_concept, "Q")
+        self._by_concept = _int_view(self._buf, layout.by_concept, layout.keys, "Q")
+        self._keys_start = layout.keys
+        self.concept_ids = _SharedConceptIds(self, int(layout.header.get("concepts", 0)))
+        self.keys_by_concept = _SharedKeysByConcept(self)
+
+    def __reduce__(self):
+        return (type(self), (str(self.path),))
+
+    def _key_at(self, i: int) -> bytes:
+        base = self._keys_start
+        return self._buf[base + self._offsets[i] : base + self._offsets[i + 1]]
+
+    def _find(self, key: str) -> int:
+        target = key.encode("utf-8")
+        lo, hi = 0, self._count
+        while lo < hi:
+            mid = (lo + hi) // 2
+            if self._key_at(mid) < target:
+                lo = mid + 1
+            else:
+                hi = mid
+        if lo < self._count and self._key_at(lo) == target:
+            return lo
+        return -1
+
+    def __getitem__(self, key: str) -> int:
+        i = self._find(key) if isinstance(key, str) else -1
+        if i < 0:
+            raise KeyError(key)
+        return self._ids[i]
+
+    @overload
+    def get(self, key: object, /) -> int | None: ...
+    @overload
+    def get(self, key: object, default: int, /) -> int: ...
+    @overload
+    def get(self, key: object, default: _T, /) -> int | _T: ...
+
+    def get(self, key: object, default: object = None, /) -> object:
+        i = self._find(key) if isinstance(key, str) else -1
+        return self._ids[i] if i >= 0 else default
+
+    def __contains__(self, key: object) -> bool:
+        return isinstance(key, str) and self._find(key) >= 0
+
+    def __iter__(self) -> Iterator[str]:
+        for i in range(self._count):
+            yield self._key_at(i).decode("utf-8")
+
+    def __len__(self) -> int:
+        return self._count
+
+    def _concept_range(self, concept_id: int) -> tuple[int, int]:
+        ids = self._ids.__getitem__
+        lo = bisect.bisect_left(self._by_concept, concept_id, key=ids)
+        hi = bisect.bisect_right(self._by_concept, concept_id, lo=lo, key=ids)
+        return lo, hi
+
+
+class _SharedConceptIds(AbstractSet[int]):
+    """Set view over the distinct concept ids of a SharedLookupMapping."""
+
+    def __init__(self, mapping: SharedLookupMapping, count: int):
+        self._mapping = mapping
+        self._len = count
+
+    def __contains__(self, concept_id: object) -> bool:
+        if not isinstance(concept_id, int):
+            return False
+        lo, hi = self._mapping._concept_range(concept_id)
+        return hi > lo
+
+    def __iter__(self) -> Iterator[int]:
+        ids = self._mapping._ids
+        previous = None
+        for i in self._mapping._by_concept:
+            concept_id = ids[i]
+            if concept_id != previous:
+                previous = concept_id
+                yield concept_id
+
+    def __len__(self) -> int:
+        return self._len
+
+
+class _SharedKeysByConcept(Mapping[int, tuple[str, ...]]):
+    """Reverse (concept_id -> keys) view over a SharedLookupMapping."""
+
+    def __init__(self, mapping: SharedLookupMapping):
+        self._mapping = mapping
+
+    def __getitem__(self, concept_id: int) -> tuple[str, ...]:
+        lo, hi = self._mapping._concept_range(concept_id)
+        if lo == hi:
+            raise KeyError(concept_id)
+        positions = self._mapping._by_concept[lo:hi]
+        return tuple(self._mapping._key_at(i).decode("utf-8") for i in positions)
+
+    def __iter__(self) -> Iterator[int]:
+        return iter(self._mapping.concept_ids)
+
+    def __len__(self) -> int:
+        return len(self._mapping.concept_ids)
+
+
+def open_lookup_snapshot(path: str | Path) -> LookupIndex:
+    """
+    Attach to a snapshot as a memory-mapped, read-only LookupIndex.
+
+    Unlike ``read_lookup_snapshot`` this does not copy the keys into a dict;
+    see ``SharedLookupMapping`` for the trade-offs.
+    """
+    mapping = SharedLookupMapping(path)
+    return LookupIndex(
+        name=mapping.header["name"],
+        unknown=mapping.header["unknown"],
+        mapping=mapping,
+        collisions=_collisions(mapping.header),
+    )
+
+
+class LookupSnapshotCache:
+    """
+    Directory of LookupIndex snapshots keyed by spec + vocabulary version.
+
+    ``get_or_build`` is the main entry point: it fingerprints the spec against
+    the current ``vocabulary`` rows, loads a matching snapshot if one exists,
+    and otherwise builds the index from OMOP and stores it for next time.
+
+    Examples
+    --------
+    >>> cache = LookupSnapshotCache("~/.cache/omop_alchemy/lookups")
+    >>> index = cache.get_or_build(session, spec)
+    """
+
+    def __init__(self, directory: str | Path):
+        self.directory = Path(directory).expanduser()
+
+    def path_for(self, spec: LookupSpec, fingerprint: str) -> Path:
+        return self.directory / f"{_safe_stem(spec.name)}-{fingerprint[:16]}{SNAPSHOT_SUFFIX}"
+
+    def load(self, spec: LookupSpec, fingerprint: str) -> LookupIndex | None:
+        """Return the cached index for this fingerprint, or None on a miss."""
+        path = self.path_for(spec, fingerprint)
+        if not path.exists():
+            return None
+        try:
+            index, stored = read_lookup_snapshot(path)
+        except (LookupSnapshotError, ValueError, KeyError):
+            # corrupt or foreign file - treat as a miss and let it be rebuilt
+            return None
+        return index if stored == fingerprint else None
+
+    def store(self, spec: LookupSpec, fingerprint: str, index: LookupIndex) -> Path:
+        return write_lookup_snapshot(index, self.path_for(spec, fingerprint), fingerprint=fingerprint)
+
+    def get_or_build(self, session: so.Session, spec: LookupSpec) -> LookupIndex:
+        fingerprint = spec_fingerprint(spec, vocabulary_versions(session))
+        index = self.load(spec, fingerprint)
+        if index is None:
+            index = OMOPConceptSource.build_lookup(session, spec)
+            self.store(spec, fingerprint, index)
+        return index
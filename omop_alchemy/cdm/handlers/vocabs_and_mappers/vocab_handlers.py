@@ -1,11 +1,20 @@
-from typing import Iterable, Callable
-from dataclasses import dataclass
+import functools
+from datetime import date
+from typing import TYPE_CHECKING, AbstractSet, Any, Iterable, Iterator, Callable, Literal, Mapping, Protocol, runtime_checkable
+from dataclasses import dataclass, field
 import sqlalchemy as sa
 import sqlalchemy.orm as so
 
 from .concept_normalisers import normalize_default
+from .fuzzy_index import FuzzyIndex, FuzzyMatch
 from ...model import ConceptRow
 from ...model.vocabulary import Concept, Concept_Synonym, Concept_Ancestor
+from ...query import id_in
+
+if TYPE_CHECKING:
+    import pandas as pd
+
+    from .concept_hierarchy import ConceptHierarchy
 
 """
 Class definitions for vocabulary handling and mapping.
@@ -17,6 +26,45 @@ it's not worth over-engineering separation at this stage.
 
 Normaliser = Callable[[str], str]
 
+@runtime_checkable
+class _ArrowLike(Protocol):
+    """A ``pyarrow.Array``/``ChunkedArray`` as far as ``lookup_many`` needs it."""
+    def to_pandas(self) -> "pd.Series": ...
+
+
+CollisionPolicy = Literal["last_wins", "first_wins", "prefer_standard", "prefer_valid", "error"]
+
+
+@dataclass(frozen=True)
+class LookupCollision:
+    """
+    A normalised key produced by more than one concept during a build.
+
+    Attributes
+    ----------
+    key:
+        The colliding normalised key.
+    concept_id:
+        The concept the index maps ``key`` to under the spec's collision policy.
+    candidates:
+        Every concept that produced ``key``, in ascending order.
+    """
+    key: str
+    concept_id: int
+    candidates: tuple[int, ...]
+
+
+class LookupCollisionError(ValueError):
+    """Raised by builds with ``collision_policy="error"`` when any key is ambiguous."""
+
+    def __init__(self, name: str, collisions: tuple[LookupCollision, ...]):
+        self.collisions = collisions
+        sample = ", ".join(f"{c.key!r} -> {list(c.candidates)}" for c in collisions[:5])
+        more = f" (+{len(collisions) - 5} more)" if len(collisions) > 5 else ""
+        super().__init__(
+            f"{len(collisions)} keys map to more than one concept in lookup {name!r}: {sample}{more}"
+        )
+
 @dataclass(frozen=True)
 class LookupIndex:
     """
@@ -36,16 +84,46 @@ class LookupIndex:
         propagate as null.
     mapping:
         Dictionary mapping normalised string keys to OMOP concept IDs.
-        Keys are expected to already be normalised at build time.
+        Keys are expected to already be normalised at build time. Any
+        read-only Mapping is accepted, e.g. the memory-mapped
+        ``SharedLookupMapping`` used to share an index between processes.
+    collisions:
+        Keys that more than one concept produced during the build, and how
+        each was resolved (see ``LookupSpec.collision_policy``).
 
     Notes
     -----
     The mapping may contain multiple textual representations pointing to the
     same concept ID (e.g. name + code + synonym). 
+
+    A reverse index (concept ID → keys) and the set of concept IDs are built
+    once at construction, so integer membership tests and ``all_concepts``
+    are O(1) and ``keys_for`` answers "which strings map to this concept".
+    The mapping is treated as immutable after construction. Mappings that
+    already carry a reverse index (``concept_ids`` and ``keys_by_concept``
+    attributes, as ``SharedLookupMapping`` does) are used as-is.
     """
     name: str
     unknown: int | None
-    mapping: dict[str, int]
+    mapping: Mapping[str, int]
+    collisions: tuple[LookupCollision, ...] = field(default=(), compare=False)
+    _keys_by_concept: Mapping[int, tuple[str, ...]] = field(init=False, repr=False, compare=False)
+    _concept_ids: AbstractSet[int] = field(init=False, repr=False, compare=False)
+    _fuzzy: dict[tuple[int, int], FuzzyIndex] = field(init=False, repr=False, compare=False, default_factory=dict)
+
+    def __post_init__(self) -> None:
+        concept_ids = getattr(self.mapping, "concept_ids", None)
+        keys_by_concept = getattr(self.mapping, "keys_by_concept", None)
+        if concept_ids is not None and keys_by_concept is not None:
+            object.__setattr__(self, "_keys_by_concept", keys_by_concept)
+            object.__setattr__(self, "_concept_ids", concept_ids)
+            return
+
+        reverse: dict[int, list[str]] = {}
+        for key, concept_id in self.mapping.items():
+            reverse.setdefault(concept_id, []).append(key)
+        object.__setattr__(self, "_keys_by_concept", {cid: tuple(keys) for cid, keys in reverse.items()})
+        object.__setattr__(self, "_concept_ids", frozenset(reverse))
 
     def lookup(self, term: str | None) -> int | None:
         if term is None:
@@ -56,22 +134,109 @@ class LookupIndex:
         if isinstance(item, str):
             return item in self.mapping
         if isinstance(item, int):
-            return item in self.mapping.values()
+            return item in self._concept_ids
         return False
+
+    def keys_for(self, concept_id: int) -> tuple[str, ...]:
+        """Return every normalised key that maps to ``concept_id`` (empty if none)."""
+        return self._keys_by_concept.get(concept_id, ())
+
+    def __reduce__(self):
+        # derived structures are rebuilt (or re-attached) on the other side
+        return (type(self), (self.name, self.unknown, self.mapping, self.collisions))
+
+    def apply_delta(
+        self,
+        delta: "LookupDelta",
+        *,
+        collision_policy: CollisionPolicy = "last_wins",
+    ) -> "LookupIndex":
+        """
+        Return a new LookupIndex with ``delta`` applied.
+
+        Every key currently owned by an upserted or removed concept is dropped
+        (found via the reverse index, so no scan of the mapping is needed),
+        then the upserted concepts' keys are inserted, last-wins. Keys that
+        another concept lost to a changed concept in a collision are not
+        restored, and collisions involving changed concepts are dropped from
+        ``collisions``; rebuild from scratch if exact collision behaviour
+        matters.
+
+        ``collision_policy`` is the policy of the spec the index was built
+        from. Only ``"last_wins"`` can be applied incrementally: the other
+        policies rank a changed concept against every concept claiming the
+        same key, which the index does not retain, so they raise ValueError.
+        """
+        if collision_policy != "last_wins":
+            raise ValueError(
+                f"apply_delta only supports collision_policy='last_wins', got {collision_policy!r}; "
+                "rebuild the index with OMOPConceptSource.build_lookup instead"
+            )
+        m = dict(self.mapping)
+        changed = delta.removed | delta.upserts.keys()
+        for concept_id in changed:
+            for key in self.keys_for(concept_id):
+                if m.get(key) == concept_id:
+                    del m[key]
+        for concept_id, keys in delta.upserts.items():
+            for key in keys:
+                m[key] = concept_id
+        return LookupIndex(
+            name=self.name,
+            unknown=self.unknown,
+            mapping=m,
+            collisions=tuple(c for c in self.collisions if changed.isdisjoint(c.candidates)),
+        )
+
+    def fuzzy_index(self, *, max_edit_distance: int = 2, prefix_length: int = 7) -> FuzzyIndex:
+        """
+        Return the approximate-match index over this lookup's keys.
+
+        The index is built on first request and then reused by every resolver
+        sharing this LookupIndex.
+        """
+        params = (max_edit_distance, prefix_length)
+        fuzzy = self._fuzzy.get(params)
+        if fuzzy is None:
+            fuzzy = FuzzyIndex(self.mapping, max_edit_distance=max_edit_distance, prefix_length=prefix_length)
+            self._fuzzy[params] = fuzzy
+        return fuzzy
     
     def __repr__(self) -> str:
         return (
             f"<LookupIndex name={self.name!r} "
             f"keys={len(self.mapping)} "
             f"concepts={len(self.all_concepts)} "
+            f"collisions={len(self.collisions)} "
             f"unknown={self.unknown}>"
         )
 
     @property
-    def all_concepts(self) -> set[int]:
-        return set(self.mapping.values())
+    def all_concepts(self) -> AbstractSet[int]:
+        return self._concept_ids
     
 
+@dataclass(frozen=True)
+class LookupDelta:
+    """
+    Change set for a LookupIndex, produced by ``OMOPConceptSource.lookup_delta``.
+
+    Attributes
+    ----------
+    upserts:
+        Concept ID → the complete tuple of normalised keys the concept should
+        own after the change (new and updated concepts that are in scope).
+    removed:
+        Concept IDs that should no longer appear in the index (invalidated,
+        or changed so they fall outside the spec).
+    """
+    upserts: dict[int, tuple[str, ...]]
+    removed: frozenset[int]
+
+    def __len__(self) -> int:
+        return len(self.upserts) + len(self.removed)
+
+
 @dataclass(frozen=True)
 class LookupSpec:
     """
@@ -121,6 +286,26 @@ class LookupSpec:
         Tuple of ConceptRow attribute names to index as keys (e.g.
         ("concept_name", "concept_code")). This controls which textual fields
         become resolvable inputs.
+    collision_policy:
+        What to do when concepts normalise to the same key. Every concept's
+        name and code are read first, in ``concept_id`` order, and synonyms
+        only after all of them (again in ``concept_id`` order), so every
+        policy is deterministic. "First" and "last" follow that order: a key
+        claimed by one concept's name and another's synonym is first claimed
+        by the name, whatever the two concept IDs.
+
+        - ``"last_wins"``: the key maps to the last concept seen (the
+          historical behaviour);
+        - ``"first_wins"``: the key keeps the first concept seen;
+        - ``"prefer_standard"``: standard concepts beat classification
+          concepts, which beat non-standard ones; then valid beats invalid;
+          ties keep the first concept seen;
+        - ``"prefer_valid"``: valid concepts beat invalidated ones, then
+          standard beats non-standard; ties keep the first concept seen;
+        - ``"error"``: raise ``LookupCollisionError`` listing every collision.
+
+        Whatever the policy, collisions are reported on
+        ``LookupIndex.collisions``.
 
     Notes
     -----
@@ -143,6 +328,85 @@ class LookupSpec:
     include_synonyms: bool = False
     normalizer: Normaliser = normalize_default
     include: tuple[str, ...] = ("concept_name", "concept_code")  # index fields
+    collision_policy: CollisionPolicy = "last_wins"
+
+
+def _flag(value: str | None) -> str:
+    return value.strip() if value else ""
+
+
+class _IndexBuilder:
+    """
+    Accumulates keys for one LookupSpec, applying its collision policy.
+
+    Collisions are detected on insert (a dict probe per key), so reporting
+    them costs nothing beyond the build pass itself.
+    """
+
+    def __init__(self, spec: LookupSpec):
+        self.spec = spec
+        self.mapping: dict[str, int] = {}
+        self._claims: dict[str, set[int]] = {}
+        policy = spec.collision_policy
+        # concept attributes are only retained when the policy ranks by them
+        self._rank: dict[int, tuple[bool, ...]] | None = (
+            {} if policy in ("prefer_standard", "prefer_valid") else None
+        )
+
+    def add_concept(
+        self,
+        concept_id: int,
+        name: str | None,
+        code: str | None,
+        standard_concept: str | None = None,
+        invalid_reason: str | None = None,
+    ) -> None:
+        if self._rank is not None:
+            standard, valid = _flag(standard_concept), not _flag(invalid_reason)
+            if self.spec.collision_policy == "prefer_standard":
+                self._rank[concept_id] = (standard == "S", standard == "C", valid)
+            else:
+                self._rank[concept_id] = (valid, standard == "S")
+        if "concept_name" in self.spec.include and name:
+            self.add(self.spec.normalizer(name), concept_id)
+        if "concept_code" in self.spec.include and code:
+            self.add(self.spec.normalizer(code), concept_id)
+
+    def add_synonym(self, concept_id: int, synonym: str) -> None:
+        self.add(self.spec.normalizer(synonym), concept_id)
+
+    def add(self, key: str, concept_id: int) -> None:
+        current = self.mapping.get(key)
+        if current is None:
+            self.mapping[key] = concept_id
+            return
+        if current == concept_id:
+            return
+        self._claims.setdefault(key, {current}).add(concept_id)
+        if self._wins(concept_id, current):
+            self.mapping[key] = concept_id
+
+    def _wins(self, challenger: int, current: int) -> bool:
+        policy = self.spec.collision_policy
+        if policy == "last_wins":
+            return True
+        if self._rank is not None:
+            return self._rank.get(challenger, ()) > self._rank.get(current, ())
+        return False
+
+    def finish(self) -> LookupIndex:
+        collisions = tuple(
+            LookupCollision(key=key, concept_id=self.mapping[key], candidates=tuple(sorted(ids)))
+            for key, ids in sorted(self._claims.items())
+        )
+        if collisions and self.spec.collision_policy == "error":
+            raise LookupCollisionError(self.spec.name, collisions)
+        return LookupIndex(
+            name=self.spec.name,
+            unknown=self.spec.unknown,
+            mapping=self.mapping,
+            collisions=collisions,
+        )
 
 
 class OMOPConceptSource:
@@ -159,26 +423,189 @@ class OMOPConceptSource:
     """
 
     @staticmethod
-    def fetch_synonyms(session: so.Session) -> list[tuple[int, str]]:
+    def concept_filter(
+        *,
+        domain_id: str | None = None,
+        concept_class_id: Iterable[str] | None = None,
+        vocabulary_id: Iterable[str] | None = None,
+        standard_only: bool = True,
+        code_filter: str | None = None,
+        parents: Iterable[int] | None = None,
+        include_non_standard_descendants: bool = False,
+    ) -> sa.ColumnElement[bool]:
         """
-        Return (concept_id, synonym) pairs for all concept synonyms.
+        Return the lookup constraints as a single boolean expression over Concept.
 
-        Filtering (standard / domain / etc.) is intentionally left
-        to higher layers.
+        This is the single place where LookupSpec-style constraints are turned
+        into SQL, so that concept rows and their synonyms are always scoped
+        identically - whether one spec is built at a time or many are built
+        together in one scan. Hierarchical expansion is expressed as a
+        semi-join on Concept_Ancestor, so each concept appears at most once
+        even when it descends from several of the requested parents. Large
+        parent lists are bound as one array parameter (see ``id_in``).
         """
-        rows = session.execute(
-            sa.select(
-                Concept_Synonym.concept_id,
-                Concept_Synonym.concept_synonym_name,
+        clauses: list[sa.ColumnElement[bool]] = []
+        if parents:
+            clauses.append(
+                Concept.concept_id.in_(
+                    sa.select(Concept_Ancestor.descendant_concept_id)
+                    .where(id_in(Concept_Ancestor.ancestor_concept_id, parents))
+                )
             )
-        ).all()
+            if standard_only and not include_non_standard_descendants:
+                clauses.append(Concept.standard_concept == "S")
+        if domain_id:
+            clauses.append(Concept.domain_id == domain_id)
+        if concept_class_id:
+            clauses.append(Concept.concept_class_id.in_(list(concept_class_id)))
+        if vocabulary_id:
+            clauses.append(Concept.vocabulary_id.in_(list(vocabulary_id)))
+        if standard_only and not parents:
+            clauses.append(Concept.standard_concept == "S")
+        if code_filter:
+            clauses.append(Concept.concept_code.ilike(f"%{code_filter}%"))
+        return sa.and_(sa.true(), *clauses)
+
+    @staticmethod
+    def concept_select(
+        *columns: Any,
+        domain_id: str | None = None,
+        concept_class_id: Iterable[str] | None = None,
+        vocabulary_id: Iterable[str] | None = None,
+        standard_only: bool = True,
+        code_filter: str | None = None,
+        parents: Iterable[int] | None = None,
+        include_non_standard_descendants: bool = False,
+    ) -> sa.Select:
+        """
+        Build a SELECT of ``columns`` over Concept with the lookup constraints applied.
+
+        See ``concept_filter`` for how the constraints are expressed.
+        """
+        return sa.select(*columns).select_from(Concept).where(
+            OMOPConceptSource.concept_filter(
+                domain_id=domain_id,
+                concept_class_id=concept_class_id,
+                vocabulary_id=vocabulary_id,
+                standard_only=standard_only,
+                code_filter=code_filter,
+                parents=parents,
+                include_non_standard_descendants=include_non_standard_descendants,
+            )
+        )
+
+    @staticmethod
+    def spec_filter(spec: LookupSpec) -> sa.ColumnElement[bool]:
+        """Return ``concept_filter`` for the constraints declared on ``spec``."""
+        return OMOPConceptSource.concept_filter(
+            domain_id=spec.domain_id,
+            concept_class_id=spec.concept_class_id,
+            vocabulary_id=spec.vocabulary_id,
+            standard_only=spec.standard_only,
+            code_filter=spec.code_filter,
+            parents=spec.parents,
+            include_non_standard_descendants=spec.include_non_standard_descendants,
+        )
 
-        return [
-            (int(r.concept_id), r.concept_synonym_name)
-            for r in rows
-            if r.concept_synonym_name
-        ]
+    @staticmethod
+    def iter_synonyms(
+        session: so.Session,
+        concept_ids: sa.Select | None = None,
+        *,
+        batch_size: int = 50_000,
+    ) -> Iterator[tuple[int, str]]:
+        """
+        Stream (concept_id, synonym) pairs in batches of ``batch_size``,
+        ordered by concept and synonym.
+
+        If ``concept_ids`` is given (a single-column SELECT of concept IDs,
+        typically from ``concept_select``), synonyms are restricted to those
+        concepts with a semi-join in the database, so only in-scope rows ever
+        leave the server. Rows are fetched with ``yield_per``, which uses a
+        server-side cursor on backends that support one.
+        """
+        q = sa.select(
+            Concept_Synonym.concept_id,
+            Concept_Synonym.concept_synonym_name,
+        )
+        if concept_ids is not None:
+            q = q.where(Concept_Synonym.concept_id.in_(concept_ids))
+        q = q.order_by(Concept_Synonym.concept_id, Concept_Synonym.concept_synonym_name)
+
+        result = session.execute(q.execution_options(yield_per=batch_size))
+        for partition in result.partitions():
+            for cid, syn in partition:
+                if syn:
+                    yield int(cid), syn
+
+    @staticmethod
+    def fetch_synonyms(
+        session: so.Session,
+        concept_ids: sa.Select | None = None,
+    ) -> list[tuple[int, str]]:
+        """
+        Return (concept_id, synonym) pairs for concept synonyms.
+
+        By default all synonyms are returned and filtering (standard / domain /
+        etc.) is left to higher layers; pass ``concept_ids`` to scope the
+        query in SQL instead (see ``iter_synonyms``).
+        """
+        return list(OMOPConceptSource.iter_synonyms(session, concept_ids))
     
+    @staticmethod
+    def iter_concepts(
+        session: so.Session,
+        *,
+        domain_id: str | None = None,
+        concept_class_id: Iterable[str] | None = None,
+        vocabulary_id: Iterable[str] | None = None,
+        standard_only: bool = True,
+        code_filter: str | None = None,
+        parents: Iterable[int] | None = None,
+        include_non_standard_descendants: bool = False,
+        batch_size: int = 50_000,
+    ) -> Iterator[ConceptRow]:
+        """
+        Stream concepts matching the provided constraints as ConceptRows,
+        in ``concept_id`` order.
+
+        Only the columns needed for a ConceptRow are selected (no ORM entities,
+        no identity map), and rows are fetched ``batch_size`` at a time with
+        ``yield_per`` - a server-side cursor on PostgreSQL - so peak memory is
+        bounded by the batch rather than by the size of the result.
+        """
+        q = OMOPConceptSource.concept_select(
+            Concept.concept_id,
+            Concept.concept_name,
+            Concept.concept_code,
+            Concept.domain_id,
+            Concept.concept_class_id,
+            Concept.vocabulary_id,
+            Concept.standard_concept,
+            Concept.invalid_reason,
+            domain_id=domain_id,
+            concept_class_id=concept_class_id,
+            vocabulary_id=vocabulary_id,
+            standard_only=standard_only,
+            code_filter=code_filter,
+            parents=parents,
+            include_non_standard_descendants=include_non_standard_descendants,
+        ).order_by(Concept.concept_id)
+
+        result = session.execute(q.execution_options(yield_per=batch_size))
+        for partition in result.partitions():
+            for cid, name, code, domain, concept_class, vocabulary, standard, invalid in partition:
+                yield ConceptRow(
+                    concept_id=int(cid),
+                    concept_name=name,
+                    concept_code=code,
+                    domain_id=domain,
+                    concept_class_id=concept_class,
+                    vocabulary_id=vocabulary,
+                    standard_concept=standard,
+                    invalid_reason=invalid,
+                )
+
     @staticmethod
     def fetch_concepts(
         session: so.Session,
@@ -198,43 +625,20 @@ class OMOPConceptSource:
         1. Flat filtering by domain / class / vocabulary
         2. Hierarchical expansion from parent concept(s)
 
+        See ``iter_concepts`` for a streaming equivalent.
         """
-
-        q = session.query(Concept)
-        if parents:
-            parents = list(parents)
-            q = (
-                q.join(
-                    Concept_Ancestor,
-                    Concept_Ancestor.descendant_concept_id == Concept.concept_id,
-                )
-                .filter(Concept_Ancestor.ancestor_concept_id.in_(parents))
+        return list(
+            OMOPConceptSource.iter_concepts(
+                session,
+                domain_id=domain_id,
+                concept_class_id=concept_class_id,
+                vocabulary_id=vocabulary_id,
+                standard_only=standard_only,
+                code_filter=code_filter,
+                parents=parents,
+                include_non_standard_descendants=include_non_standard_descendants,
             )
-            if standard_only and not include_non_standard_descendants:
-                q = q.filter(Concept.standard_concept == "S")
-        if domain_id:
-            q = q.filter(Concept.domain_id == domain_id)
-        if concept_class_id:
-            q = q.filter(Concept.concept_class_id.in_(list(concept_class_id)))
-        if vocabulary_id:
-            q = q.filter(Concept.vocabulary_id.in_(list(vocabulary_id)))
-        if standard_only and not parents:
-            q = q.filter(Concept.standard_concept == "S")
-        if code_filter:
-            q = q.filter(Concept.concept_code.ilike(f"%{code_filter}%"))
-        rows = q.all()
-        return [
-            ConceptRow(
-                concept_id=int(r.concept_id),
-                concept_name=r.concept_name,
-                concept_code=r.concept_code,
-                domain_id=r.domain_id,
-                concept_class_id=r.concept_class_id,
-                vocabulary_id=r.vocabulary_id,
-                standard_concept=r.standard_concept,
-            )
-            for r in rows
-        ]
+        )
     
     @staticmethod
     def descendants(
@@ -242,22 +646,112 @@ class OMOPConceptSource:
         parents: list[int],
         *,
         include_non_standard: bool = False,
+        hierarchy: "ConceptHierarchy | None" = None,
     ) -> list[int]:
-        rows = OMOPConceptSource.fetch_concepts(
+        """
+        Return the concepts descending from any of ``parents``, in ascending order.
+
+        Pass a ``ConceptHierarchy`` to answer from the in-process closure
+        instead of joining ``concept_ancestor`` on every call. To expand
+        several parent sets, use ``descendants_many``.
+        """
+        return OMOPConceptSource.descendants_many(
             session,
-            parents=parents,
-            include_non_standard_descendants=include_non_standard,
-            standard_only=not include_non_standard,
-        )
-        return list({r.concept_id for r in rows})
-    
+            {"": parents},
+            include_non_standard=include_non_standard,
+            hierarchy=hierarchy,
+        )[""]
+
+    @staticmethod
+    def descendants_many(
+        session: so.Session,
+        parent_sets: Mapping[str, Iterable[int]],
+        *,
+        include_non_standard: bool = False,
+        hierarchy: "ConceptHierarchy | None" = None,
+        chunk_size: int = 10_000,
+    ) -> dict[str, list[int]]:
+        """
+        Expand many named parent sets into their descendants at once.
+
+        Every (set, parent) pair is sent as an inline ``VALUES`` table joined
+        to ``concept_ancestor``, so all sets are answered by one query that
+        selects only integer columns - no Concept rows are materialised.
+        Pairs are sent in chunks of ``chunk_size`` to stay within the
+        driver's bind parameter limit, so very large inputs take one query
+        per chunk.
+
+        Parameters
+        ----------
+        parent_sets:
+            Mapping of set name to the parent concept ids of that set.
+        include_non_standard:
+            If False (default), only standard descendants are returned.
+        hierarchy:
+            Optional ``ConceptHierarchy`` to answer from instead of the database.
+        chunk_size:
+            Maximum number of (set, parent) pairs per query.
+
+        Returns
+        -------
+        dict[str, list[int]]
+            Set name to ascending descendant concept ids. Every input set is
+            present, with an empty list if nothing descends from it.
+        """
+        if hierarchy is not None:
+            return {
+                name: hierarchy.descendants(parents, include_non_standard=include_non_standard)
+                for name, parents in parent_sets.items()
+            }
+
+        names = list(parent_sets)
+        pairs = [(i, int(parent)) for i, name in enumerate(names) for parent in set(parent_sets[name])]
+        found: list[set[int]] = [set() for _ in names]
+        for start in range(0, len(pairs), chunk_size):
+            values = (
+                sa.values(
+                    sa.column("set_index", sa.Integer),
+                    sa.column("parent_id", sa.Integer),
+                    name="parent_sets",
+                )
+                .data(pairs[start : start + chunk_size])
+                .cte("parent_sets")
+            )
+            # the Concept join also drops ancestor rows whose descendant has no concept row
+            q = (
+                sa.select(values.c.set_index, Concept_Ancestor.descendant_concept_id)
+                .join_from(values, Concept_Ancestor, Concept_Ancestor.ancestor_concept_id == values.c.parent_id)
+                .join(Concept, Concept.concept_id == Concept_Ancestor.descendant_concept_id)
+                .distinct()
+            )
+            if not include_non_standard:
+                q = q.where(Concept.standard_concept == "S")
+            for set_index, concept_id in session.execute(q):
+                found[set_index].add(int(concept_id))
+
+        return {name: sorted(ids) for name, ids in zip(names, found)}
+
 
     @staticmethod
     def build_lookup(
         session: so.Session,
         spec: LookupSpec,
+        *,
+        synonym_scope: Literal["spec", "all"] = "spec",
     ) -> LookupIndex:
-        rows = OMOPConceptSource.fetch_concepts(
+        """
+        Materialise a LookupIndex for ``spec``.
+
+        ``synonym_scope`` controls how synonyms are fetched when
+        ``spec.include_synonyms`` is set: ``"spec"`` (default) semi-joins
+        ``concept_synonym`` against the spec's concept query and streams only
+        in-scope rows, so memory is bounded by the spec rather than by the
+        synonym table; ``"all"`` reads the whole table and filters in Python.
+
+        Keys claimed by more than one concept are resolved by
+        ``spec.collision_policy`` and reported on ``LookupIndex.collisions``.
+        """
+        rows = OMOPConceptSource.iter_concepts(
             session,
             domain_id=spec.domain_id,
             concept_class_id=spec.concept_class_id,
@@ -268,23 +762,192 @@ class OMOPConceptSource:
             include_non_standard_descendants=spec.include_non_standard_descendants,
         )
 
-        ids = {r.concept_id for r in rows}
+        # ids are only needed to filter synonyms in Python
+        ids: set[int] = set()
+        track_ids = spec.include_synonyms and synonym_scope == "all"
 
-        m: dict[str, int] = {}
+        builder = _IndexBuilder(spec)
         for r in rows:
-            if "concept_name" in spec.include and r.concept_name:
-                m[spec.normalizer(r.concept_name)] = r.concept_id
-            if "concept_code" in spec.include and r.concept_code:
-                m[spec.normalizer(r.concept_code)] = r.concept_id
+            if track_ids:
+                ids.add(r.concept_id)
+            builder.add_concept(r.concept_id, r.concept_name, r.concept_code, r.standard_concept, r.invalid_reason)
 
-        if spec.include_synonyms:
+        if spec.include_synonyms and synonym_scope == "spec":
+            scope = sa.select(Concept.concept_id).where(OMOPConceptSource.spec_filter(spec))
+            for cid, syn in OMOPConceptSource.iter_synonyms(session, scope):
+                builder.add_synonym(cid, syn)
+        elif spec.include_synonyms:
             for cid, syn in OMOPConceptSource.fetch_synonyms(session):
                 if cid in ids and syn:
-                    m[spec.normalizer(syn)] = cid
+                    builder.add_synonym(cid, syn)
+
+        return builder.finish()
+
+    @staticmethod
+    def build_lookups(
+        session: so.Session,
+        specs: Iterable[LookupSpec],
+        *,
+        batch_size: int = 50_000,
+    ) -> dict[str, LookupIndex]:
+        """
+        Materialise LookupIndexes for many specs in a single vocabulary pass.
+
+        Instead of one ``concept`` query per spec, a single streamed query
+        selects every concept matched by *any* spec, with one flag column per
+        spec saying which specs the row belongs to; each row is then fanned
+        out to the matching indexes. Synonyms for all specs with
+        ``include_synonyms`` are likewise read in one scoped scan of
+        ``concept_synonym``. Each resulting index holds the same keys that
+        ``build_lookup`` would produce for its spec.
+
+        Returns a dict keyed by spec name; names must be unique.
+        """
+        specs = list(specs)
+        names = [spec.name for spec in specs]
+        if len(set(names)) != len(names):
+            raise ValueError(f"LookupSpec names must be unique, got {names}")
+        if not specs:
+            return {}
+
+        filters = [OMOPConceptSource.spec_filter(spec) for spec in specs]
+        q = (
+            sa.select(
+                Concept.concept_id,
+                Concept.concept_name,
+                Concept.concept_code,
+                Concept.standard_concept,
+                Concept.invalid_reason,
+                *(sa.case((f, 1), else_=0).label(f"spec_{i}") for i, f in enumerate(filters)),
+            )
+            .where(sa.or_(*filters))
+            .order_by(Concept.concept_id)
+        )
+
+        builders = [_IndexBuilder(spec) for spec in specs]
+        with_synonyms = [i for i, spec in enumerate(specs) if spec.include_synonyms]
+        # concept id -> indexes of the synonym-enabled specs it belongs to
+        synonym_targets: dict[int, list[int]] = {}
+
+        result = session.execute(q.execution_options(yield_per=batch_size))
+        for partition in result.partitions():
+            for row in partition:
+                cid, name, code, standard, invalid = int(row[0]), row[1], row[2], row[3], row[4]
+                flags = row[5:]
+                for i, spec in enumerate(specs):
+                    if not flags[i]:
+                        continue
+                    builders[i].add_concept(cid, name, code, standard, invalid)
+                    if spec.include_synonyms:
+                        synonym_targets.setdefault(cid, []).append(i)
+
+        if synonym_targets:
+            scope = sa.select(Concept.concept_id).where(sa.or_(*(filters[i] for i in with_synonyms)))
+            for cid, syn in OMOPConceptSource.iter_synonyms(session, scope, batch_size=batch_size):
+                for i in synonym_targets.get(cid, ()):
+                    builders[i].add_synonym(cid, syn)
+
+        return {spec.name: builder.finish() for spec, builder in zip(specs, builders)}
+
+    @staticmethod
+    def changed_since(since: date) -> sa.ColumnElement[bool]:
+        """
+        Concepts added, updated or invalidated on or after ``since``.
+
+        Athena stamps new and changed concepts with ``valid_start_date`` and
+        deprecated or replaced ones with ``valid_end_date`` plus an
+        ``invalid_reason``, so passing the date of the previous vocabulary
+        release selects everything that release changed.
+        """
+        return sa.or_(
+            Concept.valid_start_date >= since,
+            sa.and_(Concept.valid_end_date >= since, sa.not_(Concept.is_valid_expr())),
+        )
 
-        return LookupIndex(name=spec.name, unknown=spec.unknown, mapping=m)
+    @staticmethod
+    def lookup_delta(
+        session: so.Session,
+        spec: LookupSpec,
+        *,
+        since: date,
+        batch_size: int = 50_000,
+    ) -> LookupDelta:
+        """
+        Compute the changes to ``spec``'s index since ``since``.
+
+        Only concepts matching ``changed_since(since)`` are read. Those that
+        still satisfy the spec become upserts (with their names, codes and, if
+        enabled, synonyms normalised exactly as in ``build_lookup``); the rest
+        are removals. Apply the result with ``LookupIndex.apply_delta``.
+
+        Changes that leave the concept row untouched - a new synonym, or new
+        ``concept_ancestor`` edges that move a concept under a spec's parents -
+        are not detected; rebuild the index after such changes.
+        """
+        changed = OMOPConceptSource.changed_since(since)
+        in_scope = sa.and_(changed, OMOPConceptSource.spec_filter(spec))
+
+        changed_ids = {
+            int(cid)
+            for cid in session.execute(sa.select(Concept.concept_id).where(changed)).scalars()
+        }
+
+        keys: dict[int, list[str]] = {}
+        rows = session.execute(
+            sa.select(Concept.concept_id, Concept.concept_name, Concept.concept_code)
+            .where(in_scope)
+            .execution_options(yield_per=batch_size)
+        )
+        for partition in rows.partitions():
+            for cid, name, code in partition:
+                owned = keys.setdefault(int(cid), [])
+                if "concept_name" in spec.include and name:
+                    owned.append(spec.normalizer(name))
+                if "concept_code" in spec.include and code:
+                    owned.append(spec.normalizer(code))
+
+        if spec.include_synonyms and keys:
+            scope = sa.select(Concept.concept_id).where(in_scope)
+            for cid, syn in OMOPConceptSource.iter_synonyms(session, scope, batch_size=batch_size):
+                keys[cid].append(spec.normalizer(syn))
+
+        return LookupDelta(
+            upserts={cid: tuple(dict.fromkeys(owned)) for cid, owned in keys.items()},
+            removed=frozenset(changed_ids - keys.keys()),
+        )
     
 
+@dataclass(frozen=True)
+class LookupStats:
+    """
+    Per-call breakdown of a batch resolution.
+
+    Row counts (``hits``, ``correction_hits``, ``fuzzy_hits``, ``misses``) are
+    over the input values, so they always sum to ``total``. ``unique`` is the number
+    of distinct input values that were actually normalised and resolved.
+    Empty and null inputs count as misses.
+    """
+    total: int
+    unique: int
+    hits: int
+    correction_hits: int
+    misses: int
+    fuzzy_hits: int = 0
+
+
+@dataclass(frozen=True)
+class BatchLookupResult:
+    """
+    Output of ``ConceptResolver.lookup_many``.
+
+    ``concept_ids`` is aligned with the input: a ``pandas.Series`` (sharing
+    the input index) for Series input, a ``pyarrow.Array`` for Arrow input,
+    and a list otherwise. Unresolved values hold the index's ``unknown`` ID.
+    """
+    concept_ids: Any
+    stats: LookupStats
+
+
 class ConceptResolver:
 
     """
@@ -300,12 +963,13 @@ class ConceptResolver:
     1. Apply the primary normaliser to the input term and attempt a direct lookup.
     2. If no hit is found, apply each correction function in turn, re-normalise,
        and retry the lookup.
-    3. If no match is found, return the configured ``unknown`` concept ID.
+    3. If enabled, find the closest index key within ``fuzzy_max_edit_distance``
+       edits whose similarity is at least ``fuzzy_threshold``.
+    4. If no match is found, return the configured ``unknown`` concept ID.
 
     This design allows simple, explicit handling of common data quality issues
     (e.g. formatting differences, legacy codes, mild normalisation errors)
-    without introducing fuzzy matching, probabilistic scoring, or hidden
-    inference logic.
+    without hidden inference logic; approximate matching is strictly opt-in.
 
     Parameters
     ----------
@@ -319,13 +983,24 @@ class ConceptResolver:
         Optional ordered list of correction functions applied to the raw input
         term prior to normalisation and lookup. Each correction is tried in
         sequence until a match is found.
+    cache_size:
+        Optional bound on an LRU cache of ``lookup`` results, keyed by the raw
+        input term. Both hits and terms that resolved to ``unknown`` are cached,
+        so repeated misses do not re-run the correction passes. ``None`` (the
+        default) disables caching. Counters are available via ``cache_info()``.
+    fuzzy_threshold:
+        Minimum similarity (0-1, see ``FuzzyMatch``) for the approximate-match
+        tier. ``None`` (the default) disables the tier. Enabling it builds a
+        ``FuzzyIndex`` over the LookupIndex keys up front.
+    fuzzy_max_edit_distance:
+        Largest edit distance considered by the approximate-match tier.
 
     Notes
     -----
     - ConceptResolver performs no database access and no dynamic expansion of
       vocabularies; it operates over the materialised LookupIndex.
-    - Resolution is deterministic and transparent: there is no fuzzy matching,
-      ranking, or probabilistic inference.
+    - Resolution is deterministic and transparent. The fuzzy tier picks the
+      lowest edit distance, breaking ties by similarity and then key order.
     - Correction functions are applied conservatively and in-order; later
       corrections do not override earlier successful matches.
     - ``lookup_exact`` bypasses correction passes and performs a single
@@ -346,27 +1021,181 @@ class ConceptResolver:
         *,
         normalizer: Normaliser | None = None,
         corrections: list[Callable[[str], str]] | None = None,
+        cache_size: int | None = None,
+        fuzzy_threshold: float | None = None,
+        fuzzy_max_edit_distance: int = 2,
     ):
         self.index = index
         self._normalizer = normalizer or normalize_default
         self._corrections = corrections or []
+        self._fuzzy_threshold = fuzzy_threshold
+        self._fuzzy = (
+            index.fuzzy_index(max_edit_distance=fuzzy_max_edit_distance)
+            if fuzzy_threshold is not None
+            else None
+        )
+        self._cached_resolve = (
+            functools.lru_cache(maxsize=cache_size)(self._resolve)
+            if cache_size is not None
+            else None
+        )
 
     def lookup(self, term: str | None) -> int | None:
         if not term:
             return self.index.unknown
+        if self._cached_resolve is not None:
+            return self._cached_resolve(term)
+        return self._resolve(term)
+
+    def replace_index(self, index: LookupIndex) -> None:
+        """
+        Swap in a new LookupIndex (e.g. after ``LookupIndex.apply_delta``).
+
+        The result cache is cleared and, if the fuzzy tier is enabled, its
+        index is rebuilt for the new keys. Lookups racing with the swap
+        resolve against either the old or the new index.
+        """
+        fuzzy = (
+            index.fuzzy_index(max_edit_distance=self._fuzzy.max_edit_distance, prefix_length=self._fuzzy.prefix_length)
+            if self._fuzzy is not None
+            else None
+        )
+        self.index = index
+        self._fuzzy = fuzzy
+        self.cache_clear()
+
+    def cache_info(self) -> functools._CacheInfo | None:
+        """Return hit/miss/size counters for the result cache, or None if disabled."""
+        if self._cached_resolve is None:
+            return None
+        return self._cached_resolve.cache_info()
 
+    def cache_clear(self) -> None:
+        """Drop all cached results (e.g. after the underlying index changes)."""
+        if self._cached_resolve is not None:
+            self._cached_resolve.cache_clear()
+
+    def _resolve(self, term: str) -> int | None:
         key = self._normalizer(term)
         hit = self.index.mapping.get(key)
         if hit is not None:
             return hit
 
+        hit = self._lookup_corrected(term)
+        if hit is not None:
+            return hit
+
+        hit = self._lookup_fuzzy(key)
+        if hit is not None:
+            return hit
+
+        return self.index.unknown
+
+    def _lookup_corrected(self, term: str) -> int | None:
+        """Try each correction in order; return the first hit or None."""
         for corr in self._corrections:
             key2 = self._normalizer(corr(term))
             hit = self.index.mapping.get(key2)
             if hit is not None:
                 return hit
+        return None
 
-        return self.index.unknown
+    def _lookup_fuzzy(self, key: str) -> int | None:
+        if self._fuzzy is None:
+            return None
+        match = self._fuzzy.best_match(key, threshold=self._fuzzy_threshold or 0.0)
+        return self.index.mapping.get(match.key) if match is not None else None
+
+    def match_fuzzy(self, term: str | None) -> FuzzyMatch | None:
+        """
+        Return the approximate match for ``term`` without resolving it.
+
+        Useful for reviewing what the fuzzy tier would map a term to. Returns
+        None if the tier is disabled or nothing clears the threshold.
+        """
+        if not term or self._fuzzy is None:
+            return None
+        return self._fuzzy.best_match(self._normalizer(term), threshold=self._fuzzy_threshold or 0.0)
+
+    def lookup_many(self, terms: Iterable[str | None]) -> BatchLookupResult:
+        """
+        Resolve a batch of terms, returning IDs aligned with the input.
+
+        Accepts any iterable of strings, a ``pandas.Series`` or a
+        ``pyarrow.Array``/``ChunkedArray``. Inputs are deduplicated first, so
+        the normaliser runs once per distinct value (vectorised with
+        ``str.strip().str.lower()`` when the normaliser is
+        ``normalize_default``), and corrections and the fuzzy tier only run for distinct
+        values that missed the direct lookup. Results are identical to
+        calling ``lookup`` on every element.
+        """
+        import numpy as np
+        import pandas as pd
+
+        kind = "list"
+        index = None
+        if isinstance(terms, pd.Series):
+            kind, index, values = "series", terms.index, terms
+        elif isinstance(terms, _ArrowLike) and type(terms).__module__.startswith("pyarrow"):
+            kind, values = "arrow", terms.to_pandas()
+        else:
+            values = pd.Series(list(terms), dtype=object)
+
+        codes, uniques = pd.factorize(values, use_na_sentinel=True)
+        raw = pd.Series(uniques, dtype=object)
+        present = raw.map(bool).to_numpy(dtype=bool)
+
+        if self._normalizer is normalize_default and pd.api.types.infer_dtype(raw, skipna=True) in ("string", "empty"):
+            keys = raw.str.strip().str.lower()
+        else:
+            keys = pd.Series(
+                [self._normalizer(t) if ok else None for t, ok in zip(raw, present)],
+                dtype=object,
+            )
+
+        mapping = self.index.mapping
+        resolved: list[int | None] = [None] * len(raw)
+        # 0 = miss, 1 = direct hit, 2 = correction hit, 3 = fuzzy hit
+        status = np.zeros(len(raw) + 1, dtype=np.int8)
+        for i, (term, key, ok) in enumerate(zip(raw, keys, present)):
+            if not ok:
+                continue
+            hit = mapping.get(key)
+            if hit is not None:
+                resolved[i], status[i] = hit, 1
+                continue
+            hit = self._lookup_corrected(term)
+            if hit is not None:
+                resolved[i], status[i] = hit, 2
+                continue
+            hit = self._lookup_fuzzy(key)
+            if hit is not None:
+                resolved[i], status[i] = hit, 3
+
+        unknown = self.index.unknown
+        per_unique = [unknown if cid is None else cid for cid in resolved] + [unknown]
+        # na sentinel (-1) points at the trailing "unknown"/miss slot
+        row_codes = np.where(codes < 0, len(raw), codes)
+        concept_ids = [per_unique[c] for c in row_codes]
+
+        counts = np.bincount(status[row_codes], minlength=4)
+        stats = LookupStats(
+            total=len(row_codes),
+            unique=len(raw),
+            hits=int(counts[1]),
+            correction_hits=int(counts[2]),
+            misses=int(counts[0]),
+            fuzzy_hits=int(counts[3]),
+        )
+
+        if kind == "series":
+            out: Any = pd.Series(concept_ids, index=index, dtype="Int64", name=getattr(terms, "name", None))
+        elif kind == "arrow":
+            import pyarrow as pa
+            out = pa.array(concept_ids, type=pa.int64())
+        else:
+            out = concept_ids
+        return BatchLookupResult(concept_ids=out, stats=stats)
 
     def lookup_exact(self, term: str | None) -> int | None:
         if not term:
@@ -375,21 +1204,24 @@ class ConceptResolver:
 
     def __contains__(self, item: str | int) -> bool:
         if isinstance(item, int):
-            return item in self.index.mapping.values()
+            return item in self.index
         if isinstance(item, str):
             return self.lookup(item) != self.index.unknown
         return False
 
     @property
-    def all_concepts(self) -> set[int]:
-        return set(self.index.mapping.values())
+    def all_concepts(self) -> AbstractSet[int]:
+        return self.index.all_concepts
     
 
     def __repr__(self) -> str:
+        info = self.cache_info()
         return (
             f"<ConceptResolver name={self.index.name!r} "
             f"concepts={len(self.all_concepts)} "
-            f"corrections={len(self._corrections)}>"
+            f"corrections={len(self._corrections)}"
+            + (f" cache={info.currsize}" if info is not None else "")
+            + ">"
         )
 
 
@@ -410,6 +1242,8 @@ def make_concept_resolver(
     build_normalizer: Normaliser = normalize_default,
     runtime_normalizer: Normaliser | None = None,
     corrections: list[Callable[[str], str]] | None = None,
+    cache_size: int | None = None,
+    collision_policy: CollisionPolicy = "last_wins",
 ) -> ConceptResolver:
     """
     Convenience factory for constructing a ConceptResolver from declarative inputs.
@@ -461,6 +1295,11 @@ def make_concept_resolver(
     corrections:
         Optional ordered list of correction functions applied to the raw input term prior 
         to normalisation and lookup
+    cache_size:
+        Optional bound on the resolver's LRU result cache. ``None`` disables caching.
+    collision_policy:
+        How keys produced by more than one concept are resolved; see
+        ``LookupSpec.collision_policy``.
     """
 
     spec = LookupSpec(
@@ -476,6 +1315,7 @@ def make_concept_resolver(
         include_synonyms=include_synonyms,
         normalizer=build_normalizer,
         include=include,
+        collision_policy=collision_policy,
     )
 
     index = OMOPConceptSource.build_lookup(session, spec)
@@ -484,4 +1324,5 @@ def make_concept_resolver(
         index,
         normalizer=runtime_normalizer or build_normalizer,
         corrections=corrections,
+        cache_size=cache_size,
     )
@@ -15,3 +15,4 @@ class ConceptRow:
     concept_class_id: str | None
     vocabulary_id: str | None
     standard_concept: str | None
+    invalid_reason: str | None = None
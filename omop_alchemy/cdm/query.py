@@ -5,13 +5,79 @@ Consolidates filtering logic previously duplicated across downstream packages
 
 from __future__ import annotations
 
+from collections.abc import Iterable
 from dataclasses import dataclass
-from typing import Optional
+from typing import Any, Optional
 
 import sqlalchemy as sa
+import sqlalchemy.orm as so
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.ext.compiler import compiles
 
 from omop_alchemy.cdm.model.vocabulary import Concept
 
+# above this many ids, ``id_in`` stops emitting one bind parameter per id
+LARGE_IN_THRESHOLD = 1_000
+
+
+class _LargeIdList(sa.sql.expression.ColumnElement[bool]):
+    """``column IN ids`` for id lists too large for one bind parameter each."""
+
+    type = sa.Boolean()
+    # the ids are baked into the rendered SQL or a single array parameter;
+    # caching such statements would only fill the cache with one-off entries
+    inherit_cache = False
+
+    def __init__(self, column: sa.ColumnElement[Any], ids: tuple[int, ...]):
+        self.column = column
+        self.ids = ids
+
+
+@compiles(_LargeIdList)
+def _compile_large_id_list(element: _LargeIdList, compiler, **kw) -> str:
+    # integers are safe to inline, which sidesteps driver parameter limits
+    # (e.g. SQLite's 32766) and per-parameter binding overhead
+    ids = sa.bindparam(None, list(element.ids), expanding=True, literal_execute=True)
+    return compiler.process(element.column.in_(ids), **kw)
+
+
+@compiles(_LargeIdList, "postgresql")
+def _compile_large_id_list_pg(element: _LargeIdList, compiler, **kw) -> str:
+    # one array parameter: constant SQL text, and no planner cost per literal
+    ids = sa.bindparam(None, list(element.ids), type_=postgresql.ARRAY(sa.BigInteger))
+    return compiler.process(element.column == sa.any_(ids), **kw)
+
+
+def id_in(
+    column: sa.ColumnElement[Any] | so.InstrumentedAttribute[Any],
+    ids: Iterable[int],
+    *,
+    threshold: int = LARGE_IN_THRESHOLD,
+) -> sa.ColumnElement[bool]:
+    """Return ``column IN ids``, switching strategy for large id lists.
+
+    Up to ``threshold`` distinct ids this is a plain ``IN``. Above it, the
+    ids are bound as a single array (``column = ANY(:ids)``) on PostgreSQL,
+    and rendered inline as integer literals on other backends, so the
+    statement neither hits bind-parameter limits nor spends its time
+    compiling and planning hundreds of thousands of parameters.
+
+    Parameters
+    ----------
+    column : sqlalchemy.ColumnElement or mapped attribute
+        Integer column to test, e.g. ``Concept.concept_id``.
+    ids : Iterable[int]
+        Ids to match. Duplicates are removed.
+    threshold : int
+        Largest list rendered as a plain ``IN``.
+    """
+    if isinstance(column, so.InstrumentedAttribute):
+        column = column.__clause_element__()
+    unique = tuple(dict.fromkeys(int(i) for i in ids))
+    if len(unique) <= threshold:
+        return column.in_(unique)
+    return _LargeIdList(column, unique)
+
 
 @dataclass(frozen=True)
 class ConceptFilter:
@@ -22,7 +88,8 @@ class ConceptFilter:
     Attributes
     ----------
     concept_ids : tuple[int, ...], optional
-        Restrict results to this set of concept IDs.
+        Restrict results to this set of concept IDs. Large sets are matched
+        with an array parameter rather than an ``IN`` list (see ``id_in``).
     domains : tuple[str, ...], optional
         Restrict results to concepts in these OMOP domains.
     vocabularies : tuple[str, ...], optional
@@ -56,7 +123,7 @@ class ConceptFilter:
     def apply(self, query: sa.Select) -> sa.Select:
         """Apply filter constraints to a Select already targeting Concept."""
         if self.concept_ids is not None:
-            query = query.where(Concept.concept_id.in_(self.concept_ids))
+            query = query.where(id_in(Concept.concept_id, self.concept_ids))
 
         if self.domains is not None:
             query = query.where(Concept.domain_id.in_(self.domains))
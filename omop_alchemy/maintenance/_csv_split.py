@@ -0,0 +1,168 @@
+"""Byte-range splitting of large Athena CSVs for concurrent PostgreSQL COPY streams."""
+
+from __future__ import annotations
+
+import io
+import os
+import re
+from dataclasses import dataclass
+from itertools import pairwise
+from pathlib import Path
+from typing import Any, BinaryIO
+
+from orm_loader.loaders.loading_helpers import (
+    check_line_ending,
+    infer_delim,
+    infer_encoding,
+    resolve_quote_mode,
+)
+
+COPY_BLOCK_SIZE = 1 << 20
+
+_SAFE_ENCODING = re.compile(r"^[A-Za-z][A-Za-z0-9_-]*$")
+
+
+@dataclass(frozen=True)
+class CsvSplitPlan:
+    """How to COPY the body of one CSV in independent byte ranges.
+
+    Only produced for files where a newline byte always ends a record:
+    input that resolves to the literal quote mode, whatever its delimiter
+    (in csv mode a quoted field may embed a newline, tab-delimited or not),
+    in an ASCII-compatible encoding, so a b"\\n" can never be part of a
+    multi-byte character.
+    """
+
+    path: Path
+    columns: tuple[str, ...]
+    delimiter: str
+    encoding: str
+    quote_mode: str
+    body_start: int
+    size: int
+
+
+def plan_csv_split(path: Path, *, quote_mode: str = "auto") -> CsvSplitPlan | None:
+    """Return a split plan for path, or None if its records cannot be split on newlines."""
+    encoding = infer_encoding(path)["encoding"] or "utf-8"
+    if not _SAFE_ENCODING.match(encoding):
+        return None
+    try:
+        if "\n".encode(encoding) != b"\n":
+            return None
+    except LookupError:
+        return None
+    delimiter = infer_delim(path)
+    # Resolved exactly as the single-stream load would, so every range is
+    # parsed the same way the whole file would have been.
+    resolved_quote_mode = resolve_quote_mode(quote_mode, path, delimiter, encoding)
+    if resolved_quote_mode != "literal":
+        return None
+
+    with open(path, "rb") as f:
+        raw_header = f.readline()
+        body_start = f.tell()
+    header = raw_header.decode(encoding)
+    # Same header normalisation as orm-loader's own COPY path: lower-case and
+    # map *_hash columns onto their base names.
+    columns = tuple(
+        c.strip().lower().replace("_hash", "")
+        for c in header.rstrip(check_line_ending(header)).split(delimiter)
+    )
+    return CsvSplitPlan(
+        path=path,
+        columns=columns,
+        delimiter=delimiter,
+        encoding=encoding,
+        quote_mode=resolved_quote_mode,
+        body_start=body_start,
+        size=os.path.getsize(path),
+    )
+
+
+def csv_byte_ranges(plan: CsvSplitPlan, parts: int) -> list[tuple[int, int]]:
+    """Split the CSV body into at most parts half-open byte ranges that each start at a record.
+
+    Each nominal cut point is moved forward to just past the next newline,
+    so no record straddles two ranges. Ranges that collapse to nothing (a
+    single very long record, or more parts than records) are dropped.
+    """
+    body = plan.size - plan.body_start
+    if parts <= 1 or body <= 0:
+        return [(plan.body_start, plan.size)] if body > 0 else []
+
+    cuts = [plan.body_start]
+    with open(plan.path, "rb") as f:
+        for i in range(1, parts):
+            nominal = plan.body_start + body * i // parts
+            if nominal <= cuts[-1]:
+                continue
+            f.seek(nominal - 1)
+            # reading from nominal - 1 keeps a cut that already sits on a record start
+            f.readline()
+            cuts.append(min(f.tell(), plan.size))
+    cuts.append(plan.size)
+    return [(start, end) for start, end in pairwise(cuts) if end > start]
+
+
+class CsvRangeStream(io.RawIOBase):
+    """Read bytes [start, end) of a file with line endings normalised to LF.
+
+    A CR at the end of one block is held back until the next block is read,
+    so a CRLF split across two reads is not turned into two newlines.
+    """
+
+    def __init__(self, f: BinaryIO, start: int, end: int):
+        self._f = f
+        self._remaining = end - start
+        self._pending_cr = False
+        f.seek(start)
+
+    def readable(self) -> bool:
+        return True
+
+    def read(self, size: int = -1) -> bytes:
+        want = self._remaining if size is None or size < 0 else min(size, self._remaining)
+        chunk = self._f.read(want) if want > 0 else b""
+        self._remaining -= len(chunk)
+        if self._pending_cr:
+            chunk = b"\r" + chunk
+            self._pending_cr = False
+        if chunk.endswith(b"\r") and self._remaining > 0:
+            chunk = chunk[:-1]
+            self._pending_cr = True
+            if not chunk:
+                # an empty read would signal EOF; fetch past the held-back CR
+                return self.read(size)
+        return chunk.replace(b"\r\n", b"\n").replace(b"\r", b"\n")
+
+
+def copy_csv_range(
+    dbapi_connection: Any,
+    plan: CsvSplitPlan,
+    *,
+    table_ref: str,
+    start: int,
+    end: int,
+) -> int:
+    """COPY one byte range of the CSV body into table_ref. Returns the number of rows copied."""
+    columns = ", ".join(f'"{c}"' for c in plan.columns)
+    # Same COPY options as orm-loader's single-stream path, minus HEADER: the
+    # header line lies outside every range. In literal mode \x01 never occurs
+    # in the data, so double quotes are ordinary characters.
+    quoting = ", QUOTE E'\\x01', ESCAPE E'\\x01'" if plan.quote_mode == "literal" else ""
+    sql = (
+        f"COPY {table_ref} ({columns}) FROM STDIN WITH ("
+        f"FORMAT csv, HEADER false, DELIMITER E'{plan.delimiter}'{quoting}, "
+        f"ENCODING '{plan.encoding}')"
+    )
+    cursor = dbapi_connection.cursor()
+    try:
+        with open(plan.path, "rb") as f:
+            stream = CsvRangeStream(f, start, end)
+            with cursor.copy(sql) as copy:
+                while data := stream.read(COPY_BLOCK_SIZE):
+                    copy.write(data)
+        return int(cursor.rowcount)
+    finally:
+        cursor.close()
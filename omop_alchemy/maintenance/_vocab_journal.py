@@ -0,0 +1,243 @@
+"""Persisted per-table journal of Athena vocabulary loads, used to resume interrupted runs."""
+
+from __future__ import annotations
+
+import hashlib
+from dataclasses import dataclass
+from enum import StrEnum
+from pathlib import Path
+
+import sqlalchemy as sa
+
+from ..backends import backend_supports, resolve_backend
+from ._cli_utils import ReservedSchema
+
+_LOAD_JOURNAL_TABLE_NAME = "vocab_load_journal"
+# Journal row present while a bulk-mode load has indexes dropped or FK
+# triggers disabled; not a table name, so it never collides with one.
+_BULK_MODE_MARKER = "__bulk_mode__"
+
+
+class JournalStatus(StrEnum):
+    """Lifecycle of one table's entry in the load journal (and the status of the bulk-mode marker)."""
+
+    STARTED = "started"
+    LOADED = "loaded"
+    FAILED = "failed"
+    BULK_IN_PROGRESS = "bulk_in_progress"
+
+
+@dataclass(frozen=True)
+class CsvFingerprint:
+    """Size, modification time and content hash of one Athena CSV."""
+
+    size: int
+    mtime_ns: int
+    sha256: str
+
+    def same_content(self, other: CsvFingerprint | None) -> bool:
+        """True if other describes byte-identical content.
+
+        mtime is recorded for reference only: re-extracting the same Athena
+        download gives every file a new mtime without changing a byte. A
+        fingerprint whose content was never hashed matches nothing.
+        """
+        return (
+            other is not None
+            and bool(self.sha256)
+            and self.size == other.size
+            and self.sha256 == other.sha256
+        )
+
+
+def stat_csv(path: Path) -> CsvFingerprint:
+    """Fingerprint path from its metadata alone, leaving sha256 empty."""
+    stat = path.stat()
+    return CsvFingerprint(size=stat.st_size, mtime_ns=stat.st_mtime_ns, sha256="")
+
+
+def fingerprint_csv(path: Path) -> CsvFingerprint:
+    """Fingerprint path, hashing its content in one streaming pass."""
+    stat = path.stat()
+    with open(path, "rb") as f:
+        digest = hashlib.file_digest(f, "sha256").hexdigest()
+    return CsvFingerprint(size=stat.st_size, mtime_ns=stat.st_mtime_ns, sha256=digest)
+
+
+@dataclass(frozen=True)
+class LoadJournalEntry:
+    """The most recent journal record for one vocabulary table."""
+
+    table_name: str
+    status: JournalStatus
+    csv_path: str
+    fingerprint: CsvFingerprint
+    merge_strategy: str
+    row_count: int | None
+    detail: str | None
+
+
+def _journal_schema(engine: sa.Engine) -> str | None:
+    """The reserved staging schema on backends with named schemas, else None (SQLite)."""
+    if backend_supports(resolve_backend(engine), "ensure_schema"):
+        return ReservedSchema.STAGING.value
+    return None
+
+
+def _load_journal_table(journal_schema: str | None) -> sa.Table:
+    """Build the load journal table definition.
+
+    One row per (table_name, db_schema): each load overwrites the previous
+    record for its table. db_schema is stored as "" when None so the unique
+    constraint also holds where NULLs would compare distinct.
+    """
+    metadata = sa.MetaData()
+    return sa.Table(
+        _LOAD_JOURNAL_TABLE_NAME,
+        metadata,
+        sa.Column("table_name", sa.String(128), primary_key=True),
+        sa.Column("db_schema", sa.String(128), primary_key=True),
+        sa.Column("status", sa.String(16), nullable=False),
+        sa.Column("csv_path", sa.Text, nullable=False),
+        sa.Column("csv_size", sa.BigInteger, nullable=False),
+        sa.Column("csv_mtime_ns", sa.BigInteger, nullable=False),
+        sa.Column("csv_sha256", sa.String(64), nullable=False),
+        sa.Column("merge_strategy", sa.String(32), nullable=False),
+        sa.Column("row_count", sa.BigInteger),
+        sa.Column("detail", sa.Text),
+        sa.Column("updated_at", sa.DateTime, server_default=sa.func.now(), nullable=False),
+        schema=journal_schema,
+    )
+
+
+def ensure_load_journal(engine: sa.Engine) -> None:
+    """Create the load journal table if it does not exist yet.
+
+    Called once before any table is loaded, so concurrent workers recording
+    their progress never race to create it.
+    """
+    with engine.begin() as connection:
+        _load_journal_table(_journal_schema(engine)).create(bind=connection, checkfirst=True)
+
+
+def read_load_journal(engine: sa.Engine, *, db_schema: str | None) -> dict[str, LoadJournalEntry]:
+    """Return the journal entries recorded for db_schema, keyed by table name. Empty if never journaled."""
+    journal_schema = _journal_schema(engine)
+    with engine.connect() as connection:
+        if not sa.inspect(connection).has_table(_LOAD_JOURNAL_TABLE_NAME, schema=journal_schema):
+            return {}
+        journal = _load_journal_table(journal_schema)
+        rows = connection.execute(
+            sa.select(journal).where(
+                journal.c.db_schema == (db_schema or ""),
+                journal.c.table_name != _BULK_MODE_MARKER,
+            )
+        )
+        return {
+            row.table_name: LoadJournalEntry(
+                table_name=row.table_name,
+                status=JournalStatus(row.status),
+                csv_path=row.csv_path,
+                fingerprint=CsvFingerprint(
+                    size=row.csv_size,
+                    mtime_ns=row.csv_mtime_ns,
+                    sha256=row.csv_sha256,
+                ),
+                merge_strategy=row.merge_strategy,
+                row_count=row.row_count,
+                detail=row.detail,
+            )
+            for row in rows
+        }
+
+
+def record_load_journal(
+    engine: sa.Engine,
+    *,
+    table_name: str,
+    db_schema: str | None,
+    status: JournalStatus,
+    csv_path: Path,
+    fingerprint: CsvFingerprint,
+    merge_strategy: str,
+    row_count: int | None = None,
+    detail: str | None = None,
+) -> None:
+    """Replace the journal entry of table_name in its own short transaction."""
+    _replace_journal_row(
+        engine,
+        {
+            "table_name": table_name,
+            "db_schema": db_schema or "",
+            "status": str(status),
+            "csv_path": str(csv_path),
+            "csv_size": fingerprint.size,
+            "csv_mtime_ns": fingerprint.mtime_ns,
+            "csv_sha256": fingerprint.sha256,
+            "merge_strategy": merge_strategy,
+            "row_count": row_count,
+            "detail": detail,
+        },
+    )
+
+
+def begin_bulk_mode(engine: sa.Engine, *, db_schema: str | None) -> None:
+    """Record that a bulk-mode load is about to drop indexes and disable FK triggers.
+
+    Call before touching either, and clear with end_bulk_mode only once both
+    are restored: if the process dies in between, the row survives and the
+    next load knows to restore them on every vocabulary table.
+    """
+    _replace_journal_row(
+        engine,
+        {
+            "table_name": _BULK_MODE_MARKER,
+            "db_schema": db_schema or "",
+            "status": str(JournalStatus.BULK_IN_PROGRESS),
+            "csv_path": "",
+            "csv_size": 0,
+            "csv_mtime_ns": 0,
+            "csv_sha256": "",
+            "merge_strategy": "",
+        },
+    )
+
+
+def end_bulk_mode(engine: sa.Engine, *, db_schema: str | None) -> None:
+    """Clear the marker written by begin_bulk_mode."""
+    journal = _load_journal_table(_journal_schema(engine))
+    with engine.begin() as connection:
+        connection.execute(
+            journal.delete().where(
+                journal.c.table_name == _BULK_MODE_MARKER,
+                journal.c.db_schema == (db_schema or ""),
+            )
+        )
+
+
+def bulk_mode_interrupted(engine: sa.Engine, *, db_schema: str | None) -> bool:
+    """True if a bulk-mode load into db_schema began and never restored its indexes and FK triggers."""
+    journal_schema = _journal_schema(engine)
+    with engine.connect() as connection:
+        if not sa.inspect(connection).has_table(_LOAD_JOURNAL_TABLE_NAME, schema=journal_schema):
+            return False
+        journal = _load_journal_table(journal_schema)
+        row = connection.execute(
+            sa.select(journal.c.table_name).where(
+                journal.c.table_name == _BULK_MODE_MARKER,
+                journal.c.db_schema == (db_schema or ""),
+            )
+        ).first()
+        return row is not None
+
+
+def _replace_journal_row(engine: sa.Engine, values: dict[str, object]) -> None:
+    journal = _load_journal_table(_journal_schema(engine))
+    with engine.begin() as connection:
+        connection.execute(
+            journal.delete().where(
+                journal.c.table_name == values["table_name"],
+                journal.c.db_schema == values["db_schema"],
+            )
+        )
+        connection.execute(journal.insert(), values)
@@ -3,7 +3,10 @@
 from __future__ import annotations
 
 import json
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
 from dataclasses import dataclass
+from functools import partial
 from typing import Any, Mapping, Sequence
 
 import sqlalchemy as sa
@@ -47,6 +50,7 @@ class IndexManagementResult(IndexTarget):
     enable: bool
     status: Status
     detail: str
+    duration_seconds: float | None = None
 
 
 def _is_plain_index(reflected: Mapping[str, Any]) -> bool:
@@ -664,6 +668,207 @@ class _IndexOutcome:
     physical_name: str
 
 
+@dataclass(frozen=True)
+class _IndexJob:
+    """One ORM-defined index that manage_indexes() has to create or drop.
+
+    Captures everything reflected for the index up front, so the job can run
+    on any worker connection independently of the table loop.
+    """
+
+    table_name: str
+    index_name: str
+    column_names: tuple[str, ...]
+    unique: bool
+    exists: bool
+    schema_index: sa.Index
+    existing_indexes: list[Any]
+
+
+def _apply_index_job(
+    engine: sa.Engine,
+    backend: Backend,
+    job: _IndexJob,
+    *,
+    enable: bool,
+    db_schema: str | None,
+    dry_run: bool,
+    session_settings: Mapping[str, Any],
+) -> tuple[_IndexOutcome, bool, float | None]:
+    """Create or drop one index on its own connection.
+
+    Returns the outcome, whether a new index was physically built (so the
+    table needs ANALYZE), and the wall time spent (None for dry runs).
+    """
+    index_name = job.index_name
+    column_names = job.column_names
+    unique = job.unique
+    exists = job.exists
+    existing_indexes = job.existing_indexes
+    schema_index = job.schema_index
+    created = False
+    started = time.perf_counter()
+
+    # Plain create/drop succeeding is the common case for both live and
+    # dry runs, so it's the default outcome; every branch below only
+    # overrides it for a foreign-index or already-in-place case.
+    outcome = _IndexOutcome(
+        status=dry_status(dry_run),
+        detail=dry_label(
+            dry_run,
+            planned="metadata-defined index would be dropped" if not enable else "metadata-defined index would be created",
+            applied="metadata-defined index dropped" if not enable else "metadata-defined index created",
+        ),
+        physical_name=index_name,
+    )
+
+    # Each index gets its own connection: a transaction when actually
+    # mutating (not dry_run, so WAL is committed and checkpointable
+    # before the next index build begins), a plain read-only
+    # connection when only previewing.
+    connection_factory = engine.begin if not dry_run else engine.connect
+    with connection_factory() as connection:
+        if enable and not dry_run:
+            backend.configure_index_build_session(connection, **session_settings)
+        if not enable:
+            if not dry_run:
+                existed_before_drop = backend.index_exists(connection, index_name, db_schema)
+            else:
+                existed_before_drop = exists
+            if not existed_before_drop:
+                # Index under a different naming scheme than ours
+                equivalent_name = _find_equivalent_index(existing_indexes, column_names, unique)
+                if equivalent_name is not None:
+                    if not dry_run:
+                        captured = _record_captured_index(
+                            connection, backend,
+                            table_name=job.table_name, db_schema=db_schema,
+                            index_name=equivalent_name,
+                            column_names=column_names, unique=unique,
+                        )
+                    else:
+                        pending_capture, _, _ = _peek_captured_index(
+                            connection, backend,
+                            table_name=job.table_name, db_schema=db_schema,
+                            column_names=column_names, unique=unique,
+                        )
+                        captured = pending_capture is None
+                    if captured:
+                        if not dry_run:
+                            backend.drop_index_if_exists(connection, equivalent_name, db_schema)
+                        outcome = _IndexOutcome(
+                            status=dry_status(dry_run, Status.CAPTURED),
+                            detail=dry_label(
+                                dry_run,
+                                planned=f"foreign index '{equivalent_name}' would be captured and dropped for bulk load",
+                                applied=f"foreign index '{equivalent_name}' captured and dropped for bulk load",
+                            ),
+                            physical_name=equivalent_name,
+                        )
+                    else:
+                        # A different foreign index for this table/column-set is
+                        # already captured and awaiting restore. Leave this one
+                        # in place rather than dropping something we can no
+                        # longer track.
+                        outcome = _IndexOutcome(
+                            status=Status.WARNING,
+                            detail=dry_label(
+                                dry_run,
+                                planned=(
+                                    f"foreign index '{equivalent_name}' would be left in place: a different "
+                                    "foreign index for this table/column-set is already captured and "
+                                    "awaiting restore"
+                                ),
+                                applied=(
+                                    f"foreign index '{equivalent_name}' left in place: a different "
+                                    "foreign index for this table/column-set is already captured and "
+                                    "awaiting restore"
+                                ),
+                            ),
+                            physical_name=equivalent_name,
+                        )
+                else:
+                    conflict = _find_shape_conflict(existing_indexes, column_names, unique)
+                    if conflict is not None:
+                        conflict_name = str(conflict["name"])
+                        outcome = _IndexOutcome(
+                            status=Status.WARNING,
+                            detail=dry_label(
+                                dry_run,
+                                planned=f"foreign index '{conflict_name}' {_describe_shape_conflict(conflict)}; would be left in place",
+                                applied=f"foreign index '{conflict_name}' {_describe_shape_conflict(conflict)}; left in place",
+                            ),
+                            physical_name=conflict_name,
+                        )
+                    else:
+                        outcome = _IndexOutcome(
+                            status=Status.SKIPPED,
+                            detail="metadata-defined index already absent (skipped)",
+                            physical_name=index_name,
+                        )
+            elif not dry_run:
+                backend.drop_index_if_exists(connection, index_name, db_schema)
+                # outcome stays default: applied / "metadata-defined index dropped"
+            # dry-run, existed_before_drop True: outcome stays default ("would be dropped")
+        else:
+            if not dry_run:
+                restored_name = _restore_captured_index(
+                    connection, backend,
+                    table_name=job.table_name, db_schema=db_schema,
+                    column_names=column_names, unique=unique,
+                )
+            else:
+                restored_name, _, _ = _peek_captured_index(
+                    connection, backend,
+                    table_name=job.table_name, db_schema=db_schema,
+                    column_names=column_names, unique=unique,
+                )
+            if restored_name is not None:
+                if not dry_run:
+                    created = True
+                outcome = _IndexOutcome(
+                    status=dry_status(dry_run, Status.RESTORED),
+                    detail=dry_label(
+                        dry_run,
+                        planned=f"foreign index '{restored_name}' would be restored from bulk-load capture",
+                        applied=f"foreign index '{restored_name}' restored from bulk-load capture",
+                    ),
+                    physical_name=restored_name,
+                )
+            else:
+                equivalent_name = _find_equivalent_index(existing_indexes, column_names, unique)
+                if equivalent_name is not None:
+                    outcome = _IndexOutcome(
+                        status=Status.SKIPPED,
+                        detail=dry_label(
+                            dry_run,
+                            planned=f"equivalent foreign index '{equivalent_name}' already provides this coverage (would skip creation)",
+                            applied=f"equivalent foreign index '{equivalent_name}' already provides this coverage (skipped)",
+                        ),
+                        physical_name=equivalent_name,
+                    )
+                elif not dry_run:
+                    savepoint = connection.begin_nested()
+                    try:
+                        schema_index.create(bind=connection, checkfirst=True)
+                    except DBAPIError as exc:
+                        savepoint.rollback()
+                        if "already exists" not in str(exc.orig).lower():
+                            raise
+                        outcome = _IndexOutcome(
+                            status=Status.SKIPPED,
+                            detail="metadata-defined index already exists (skipped)",
+                            physical_name=index_name,
+                        )
+                    else:
+                        savepoint.commit()
+                        created = True
+                        # outcome stays default: applied / "metadata-defined index created"
+                # dry-run, no restore, no equivalent: outcome stays default ("would be created")
+
+    return outcome, created, None if dry_run else time.perf_counter() - started
+
+
 def manage_indexes(
     engine: sa.Engine,
     *,
@@ -672,281 +877,191 @@ def manage_indexes(
     vocabulary_included: bool = False,
     dry_run: bool = False,
     cluster: bool = True,
+    parallel: int = 1,
+    maintenance_work_mem: str | None = None,
+    max_parallel_maintenance_workers: int | None = None,
+    tables: Sequence[str] | None = None,
 ) -> list[IndexManagementResult]:
-    """Create or drop all ORM-defined indexes. CLUSTERs tables when enabling and cluster=True."""
+    """Create or drop all ORM-defined indexes. CLUSTERs tables when enabling and cluster=True.
+
+    tables restricts the run to those table names within the selection, e.g.
+    to the vocabulary tables a load is about to rewrite.
+
+    When enabling with parallel > 1 on a backend that supports concurrent
+    index builds, up to that many indexes are built at once, each on its own
+    connection; a table is clustered and analyzed as soon as all of its own
+    indexes are in place. maintenance_work_mem and
+    max_parallel_maintenance_workers are applied per build transaction, so
+    the server-wide memory used is roughly parallel x maintenance_work_mem.
+    """
     reject_reserved_schema(db_schema)
+    if parallel < 1:
+        raise ValueError(f"parallel must be at least 1, got {parallel}")
     backend = resolve_backend(engine)
     inspector = sa.inspect(engine)
     selected_tables = select_omop_tables(vocabulary_included=vocabulary_included)
+    if tables is not None:
+        wanted = set(tables)
+        selected_tables = [table for table in selected_tables if table.table_name in wanted]
     metadata_indexes = _schema_metadata_indexes(selected_tables, db_schema)
     clustering_supported = backend_supports(backend, "cluster_table")
+    session_settings = {
+        "maintenance_work_mem": maintenance_work_mem,
+        "max_parallel_maintenance_workers": max_parallel_maintenance_workers,
+    }
+    workers = parallel if enable and not dry_run and backend.supports_concurrent_index_builds else 1
+    apply_job = partial(
+        _apply_index_job,
+        engine,
+        backend,
+        enable=enable,
+        db_schema=db_schema,
+        dry_run=dry_run,
+        session_settings=session_settings,
+    )
 
+    # Reflect every table and work out its index jobs first. With a pool, all
+    # jobs are submitted straight away so builds on later tables overlap with
+    # the cluster/analyze of earlier ones.
+    pool = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="index-build") if workers > 1 else None
+    planned: list[tuple[MaintenanceTable, list[Any], dict[str, str], list[tuple[_IndexJob, sa.Index, Future | None]]]] = []
     results: list[IndexManagementResult] = []
 
-    for table in selected_tables:
-        if not inspector.has_table(table.table_name, schema=db_schema):
-            continue
-
-        existing_indexes = inspector.get_indexes(table.table_name, schema=db_schema)
-        existing_index_names = {index["name"] for index in existing_indexes}
-
-        created_any = False
-        clustered_now = False
-        physical_index_names: dict[str, str] = {}
+    try:
+        for table in selected_tables:
+            if not inspector.has_table(table.table_name, schema=db_schema):
+                continue
 
-        for metadata_index in sorted(table.table.indexes, key=lambda idx: idx.name or ""):
-            index_name = str(metadata_index.name)
-            column_names = tuple(column.name for column in metadata_index.columns)
-            unique = bool(metadata_index.unique)
-            exists = index_name in existing_index_names
-            should_apply = (
-                not enable
-            ) or (
-                enable and not exists
-            )
+            existing_indexes = inspector.get_indexes(table.table_name, schema=db_schema)
+            existing_index_names = {index["name"] for index in existing_indexes}
+            physical_index_names: dict[str, str] = {}
+            jobs: list[tuple[_IndexJob, sa.Index, Future | None]] = []
+
+            for metadata_index in sorted(table.table.indexes, key=lambda idx: idx.name or ""):
+                index_name = str(metadata_index.name)
+                exists = index_name in existing_index_names
+                should_apply = (
+                    not enable
+                ) or (
+                    enable and not exists
+                )
 
-            if not should_apply:
-                physical_index_names[index_name] = index_name
-                continue
+                if not should_apply:
+                    physical_index_names[index_name] = index_name
+                    continue
 
-            schema_index = metadata_indexes[(table.table_name, index_name)]
-            # Plain create/drop succeeding is the common case for both live and
-            # dry runs, so it's the default outcome; every branch below only
-            # overrides it for a foreign-index or already-in-place case.
-            outcome = _IndexOutcome(
-                status=dry_status(dry_run),
-                detail=dry_label(
-                    dry_run,
-                    planned="metadata-defined index would be dropped" if not enable else "metadata-defined index would be created",
-                    applied="metadata-defined index dropped" if not enable else "metadata-defined index created",
-                ),
-                physical_name=index_name,
-            )
+                job = _IndexJob(
+                    table_name=table.table_name,
+                    index_name=index_name,
+                    column_names=tuple(column.name for column in metadata_index.columns),
+                    unique=bool(metadata_index.unique),
+                    exists=exists,
+                    schema_index=metadata_indexes[(table.table_name, index_name)],
+                    existing_indexes=existing_indexes,
+                )
+                jobs.append((job, metadata_index, pool.submit(apply_job, job) if pool is not None else None))
+
+            planned.append((table, existing_indexes, physical_index_names, jobs))
+
+        for table, existing_indexes, physical_index_names, jobs in planned:
+            created_any = False
+            clustered_now = False
+
+            for job, metadata_index, future in jobs:
+                outcome, created, duration = future.result() if future is not None else apply_job(job)
+                created_any = created_any or created
+                physical_name = outcome.physical_name
+                physical_index_names[job.index_name] = physical_name
+                results.append(
+                    IndexManagementResult(
+                        operation="index",
+                        table_name=table.table_name,
+                        category=table.category,
+                        index_name=physical_name,
+                        column_names=job.column_names,
+                        unique=job.unique,
+                        clustered=metadata_index.info.get(OMOP_CLUSTER_INDEX_INFO_KEY) is True,
+                        enable=enable,
+                        status=outcome.status,
+                        detail=outcome.detail,
+                        duration_seconds=duration,
+                    )
+                )
 
-            # Each index gets its own connection: a transaction when actually
-            # mutating (not dry_run, so WAL is committed and checkpointable
-            # before the next index build begins), a plain read-only
-            # connection when only previewing.
-            connection_factory = engine.begin if not dry_run else engine.connect
-            with connection_factory() as connection:
-                if not enable:
-                    if not dry_run:
-                        existed_before_drop = backend.index_exists(connection, index_name, db_schema)
-                    else:
-                        existed_before_drop = exists
-                    if not existed_before_drop:
-                        # Index under a different naming scheme than ours
-                        equivalent_name = _find_equivalent_index(existing_indexes, column_names, unique)
-                        if equivalent_name is not None:
-                            if not dry_run:
-                                captured = _record_captured_index(
-                                    connection, backend,
-                                    table_name=table.table_name, db_schema=db_schema,
-                                    index_name=equivalent_name,
-                                    column_names=column_names, unique=unique,
-                                )
-                            else:
-                                pending_capture, _, _ = _peek_captured_index(
-                                    connection, backend,
-                                    table_name=table.table_name, db_schema=db_schema,
-                                    column_names=column_names, unique=unique,
-                                )
-                                captured = pending_capture is None
-                            if captured:
-                                if not dry_run:
-                                    backend.drop_index_if_exists(connection, equivalent_name, db_schema)
-                                outcome = _IndexOutcome(
-                                    status=dry_status(dry_run, Status.CAPTURED),
-                                    detail=dry_label(
-                                        dry_run,
-                                        planned=f"foreign index '{equivalent_name}' would be captured and dropped for bulk load",
-                                        applied=f"foreign index '{equivalent_name}' captured and dropped for bulk load",
-                                    ),
-                                    physical_name=equivalent_name,
-                                )
-                            else:
-                                # A different foreign index for this table/column-set is
-                                # already captured and awaiting restore. Leave this one
-                                # in place rather than dropping something we can no
-                                # longer track.
-                                outcome = _IndexOutcome(
-                                    status=Status.WARNING,
-                                    detail=dry_label(
-                                        dry_run,
-                                        planned=(
-                                            f"foreign index '{equivalent_name}' would be left in place: a different "
-                                            "foreign index for this table/column-set is already captured and "
-                                            "awaiting restore"
-                                        ),
-                                        applied=(
-                                            f"foreign index '{equivalent_name}' left in place: a different "
-                                            "foreign index for this table/column-set is already captured and "
-                                            "awaiting restore"
-                                        ),
-                                    ),
-                                    physical_name=equivalent_name,
-                                )
-                        else:
-                            conflict = _find_shape_conflict(existing_indexes, column_names, unique)
-                            if conflict is not None:
-                                conflict_name = str(conflict["name"])
-                                outcome = _IndexOutcome(
-                                    status=Status.WARNING,
-                                    detail=dry_label(
-                                        dry_run,
-                                        planned=f"foreign index '{conflict_name}' {_describe_shape_conflict(conflict)}; would be left in place",
-                                        applied=f"foreign index '{conflict_name}' {_describe_shape_conflict(conflict)}; left in place",
-                                    ),
-                                    physical_name=conflict_name,
-                                )
-                            else:
-                                outcome = _IndexOutcome(
-                                    status=Status.SKIPPED,
-                                    detail="metadata-defined index already absent (skipped)",
-                                    physical_name=index_name,
-                                )
-                    elif not dry_run:
-                        backend.drop_index_if_exists(connection, index_name, db_schema)
-                        # outcome stays default: applied / "metadata-defined index dropped"
-                    # dry-run, existed_before_drop True: outcome stays default ("would be dropped")
-                else:
-                    if not dry_run:
-                        restored_name = _restore_captured_index(
-                            connection, backend,
-                            table_name=table.table_name, db_schema=db_schema,
-                            column_names=column_names, unique=unique,
-                        )
+            # Clustering for perfomance is a separate operation from index creation
+            if enable:
+                cluster_index_name = _cluster_target_name(table)
+                if cluster_index_name is not None:
+                    cluster_columns = _cluster_column_names(table, cluster_index_name)
+                    if cluster_index_name in physical_index_names:
+                        # Resolved authoritatively from what actually happened in this
+                        # run's per-index loop (own name, captured, restored, or a
+                        # skip-equivalent) -- more precise than re-deriving from the
+                        # now-stale existing_indexes snapshot, since e.g. a
+                        # just-restored index wouldn't appear in it.
+                        physical_cluster_name = physical_index_names[cluster_index_name]
                     else:
-                        restored_name, _, _ = _peek_captured_index(
-                            connection, backend,
-                            table_name=table.table_name, db_schema=db_schema,
-                            column_names=column_names, unique=unique,
+                        # Primary-key-based cluster target: never entered the per-index
+                        # loop, so resolve it the same way the standalone `indexes
+                        # cluster` command does.
+                        physical_cluster_name = _resolve_physical_cluster_name(
+                            existing_indexes,
+                            cluster_index_name,
+                            cluster_columns,
                         )
-                    if restored_name is not None:
-                        if not dry_run:
-                            created_any = True
-                        outcome = _IndexOutcome(
-                            status=dry_status(dry_run, Status.RESTORED),
-                            detail=dry_label(
-                                dry_run,
-                                planned=f"foreign index '{restored_name}' would be restored from bulk-load capture",
-                                applied=f"foreign index '{restored_name}' restored from bulk-load capture",
-                            ),
-                            physical_name=restored_name,
-                        )
-                    else:
-                        equivalent_name = _find_equivalent_index(existing_indexes, column_names, unique)
-                        if equivalent_name is not None:
-                            outcome = _IndexOutcome(
+                    if not clustering_supported or not cluster:
+                        results.append(
+                            IndexManagementResult(
+                                operation="cluster",
+                                table_name=table.table_name,
+                                category=table.category,
+                                index_name=physical_cluster_name,
+                                column_names=cluster_columns,
+                                unique=False,
+                                clustered=True,
+                                enable=enable,
                                 status=Status.SKIPPED,
-                                detail=dry_label(
-                                    dry_run,
-                                    planned=f"equivalent foreign index '{equivalent_name}' already provides this coverage (would skip creation)",
-                                    applied=f"equivalent foreign index '{equivalent_name}' already provides this coverage (skipped)",
+                                detail=(
+                                    f"cluster metadata present but unsupported on {backend.name}"
+                                    if not clustering_supported
+                                    else "clustering skipped (run 'indexes cluster' to apply)"
                                 ),
-                                physical_name=equivalent_name,
                             )
-                        elif not dry_run:
-                            savepoint = connection.begin_nested()
-                            try:
-                                schema_index.create(bind=connection, checkfirst=True)
-                            except DBAPIError as exc:
-                                savepoint.rollback()
-                                if "already exists" not in str(exc.orig).lower():
-                                    raise
-                                outcome = _IndexOutcome(
-                                    status=Status.SKIPPED,
-                                    detail="metadata-defined index already exists (skipped)",
-                                    physical_name=index_name,
-                                )
-                            else:
-                                savepoint.commit()
-                                created_any = True
-                                # outcome stays default: applied / "metadata-defined index created"
-                        # dry-run, no restore, no equivalent: outcome stays default ("would be created")
-
-            physical_name = outcome.physical_name
-            physical_index_names[index_name] = physical_name
-            results.append(
-                IndexManagementResult(
-                    operation="index",
-                    table_name=table.table_name,
-                    category=table.category,
-                    index_name=physical_name,
-                    column_names=column_names,
-                    unique=unique,
-                    clustered=metadata_index.info.get(OMOP_CLUSTER_INDEX_INFO_KEY) is True,
-                    enable=enable,
-                    status=outcome.status,
-                    detail=outcome.detail,
-                )
-            )
-
-        # Clustering for perfomance is a separate operation from index creation
-        if enable:
-            cluster_index_name = _cluster_target_name(table)
-            if cluster_index_name is not None:
-                cluster_columns = _cluster_column_names(table, cluster_index_name)
-                if cluster_index_name in physical_index_names:
-                    # Resolved authoritatively from what actually happened in this
-                    # run's per-index loop (own name, captured, restored, or a
-                    # skip-equivalent) -- more precise than re-deriving from the
-                    # now-stale existing_indexes snapshot, since e.g. a
-                    # just-restored index wouldn't appear in it.
-                    physical_cluster_name = physical_index_names[cluster_index_name]
-                else:
-                    # Primary-key-based cluster target: never entered the per-index
-                    # loop, so resolve it the same way the standalone `indexes
-                    # cluster` command does.
-                    physical_cluster_name = _resolve_physical_cluster_name(
-                        existing_indexes,
-                        cluster_index_name,
-                        cluster_columns,
-                    )
-                if not clustering_supported or not cluster:
-                    results.append(
-                        IndexManagementResult(
-                            operation="cluster",
-                            table_name=table.table_name,
-                            category=table.category,
-                            index_name=physical_cluster_name,
-                            column_names=cluster_columns,
-                            unique=False,
-                            clustered=True,
-                            enable=enable,
-                            status=Status.SKIPPED,
-                            detail=(
-                                f"cluster metadata present but unsupported on {backend.name}"
-                                if not clustering_supported
-                                else "clustering skipped (run 'indexes cluster' to apply)"
-                            ),
                         )
-                    )
-                else:
-                    if not dry_run:
-                        with engine.begin() as connection:
-                            backend.cluster_table(connection, table.table_name, physical_cluster_name, db_schema)
-                        clustered_now = True
-
-                    results.append(
-                        IndexManagementResult(
-                            operation="cluster",
-                            table_name=table.table_name,
-                            category=table.category,
-                            index_name=physical_cluster_name,
-                            column_names=cluster_columns,
-                            unique=False,
-                            clustered=True,
-                            enable=enable,
-                            status=dry_status(dry_run),
-                            detail=dry_label(dry_run, "table would be clustered using ORM-defined metadata", "table clustered using ORM-defined metadata"),
+                    else:
+                        cluster_duration: float | None = None
+                        if not dry_run:
+                            started = time.perf_counter()
+                            with engine.begin() as connection:
+                                backend.configure_index_build_session(connection, **session_settings)
+                                backend.cluster_table(connection, table.table_name, physical_cluster_name, db_schema)
+                            cluster_duration = time.perf_counter() - started
+                            clustered_now = True
+
+                        results.append(
+                            IndexManagementResult(
+                                operation="cluster",
+                                table_name=table.table_name,
+                                category=table.category,
+                                index_name=physical_cluster_name,
+                                column_names=cluster_columns,
+                                unique=False,
+                                clustered=True,
+                                enable=enable,
+                                status=dry_status(dry_run),
+                                detail=dry_label(dry_run, "table would be clustered using ORM-defined metadata", "table clustered using ORM-defined metadata"),
+                                duration_seconds=cluster_duration,
+                            )
                         )
-                    )
 
-        if not dry_run and (created_any or clustered_now):
-            with engine.connect() as connection:
-                backend.analyze_table(connection, table.table_name, db_schema)
-                connection.commit()
+            if not dry_run and (created_any or clustered_now):
+                with engine.connect() as connection:
+                    backend.analyze_table(connection, table.table_name, db_schema)
+                    connection.commit()
+    finally:
+        if pool is not None:
+            # On failure, don't start builds that are still queued; running ones finish.
+            pool.shutdown(wait=True, cancel_futures=True)
 
     return results
 
@@ -998,6 +1113,20 @@ def enable_indexes_command(
         "--cluster/--no-cluster",
         help="Also CLUSTER tables using their ORM-designated cluster index. Use --no-cluster to skip the full heap rewrite on large vocabulary tables.",
     ),
+    parallel: int = typer.Option(
+        1,
+        min=1,
+        help="Build up to N indexes concurrently, each on its own connection. Ignored on backends that serialise writers (SQLite).",
+    ),
+    maintenance_work_mem: str | None = typer.Option(
+        None,
+        help="PostgreSQL maintenance_work_mem for each index build (e.g. '1GB'). Each concurrent build gets this much.",
+    ),
+    max_parallel_maintenance_workers: int | None = typer.Option(
+        None,
+        min=0,
+        help="PostgreSQL max_parallel_maintenance_workers for each index build.",
+    ),
     dry_run: bool = False,
 ) -> None:
     """Recreate all ORM-defined secondary indexes. Also CLUSTERs tables on PostgreSQL where metadata specifies it.
@@ -1014,6 +1143,9 @@ def enable_indexes_command(
             vocabulary_included=vocabulary_included,
             dry_run=dry_run,
             cluster=cluster,
+            parallel=parallel,
+            maintenance_work_mem=maintenance_work_mem,
+            max_parallel_maintenance_workers=max_parallel_maintenance_workers,
         )
     console.print(render_index_results(results))
     console.print(render_index_summary(results, dry_run=dry_run))
@@ -4,14 +4,17 @@ from __future__ import annotations
 
 import time
 from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from contextlib import suppress
 from dataclasses import dataclass
+from functools import partial
 from pathlib import Path
 from typing import Literal, TypeAlias, cast
 
 import sqlalchemy as sa
 import sqlalchemy.orm as so
 import sqlalchemy.event as sae
-from sqlalchemy.exc import OperationalError
+from sqlalchemy.exc import OperationalError, SQLAlchemyError
 import typer
 from sqlalchemy.pool import NullPool
 from orm_loader.backends import resolve_backend
@@ -19,6 +22,7 @@ from orm_loader.tables.typing import CSVTableProtocol
 from rich.progress import BarColumn, Progress, SpinnerColumn, TaskProgressColumn, TextColumn, TimeElapsedColumn
 
 from ..backends.resolve import SupportedDialect
+from omop_alchemy.cdm.handlers.vocabs_and_mappers.concept_cache import concept_attribute_cache
 from omop_alchemy.cdm.model.vocabulary import (
     Concept,
     Concept_Ancestor,
@@ -33,6 +37,19 @@ from omop_alchemy.cdm.model.vocabulary import (
 )
 
 from ._cli_utils import ReservedSchema, Status, ensure_schema, omop_command, reject_reserved_schema
+from ._csv_split import CsvSplitPlan, copy_csv_range, csv_byte_ranges, plan_csv_split
+from ._vocab_journal import (
+    CsvFingerprint,
+    JournalStatus,
+    begin_bulk_mode,
+    bulk_mode_interrupted,
+    end_bulk_mode,
+    ensure_load_journal,
+    fingerprint_csv,
+    read_load_journal,
+    record_load_journal,
+    stat_csv,
+)
 from .cli_foreign_keys import manage_foreign_key_triggers
 from .cli_indexes import manage_indexes
 from .cli_tables import reset_model_sequences
@@ -193,6 +210,61 @@ def _load_vocab_model_csv(
         return int(model.load_csv(session, csv_path, **load_kwargs))  # ty: ignore[invalid-argument-type]
 
 
+def _load_vocab_model_csv_split(
+    session: so.Session,
+    *,
+    load_engine: sa.Engine,
+    model: VocabularyModel,
+    plan: CsvSplitPlan,
+    streams: int,
+    merge_strategy: MergeStrategy,
+    index_strategy: str = "auto",
+    merge_batch_size: int | None = None,
+    staging_schema: str | None = None,
+) -> int:
+    """Stage one CSV through several concurrent COPY streams, then merge it once.
+
+    Follows the same lifecycle as model.load_csv (fresh staging table, load,
+    merge under manage_indices, drop staging) but splits the CSV body into
+    byte ranges at line boundaries and COPYs each range into the unlogged
+    staging table on its own connection.
+    """
+    if merge_strategy == "insert_if_empty" and session.execute(
+        sa.select(sa.literal(1)).select_from(model.__table__).limit(1)
+    ).first() is not None:
+        raise ValueError(
+            f"Table `{model.__tablename__}` is not empty; cannot use merge strategy 'insert_if_empty'"
+        )
+
+    model.create_staging_table(session, staging_schema=staging_schema)
+    # The COPY streams run on their own connections, which can only see the
+    # staging table (and not block on its DDL locks) once it is committed.
+    session.commit()
+    table_ref = resolve_backend(session, staging_schema=staging_schema).qualified_staging_name(model.__tablename__)
+    ranges = csv_byte_ranges(plan, streams)
+
+    def _copy_range(byte_range: tuple[int, int]) -> int:
+        start, end = byte_range
+        with load_engine.begin() as connection:
+            return copy_csv_range(connection.connection, plan, table_ref=table_ref, start=start, end=end)
+
+    with ThreadPoolExecutor(
+        max_workers=max(len(ranges), 1),
+        thread_name_prefix=f"copy-{model.__tablename__}",
+    ) as pool:
+        total = sum(pool.map(_copy_range, ranges))
+
+    with model.manage_indices(session, index_strategy=index_strategy, staging_schema=staging_schema):
+        model.merge_from_staging(
+            session,
+            merge_strategy=merge_strategy,
+            merge_batch_size=merge_batch_size,
+            staging_schema=staging_schema,
+        )
+    model.drop_staging_table(session, staging_schema=staging_schema)
+    return total
+
+
 def _find_vocab_csv_path(source_path: Path, table_name: str) -> Path | None:
     """Locate the CSV file for table_name under source_path, trying exact name, lower, upper, and case-insensitive glob."""
     direct_candidates = (
@@ -256,6 +328,109 @@ def _create_missing_vocabulary_tables(
     return len(missing_tables)
 
 
+def _load_vocab_table(
+    load_engine: sa.Engine,
+    *,
+    model: VocabularyModel,
+    csv_path: Path,
+    merge_strategy: MergeStrategy,
+    chunksize: int | None,
+    merge_batch_size: int | None,
+    use_bulk_mode: bool,
+    db_schema: str | None,
+    backend: str,
+    copy_streams: int = 1,
+    truncate_first: bool = False,
+) -> tuple[int, int]:
+    """Load one vocabulary CSV in its own session, retrying transient connection failures.
+
+    With copy_streams > 1 the CSV is staged through that many concurrent COPY
+    streams when its records can be split on line boundaries. truncate_first
+    clears the table before an insert_if_empty load, for a table a previous,
+    interrupted run left partially loaded. Returns the row count and the
+    number of COPY streams actually used.
+    """
+    split_plan = plan_csv_split(csv_path) if copy_streams > 1 else None
+    recovery_hint = (
+        " Indexes and FK triggers may still be disabled; rerun load-vocab-source, which restores them "
+        "on every vocabulary table, or run 'omop-alchemy indexes enable --vocab' and 'omop-alchemy foreign-keys enable' to recover."
+        if use_bulk_mode else ""
+    )
+
+    attempt = 0
+    while True:
+        try:
+            with so.Session(load_engine) as session:
+                if (attempt > 0 or truncate_first) and merge_strategy == "insert_if_empty":
+                    # A DB crash (in this run or an interrupted earlier one) left
+                    # partial data committed in this table.
+                    # Truncate so insert_if_empty can retry cleanly. Safe because
+                    # bulk_mode's manage_foreign_key_triggers ran ALTER TABLE ...
+                    # DISABLE TRIGGER ALL on all vocabulary tables, and that state
+                    # persists across crash+recovery in pg_trigger.tgenabled.
+                    # Schema-qualified explicitly so this targets the CDM table
+                    # regardless of search_path ordering.
+                    table_ref = f'"{db_schema}"."{model.__tablename__}"' if db_schema else f'"{model.__tablename__}"'
+                    session.execute(sa.text(f"TRUNCATE TABLE {table_ref}"))
+                    session.commit()
+                if split_plan is not None:
+                    row_count = _load_vocab_model_csv_split(
+                        session,
+                        load_engine=load_engine,
+                        model=model,
+                        plan=split_plan,
+                        streams=copy_streams,
+                        merge_strategy=merge_strategy,
+                        index_strategy="keep" if use_bulk_mode else "auto",
+                        merge_batch_size=merge_batch_size,
+                        staging_schema=ReservedSchema.STAGING,
+                    )
+                else:
+                    row_count = _load_vocab_model_csv(
+                        session,
+                        model=model,
+                        csv_path=csv_path,
+                        merge_strategy=merge_strategy,
+                        quote_mode="auto",
+                        index_strategy="keep" if use_bulk_mode else "auto",
+                        chunksize=chunksize,
+                        merge_batch_size=merge_batch_size,
+                        staging_schema=ReservedSchema.STAGING,
+                    )
+                session.commit()
+            return row_count, copy_streams if split_plan is not None else 1
+        except Exception as exc:
+            if attempt < 2 and _is_retryable_error(exc):
+                attempt += 1
+                time.sleep(10)
+                continue
+            raise VocabularyLoadError(
+                "Athena vocabulary load failed for "
+                f"table `{model.__tablename__}` from `{csv_path}` "
+                f"using merge strategy `{merge_strategy}` on backend `{backend}`. "
+                f"Underlying error: {exc.__class__.__name__}: {exc}"
+                + recovery_hint
+            ) from exc
+
+
+def _fingerprint_csvs(
+    jobs: list[tuple[VocabularyModel, Path, bool]],
+    *,
+    workers: int,
+) -> dict[str, CsvFingerprint]:
+    """Fingerprint every job's CSV, hashing up to workers files at a time. Keyed by table name."""
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="vocab-hash") as pool:
+        fingerprints = pool.map(fingerprint_csv, [csv_path for _, csv_path, _ in jobs])
+        return {model.__tablename__: fp for (model, _, _), fp in zip(jobs, fingerprints)}
+
+
+def _largest_first(
+    jobs: list[tuple[VocabularyModel, Path, bool]],
+) -> list[tuple[VocabularyModel, Path, bool]]:
+    """Order load jobs by CSV size, largest first, so the longest loads start before the pool fills up."""
+    return sorted(jobs, key=lambda job: job[1].stat().st_size, reverse=True)
+
+
 def load_vocab_source(
     engine: sa.Engine,
     *,
@@ -267,6 +442,10 @@ def load_vocab_source(
     chunksize: int | None = 100_000,
     bulk_mode: bool = True,
     merge_batch_size: int | None = None,
+    parallel: int = 1,
+    copy_streams: int = 1,
+    split_threshold_mb: int = 1024,
+    skip_unchanged: bool = False,
     progress_callback: VocabularyLoadProgressCallback | None = None,
 ) -> VocabularyLoadReport:
     """
@@ -280,8 +459,39 @@ def load_vocab_source(
 
     With bulk_mode (default on PostgreSQL), secondary indexes and FK triggers
     are toggled globally around the load for speed. Pass --no-bulk-mode when
-    loading a single table to avoid the index drop/rebuild overhead.
+    loading a single table to avoid the index drop/rebuild overhead. The
+    journal marks the bulk phase until both are restored; if a run dies
+    before that, the next run restores them on every vocabulary table, even
+    when it has nothing to load.
+
+    parallel > 1 loads up to that many tables at once, each worker on its own
+    connection, scheduling the largest CSVs first. It only takes effect in
+    bulk_mode, where FK triggers are disabled and load order no longer
+    matters; otherwise tables are loaded one at a time in FK dependency order.
+    The same number of workers rebuilds the dropped indexes afterwards.
+
+    copy_streams > 1 splits every CSV of at least split_threshold_mb MiB whose
+    quote mode resolves to literal (so a newline always ends a record) into
+    that many byte ranges at line boundaries and COPYs them concurrently into
+    the staging table before a single merge. PostgreSQL only, and only
+    without merge_batch_size: paginated merges walk the staging _rownum
+    sequence, which concurrent COPY streams leave with gaps.
+
+    Every load records each table's status, CSV fingerprint (size, mtime,
+    SHA-256) and row count in a journal table in the reserved staging schema.
+    Each CSV is hashed while its table loads, not in a pass of its own.
+    With skip_unchanged, tables the journal shows as loaded from a
+    byte-identical CSV, and which still hold the journaled number of rows,
+    are skipped entirely: no staging, no merge, and in bulk_mode no index
+    drop/rebuild. Only CSVs whose size and row count match their journaled
+    load are hashed up front to find them. That both resumes an interrupted full
+    reload and leaves the untouched tables of a monthly Athena refresh alone.
     """
+    if parallel < 1:
+        raise RuntimeError(f"parallel must be at least 1, got {parallel}")
+    if copy_streams < 1:
+        raise RuntimeError(f"copy_streams must be at least 1, got {copy_streams}")
+
     resolved_source_path = Path(source_path).expanduser().resolve()
     if not resolved_source_path.exists() or not resolved_source_path.is_dir():
         raise RuntimeError(
@@ -340,26 +550,110 @@ def load_vocab_source(
             cur.execute(f"SET search_path TO {_quoted_schema}")
             cur.close()
 
-    table_count = sum(
-        1 for m in all_models
-        if _find_vocab_csv_path(resolved_source_path, m.__tablename__) is not None
-    )
+    results_by_table: dict[str, VocabularyLoadResult] = {}
+    jobs: list[tuple[VocabularyModel, Path, bool]] = []
+    for model in all_models:
+        csv_path = _find_vocab_csv_path(resolved_source_path, model.__tablename__)
+        required = model in REQUIRED_VOCAB_MODELS
+        if csv_path is None:
+            results_by_table[model.__tablename__] = VocabularyLoadResult(
+                table_name=model.__tablename__,
+                status=Status.SKIPPED,
+                row_count=None,
+                csv_path=None,
+                required=required,
+                detail="optional Athena CSV not found; table skipped",
+            )
+        else:
+            jobs.append((model, csv_path, required))
+
+    journal = read_load_journal(engine, db_schema=db_schema) if skip_unchanged else {}
+    # Tables an earlier run started but never finished may hold partial data.
+    interrupted = {name for name, entry in journal.items() if entry.status != JournalStatus.LOADED}
+    # Content hashes of the CSVs compared against the journal; every other CSV
+    # is hashed by its load job, alongside the load itself.
+    fingerprints: dict[str, CsvFingerprint] = {}
+    if skip_unchanged:
+        inspector = sa.inspect(engine)
+
+        def _table_row_count(connection: sa.Connection, table_name: str) -> int:
+            table = sa.table(table_name, schema=db_schema)
+            return connection.execute(sa.select(sa.func.count()).select_from(table)).scalar_one()
+
+        def _may_be_unchanged(connection: sa.Connection, model: VocabularyModel, csv_path: Path) -> bool:
+            entry = journal.get(model.__tablename__)
+            return (
+                entry is not None
+                and entry.status == JournalStatus.LOADED
+                # a CSV of another size cannot be byte-identical, so it is not worth hashing
+                and csv_path.stat().st_size == entry.fingerprint.size
+                # a table dropped, truncated or otherwise changed since its
+                # journaled load must be reloaded
+                and inspector.has_table(model.__tablename__, schema=db_schema)
+                and entry.row_count is not None
+                and _table_row_count(connection, model.__tablename__) == entry.row_count
+            )
+
+        with engine.connect() as connection:
+            candidates = [job for job in jobs if _may_be_unchanged(connection, job[0], job[1])]
+        if candidates:
+            _emit(
+                progress_callback,
+                f"Fingerprinting {len(candidates)} CSV file(s)...",
+                0.0,
+                table_count=len(jobs),
+            )
+            fingerprints = _fingerprint_csvs(candidates, workers=parallel)
+        pending_jobs: list[tuple[VocabularyModel, Path, bool]] = []
+        for model, csv_path, required in jobs:
+            entry = journal.get(model.__tablename__)
+            fingerprint = fingerprints.get(model.__tablename__)
+            if entry is not None and fingerprint is not None and fingerprint.same_content(entry.fingerprint):
+                results_by_table[model.__tablename__] = VocabularyLoadResult(
+                    table_name=model.__tablename__,
+                    status=Status.SKIPPED,
+                    row_count=entry.row_count,
+                    csv_path=str(csv_path),
+                    required=required,
+                    detail="CSV unchanged since its last successful load (same size and SHA-256); skipped",
+                )
+            else:
+                pending_jobs.append((model, csv_path, required))
+        jobs = pending_jobs
 
-    results: list[VocabularyLoadResult] = []
+    table_count = len(jobs)
     created_table_count = 0
     sequence_reset_count = 0
     rows_cumulative = 0
-    table_index = 0
+    tables_done = 0
     index_warnings: tuple[str, ...] = ()
 
     _emit(progress_callback, f"Preparing Athena vocabulary load for {table_count} CSV file(s)", 0.0, table_count=table_count)
 
     _use_bulk_mode = (
         bulk_mode
+        and bool(jobs)
         and not dry_run
         and engine.dialect.name == SupportedDialect.POSTGRESQL
     )
+    # A bulk-mode run that died before its finally block left indexes dropped
+    # and FK triggers disabled, possibly on tables the journal now skips:
+    # restore them on every vocabulary table, even if nothing needs loading.
+    _restore_bulk_mode = (
+        not dry_run
+        and engine.dialect.name == SupportedDialect.POSTGRESQL
+        and bulk_mode_interrupted(engine, db_schema=db_schema)
+    )
+    # Only the tables about to be rewritten lose their indexes; skipped and
+    # non-vocabulary tables keep theirs throughout.
+    loaded_table_names = [model.__tablename__ for model, _, _ in jobs]
+    # Concurrent table loads are only safe while FK triggers are disabled; otherwise
+    # child tables would race their parents and fail RI checks.
+    _parallel = parallel > 1 and _use_bulk_mode
+    if not dry_run:
+        ensure_load_journal(engine)
     if _use_bulk_mode:
+        begin_bulk_mode(engine, db_schema=db_schema)
         _emit(progress_callback, "Disabling FK trigger checks for bulk load...", 0.0, table_count=table_count)
         manage_foreign_key_triggers(
             engine,
@@ -375,6 +669,7 @@ def load_vocab_source(
             vocabulary_included=True,
             db_schema=db_schema,
             dry_run=False,
+            tables=loaded_table_names,
         )
         index_warnings = tuple(
             f"{result.table_name}.{result.index_name}: {result.detail}"
@@ -394,113 +689,153 @@ def load_vocab_source(
             created_table_count = _create_missing_vocabulary_tables(pre_conn, db_schema=db_schema)
             pre_conn.commit()
 
-    try:
-        for model in all_models:
-            csv_path = _find_vocab_csv_path(resolved_source_path, model.__tablename__)
-            required = model in REQUIRED_VOCAB_MODELS
-
-            if csv_path is None:
-                results.append(VocabularyLoadResult(
-                    table_name=model.__tablename__,
-                    status=Status.SKIPPED,
-                    row_count=None,
-                    csv_path=None,
-                    required=required,
-                    detail="optional Athena CSV not found; table skipped",
-                ))
-                continue
+    _split_large_csvs = (
+        copy_streams > 1
+        and not dry_run
+        and merge_batch_size is None
+        and engine.dialect.name == SupportedDialect.POSTGRESQL
+    )
 
-            table_index += 1
+    def load_table(*, model: VocabularyModel, csv_path: Path) -> tuple[int, int]:
+        journal_entry = partial(
+            record_load_journal,
+            engine,
+            table_name=model.__tablename__,
+            db_schema=db_schema,
+            csv_path=csv_path,
+            merge_strategy=merge_strategy,
+        )
+        hashing = hash_pool.submit(
+            lambda: fingerprints.get(model.__tablename__) or fingerprint_csv(csv_path)
+        )
+        # Only loaded entries are ever compared by content, so the others are
+        # journaled without waiting for the hash.
+        journal_entry(status=JournalStatus.STARTED, fingerprint=stat_csv(csv_path))
+        split = _split_large_csvs and csv_path.stat().st_size >= split_threshold_mb * 1024 * 1024
+        try:
+            loaded = _load_vocab_table(
+                load_engine,
+                model=model,
+                csv_path=csv_path,
+                merge_strategy=merge_strategy,
+                chunksize=chunksize,
+                merge_batch_size=merge_batch_size,
+                use_bulk_mode=_use_bulk_mode,
+                db_schema=db_schema,
+                backend=engine.dialect.name,
+                copy_streams=copy_streams if split else 1,
+                truncate_first=model.__tablename__ in interrupted,
+            )
+        except VocabularyLoadError as exc:
+            # If the database itself is gone the STARTED entry stays behind,
+            # which --skip-unchanged treats the same way.
+            hashing.cancel()
+            with suppress(SQLAlchemyError):
+                journal_entry(status=JournalStatus.FAILED, fingerprint=stat_csv(csv_path), detail=str(exc))
+            raise
+        journal_entry(status=JournalStatus.LOADED, fingerprint=hashing.result(), row_count=loaded[0])
+        return loaded
+
+    def _record_loaded(model: VocabularyModel, csv_path: Path, required: bool, loaded: tuple[int, int]) -> None:
+        nonlocal rows_cumulative, tables_done
+        row_count, streams_used = loaded
+        rows_cumulative += row_count
+        tables_done += 1
+        results_by_table[model.__tablename__] = VocabularyLoadResult(
+            table_name=model.__tablename__,
+            status=Status.LOADED,
+            row_count=row_count,
+            csv_path=str(csv_path),
+            required=required,
+            detail=(
+                "Athena CSV loaded via staged ORM CSV loader using tab-delimited input and auto-detected quote mode"
+                if streams_used == 1
+                else f"Athena CSV split at line boundaries and staged via {streams_used} concurrent COPY streams, then merged once"
+            ),
+        )
+        _emit(
+            progress_callback,
+            f"Loaded {model.__tablename__} ({tables_done}/{table_count})",
+            tables_done / table_count * 100,
+            table_done=True,
+            table_name=model.__tablename__,
+            rows_this_table=row_count,
+            table_count=table_count,
+        )
 
+    # Hashes each loaded CSV for its journal entry while the table loads.
+    hash_pool = ThreadPoolExecutor(max_workers=parallel, thread_name_prefix="vocab-hash")
+    try:
+        if _parallel and jobs:
+            # FK triggers are disabled for the whole load, so tables no longer need to go
+            # in dependency order. Largest-first keeps the big tables (concept_relationship,
+            # concept_ancestor, ...) from starting last and serialising the tail of the run.
+            # Every worker opens its own session on the NullPool engine, i.e. its own
+            # server connection and backend process.
             _emit(
                 progress_callback,
-                f"Loading {model.__tablename__} ({table_index}/{table_count})...",
-                (table_index - 1) / table_count * 100,
-                table_name=model.__tablename__,
+                f"Loading {len(jobs)} table(s) on {min(parallel, len(jobs))} parallel worker(s)...",
+                0.0,
                 table_count=table_count,
             )
-
-            if dry_run:
-                results.append(VocabularyLoadResult(
-                    table_name=model.__tablename__,
-                    status=Status.PLANNED,
-                    row_count=None,
-                    csv_path=str(csv_path),
-                    required=required,
-                    detail="Athena CSV would be loaded via staged ORM CSV loader using tab-delimited input and auto-detected quote mode",
-                ))
-                continue
-
-            recovery_hint = (
-                " Indexes and FK triggers may still be disabled; run "
-                "'omop-alchemy indexes enable --vocab' and 'omop-alchemy foreign-keys enable' to recover."
-                if _use_bulk_mode else ""
-            )
-
-            row_count = 0
-            _prev_attempt_was_crash = False
-            for attempt in range(3):
+            with ThreadPoolExecutor(max_workers=parallel, thread_name_prefix="vocab-load") as pool:
+                futures = {
+                    pool.submit(load_table, model=model, csv_path=csv_path): (model, csv_path, required)
+                    for model, csv_path, required in _largest_first(jobs)
+                }
                 try:
-                    with so.Session(load_engine) as session:
-                        if _prev_attempt_was_crash and merge_strategy == "insert_if_empty":
-                            # A DB crash left partial data committed in this table.
-                            # Truncate so insert_if_empty can retry cleanly. Safe because
-                            # bulk_mode's manage_foreign_key_triggers ran ALTER TABLE ...
-                            # DISABLE TRIGGER ALL on all vocabulary tables, and that state
-                            # persists across crash+recovery in pg_trigger.tgenabled.
-                            # Schema-qualified explicitly so this targets the CDM table
-                            # regardless of search_path ordering.
-                            table_ref = f'"{db_schema}"."{model.__tablename__}"' if db_schema else f'"{model.__tablename__}"'
-                            session.execute(sa.text(f"TRUNCATE TABLE {table_ref}"))
-                            session.commit()
-                        row_count = _load_vocab_model_csv(
-                            session,
-                            model=model,
-                            csv_path=csv_path,
-                            merge_strategy=merge_strategy,
-                            quote_mode="auto",
-                            index_strategy="keep" if _use_bulk_mode else "auto",
-                            chunksize=chunksize,
-                            merge_batch_size=merge_batch_size,
-                            staging_schema=ReservedSchema.STAGING,
-                        )
-                        session.commit()
-                    break
-                except Exception as exc:
-                    if attempt < 2 and _is_retryable_error(exc):
-                        _prev_attempt_was_crash = True
-                        time.sleep(10)
-                        continue
-                    raise VocabularyLoadError(
-                        "Athena vocabulary load failed for "
-                        f"table `{model.__tablename__}` from `{csv_path}` "
-                        f"using merge strategy `{merge_strategy}` on backend `{engine.dialect.name}`. "
-                        f"Underlying error: {exc.__class__.__name__}: {exc}"
-                        + recovery_hint
-                    ) from exc
-
-            rows_cumulative += row_count
-            results.append(VocabularyLoadResult(
-                table_name=model.__tablename__,
-                status=Status.LOADED,
-                row_count=row_count,
-                csv_path=str(csv_path),
-                required=required,
-                detail="Athena CSV loaded via staged ORM CSV loader using tab-delimited input and auto-detected quote mode",
-            ))
+                    for future in as_completed(futures):
+                        model, csv_path, required = futures[future]
+                        _record_loaded(model, csv_path, required, future.result())
+                except BaseException:
+                    # Stop queued tables from starting; tables already loading are
+                    # waited for when the pool shuts down.
+                    for future in futures:
+                        future.cancel()
+                    raise
+        else:
+            for table_index, (model, csv_path, required) in enumerate(jobs, start=1):
+                _emit(
+                    progress_callback,
+                    f"Loading {model.__tablename__} ({table_index}/{table_count})...",
+                    (table_index - 1) / table_count * 100,
+                    table_name=model.__tablename__,
+                    table_count=table_count,
+                )
 
+                if dry_run:
+                    results_by_table[model.__tablename__] = VocabularyLoadResult(
+                        table_name=model.__tablename__,
+                        status=Status.PLANNED,
+                        row_count=None,
+                        csv_path=str(csv_path),
+                        required=required,
+                        detail="Athena CSV would be loaded via staged ORM CSV loader using tab-delimited input and auto-detected quote mode",
+                    )
+                    continue
+
+                _record_loaded(model, csv_path, required, load_table(model=model, csv_path=csv_path))
+    finally:
+        hash_pool.shutdown(cancel_futures=True)
+        if not dry_run and jobs:
+            # attributes (and misses) cached before the load may be stale now
+            concept_attribute_cache(engine).clear()
+        if _use_bulk_mode or _restore_bulk_mode:
+            if _restore_bulk_mode:
+                _emit(
+                    progress_callback,
+                    "Restoring indexes and FK triggers left disabled by an interrupted bulk load...",
+                    100.0,
+                    table_count=table_count,
+                )
             _emit(
                 progress_callback,
-                f"Loaded {model.__tablename__} ({table_index}/{table_count})",
-                table_index / table_count * 100,
-                table_done=True,
-                table_name=model.__tablename__,
-                rows_this_table=row_count,
+                "Rebuilding indexes on vocabulary tables (may take 15+ min)..."
+                if parallel == 1
+                else f"Rebuilding indexes on vocabulary tables ({parallel} at a time)...",
+                100.0,
                 table_count=table_count,
             )
-    finally:
-        if _use_bulk_mode:
-            _emit(progress_callback, "Rebuilding indexes on vocabulary tables (may take 15+ min)...", 100.0, table_count=table_count)
             manage_indexes(
                 engine,
                 enable=True,
@@ -508,6 +843,8 @@ def load_vocab_source(
                 db_schema=db_schema,
                 dry_run=False,
                 cluster=False,
+                parallel=parallel,
+                tables=None if _restore_bulk_mode else loaded_table_names,
             )
             _emit(progress_callback, "Re-enabling FK trigger checks...", 100.0, table_count=table_count)
             manage_foreign_key_triggers(
@@ -517,6 +854,7 @@ def load_vocab_source(
                 db_schema=db_schema,
                 dry_run=False,
             )
+            end_bulk_mode(engine, db_schema=db_schema)
 
     _emit(progress_callback, "Athena vocabulary load complete", 100.0, table_count=table_count)
 
@@ -539,7 +877,7 @@ def load_vocab_source(
         merge_strategy=merge_strategy,
         created_table_count=created_table_count,
         sequence_reset_count=sequence_reset_count,
-        results=tuple(results),
+        results=tuple(results_by_table[m.__tablename__] for m in all_models),
         index_warnings=index_warnings,
     )
 
@@ -606,6 +944,41 @@ def load_vocab_source_command(
             "before the merge begins, which adds significant overhead even at large batch sizes."
         ),
     ),
+    parallel: int = typer.Option(
+        1,
+        min=1,
+        help=(
+            "Load up to N vocabulary tables concurrently, each on its own database connection, "
+            "largest CSVs first. Only takes effect with --bulk-mode on PostgreSQL (FK triggers "
+            "disabled); otherwise tables load one at a time in FK dependency order. "
+            "The dropped indexes are also rebuilt N at a time."
+        ),
+    ),
+    copy_streams: int = typer.Option(
+        1,
+        min=1,
+        help=(
+            "[Phase 1] Split CSVs larger than --split-threshold-mb into N byte ranges at line "
+            "boundaries and COPY them into the staging table concurrently, then merge once. "
+            "PostgreSQL only; ignored when --merge-batch-size is set."
+        ),
+    ),
+    split_threshold_mb: int = typer.Option(
+        1024,
+        min=0,
+        help="[Phase 1] Minimum CSV size in MiB for --copy-streams splitting.",
+    ),
+    skip_unchanged: bool = typer.Option(
+        False,
+        "--skip-unchanged",
+        "--resume",
+        help=(
+            "Skip tables the load journal shows as already loaded from a byte-identical CSV "
+            "(same size and SHA-256) and that still hold the journaled row count, including "
+            "their index drop/rebuild. Continues an "
+            "interrupted full reload, or leaves unchanged tables of a new Athena download alone."
+        ),
+    ),
     dry_run: bool = False,
 ) -> None:
     """Load all Athena vocabulary CSVs from the configured source path, optionally toggling indexes and FK triggers for speed."""
@@ -657,6 +1030,10 @@ def load_vocab_source_command(
             chunksize=None if staging_chunk_size == 0 else staging_chunk_size,
             bulk_mode=bulk_mode,
             merge_batch_size=merge_batch_size,
+            parallel=parallel,
+            copy_streams=copy_streams,
+            split_threshold_mb=split_threshold_mb,
+            skip_unchanged=skip_unchanged,
             progress_callback=_update_progress,
         )
         progress.update(task_id, completed=100.0, description="Athena vocabulary load complete")
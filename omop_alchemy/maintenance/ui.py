@@ -891,6 +891,7 @@ def render_index_results(results: Iterable[IndexManagementResult]) -> Renderable
     if not items:
         return Panel.fit("No metadata-defined indexes matched the current selection.", title="No Action", border_style="yellow")
 
+    timed = any(result.duration_seconds is not None for result in items)
     table = Table(box=box.SIMPLE_HEAVY, header_style="bold")
     table.add_column("Status")
     table.add_column("Kind")
@@ -899,9 +900,15 @@ def render_index_results(results: Iterable[IndexManagementResult]) -> Renderable
     table.add_column("Index")
     table.add_column("Category")
     table.add_column("Columns")
+    if timed:
+        table.add_column("Time", justify="right")
     table.add_column("Detail")
     for result in items:
         style = _status_style(result.status)
+        timing = (
+            [f"{result.duration_seconds:.1f}s" if result.duration_seconds is not None else ""]
+            if timed else []
+        )
         table.add_row(
             Text(result.status.upper(), style=style),
             result.operation,
@@ -910,6 +917,7 @@ def render_index_results(results: Iterable[IndexManagementResult]) -> Renderable
             result.index_name,
             _category_label(result.category),
             ", ".join(result.column_names),
+            *timing,
             result.detail,
         )
     return table
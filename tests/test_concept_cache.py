@@ -0,0 +1,188 @@
+"""Tests for the process-wide concept attribute cache."""
+
+from datetime import date
+
+import pytest
+import sqlalchemy as sa
+import sqlalchemy.orm as so
+
+from omop_alchemy.cdm.model.clinical import PersonView
+from omop_alchemy.cdm.model.vocabulary import Concept
+from omop_alchemy.cdm.handlers.vocabs_and_mappers import (
+    ConceptAttributeCache,
+    ConceptAttributes,
+    concept_attribute_cache,
+)
+from omop_alchemy.cdm.handlers.vocabs_and_mappers.concept_resolver import OMOPConceptResolver
+
+
+@pytest.fixture
+def statements(engine):
+    """Record the SQL statements executed on the engine during the test."""
+    recorded: list[str] = []
+
+    def _record(conn, cursor, statement, *args):
+        recorded.append(statement)
+
+    sa.event.listen(engine, "before_cursor_execute", _record)
+    yield recorded
+    sa.event.remove(engine, "before_cursor_execute", _record)
+
+
+def _late_concept(concept_id: int) -> Concept:
+    return Concept(
+        concept_id=concept_id,
+        concept_name="Late addition",
+        domain_id="Condition",
+        vocabulary_id="SNOMED",
+        concept_class_id="Clinical Finding",
+        concept_code=str(concept_id),
+        valid_start_date=date(2020, 1, 1),
+        valid_end_date=date(2099, 12, 31),
+    )
+
+
+class TestConceptAttributeCache:
+    def test_get_many_fetches_unseen_ids_once(self, session, statements):
+        cache = ConceptAttributeCache(cache_missing=True)
+
+        first = cache.get_many(session, [201826, 8507, 999])
+        second = cache.get_many(session, [8507, 201826, 999])
+
+        assert first == second
+        assert first[201826] == ConceptAttributes(201826, "Condition", "SNOMED", "Clinical Finding", "S", None)
+        assert 999 not in first
+        assert len(statements) == 1
+        assert cache.info().hits == 3 and cache.info().misses == 3
+
+    def test_missing_ids_are_not_cached_by_default(self, session):
+        cache = ConceptAttributeCache()
+        assert cache.get(session, 999) is None
+
+        session.add(_late_concept(999))
+        session.flush()
+
+        assert cache.get(session, 999).domain_id == "Condition"
+
+    def test_rolled_back_concept_changes_are_not_served(self, engine):
+        cache = ConceptAttributeCache(cache_missing=True)
+        with so.Session(engine) as session:
+            assert cache.get(session, 8507).domain_id == "Gender"
+            session.get(Concept, 8507).domain_id = "Race"
+            session.add(_late_concept(999))
+            session.flush()
+
+            assert cache.get(session, 8507).domain_id == "Race"
+            assert cache.get(session, 999) is not None
+            assert cache.prefetch(session, [999]) == 0
+            session.rollback()
+
+            assert cache.get(session, 8507).domain_id == "Gender"
+            assert cache.get(session, 999) is None
+
+    def test_autoflushed_concept_changes_are_not_stored(self, engine):
+        cache = ConceptAttributeCache()
+        with so.Session(engine) as session:
+            session.get(Concept, 8507).domain_id = "Race"
+
+            assert cache.get(session, 8507).domain_id == "Race"  # flushed by the lookup's query
+            assert len(cache) == 0
+            session.rollback()
+
+    def test_attribute_flags(self, session):
+        attributes = ConceptAttributeCache().get(session, 8507)
+
+        assert attributes.is_standard and attributes.is_valid
+        assert not ConceptAttributes(1, "Drug", "RxNorm", "Ingredient", " ", "D").is_standard
+        assert not ConceptAttributes(1, "Drug", "RxNorm", "Ingredient", "C", "D").is_valid
+
+    def test_lru_eviction(self, session):
+        cache = ConceptAttributeCache(maxsize=2)
+
+        cache.get_many(session, [8507, 8527])
+        cache.get(session, 8507)
+        cache.get(session, 201826)
+
+        assert len(cache) == 2
+        assert cache.prefetch(session, [8507, 201826, 8527]) == 1
+
+    def test_maxsize_zero_disables_caching(self, session, statements):
+        cache = ConceptAttributeCache(maxsize=0)
+
+        cache.get(session, 8507)
+        cache.get(session, 8507)
+
+        assert len(cache) == 0
+        assert len(statements) == 2
+
+    def test_prefetch_then_get_is_query_free(self, session, statements):
+        cache = ConceptAttributeCache()
+
+        assert cache.prefetch(session, [8507, 201826, 8507]) == 2
+        assert cache.prefetch(session, [8507]) == 0
+        statements.clear()
+        assert cache.get(session, 201826).domain_id == "Condition"
+        assert statements == []
+
+    def test_clear(self, session):
+        cache = ConceptAttributeCache()
+        cache.get(session, 8507)
+
+        cache.clear()
+
+        assert len(cache) == 0
+        assert cache.info().misses == 0
+
+    def test_rejects_negative_maxsize(self):
+        with pytest.raises(ValueError):
+            ConceptAttributeCache(maxsize=-1)
+
+
+class TestSharedConceptCache:
+    def test_one_cache_per_engine(self, engine, session):
+        assert concept_attribute_cache(engine) is concept_attribute_cache(session.get_bind())
+        assert concept_attribute_cache(sa.create_engine("sqlite://")) is not concept_attribute_cache(engine)
+
+    def test_committed_concept_changes_clear_the_cache(self):
+        from orm_loader.helpers import bootstrap
+
+        engine = sa.create_engine("sqlite://", poolclass=sa.pool.StaticPool)
+        bootstrap(engine, create=True)
+        cache = concept_attribute_cache(engine)
+        with so.Session(engine) as session:
+            session.add(_late_concept(999))
+            session.commit()
+            assert cache.get(session, 999).domain_id == "Condition"
+
+            session.get(Concept, 999).domain_id = "Observation"
+            session.commit()
+
+            assert len(cache) == 0
+            assert cache.get(session, 999).domain_id == "Observation"
+
+    def test_resize(self, engine):
+        cache = concept_attribute_cache(engine)
+        previous = cache.maxsize
+        try:
+            assert concept_attribute_cache(engine, maxsize=10).maxsize == 10
+            assert concept_attribute_cache(engine).maxsize == 10
+        finally:
+            cache.maxsize = previous
+
+    def test_are_standard_uses_cache(self, session, statements):
+        cache = ConceptAttributeCache()
+        resolver = OMOPConceptResolver(session, cache=cache)
+
+        assert resolver.are_standard([8507, 201826, 999]) == {8507: True, 201826: True}
+        assert resolver.are_standard([8507]) == {8507: True}
+        assert len(statements) == 1
+
+    def test_domain_checks_share_prefetched_concepts(self, session, statements):
+        people = session.scalars(sa.select(PersonView)).all()
+        concept_attribute_cache(session.get_bind()).clear()
+
+        PersonView.prefetch_domains(session, people)
+        statements.clear()
+
+        assert all(p.is_domain_valid for p in people)
+        assert statements == []
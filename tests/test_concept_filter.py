@@ -10,7 +10,8 @@ from omop_alchemy.cdm.model.vocabulary import (
     StandardConceptFlag,
     normalised_flag_expr,
 )
-from omop_alchemy.cdm.query import ConceptFilter
+from omop_alchemy.cdm.handlers.vocabs_and_mappers.concept_resolver import OMOPConceptResolver
+from omop_alchemy.cdm.query import LARGE_IN_THRESHOLD, ConceptFilter, id_in
 
 
 class TestConceptFilterApply:
@@ -109,6 +110,58 @@ class TestConceptFilterApply:
         assert not ConceptFilter(require_active=True).is_empty()
 
 
+class TestLargeIdLists:
+    """Id lists above LARGE_IN_THRESHOLD must not become one bind parameter per id."""
+
+    # comfortably above SQLite's 32766 bind-parameter limit
+    MANY = tuple(range(10_000_000, 10_050_000)) + (8507, 201826)
+
+    def test_small_list_is_plain_in(self):
+        assert "IN (__[POSTCOMPILE" in str(sa.select(Concept.concept_id).where(id_in(Concept.concept_id, (1, 2))))
+
+    def test_large_list_binds_one_array_on_postgresql(self):
+        from sqlalchemy.dialects import postgresql
+
+        query = ConceptFilter(concept_ids=self.MANY).apply(sa.select(Concept.concept_id))
+        compiled = query.compile(dialect=postgresql.dialect())
+
+        assert "= ANY (" in str(compiled)
+        assert list(compiled.params.values()) == [list(self.MANY)]
+
+    def test_large_list_executes_on_sqlite(self, session):
+        query = ConceptFilter(concept_ids=self.MANY).apply(sa.select(Concept.concept_id))
+
+        assert set(session.scalars(query)) == {8507, 201826}
+
+    def test_duplicates_do_not_count_towards_threshold(self):
+        ids = [1] * (LARGE_IN_THRESHOLD + 1)
+
+        assert "POSTCOMPILE" in str(sa.select(Concept.concept_id).where(id_in(Concept.concept_id, ids)))
+
+    def test_are_standard_with_large_list(self, session):
+        result = OMOPConceptResolver(session).are_standard(self.MANY)
+
+        assert result == {8507: True, 201826: True}
+
+    def test_fetch_concepts_with_many_parents(self, session):
+        from omop_alchemy.cdm.handlers.vocabs_and_mappers.vocab_handlers import OMOPConceptSource
+        from omop_alchemy.cdm.model.vocabulary import Concept_Ancestor
+
+        session.add(
+            Concept_Ancestor(
+                ancestor_concept_id=201826,
+                descendant_concept_id=201826,
+                min_levels_of_separation=0,
+                max_levels_of_separation=0,
+            )
+        )
+        session.flush()
+
+        rows = OMOPConceptSource.fetch_concepts(session, parents=self.MANY)
+
+        assert [r.concept_id for r in rows] == [201826]
+
+
 class TestNormalisedFlagExpr:
     """normalised_flag_expr must trim whitespace and turn blank strings into
     NULL, while leaving NULL and non-blank values (canonical or not) alone."""
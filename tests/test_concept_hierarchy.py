@@ -0,0 +1,135 @@
+"""Tests for the in-process concept_ancestor closure."""
+
+import pickle
+
+import pytest
+
+from omop_alchemy.cdm.model.vocabulary import Concept, Concept_Ancestor
+from omop_alchemy.cdm.handlers.vocabs_and_mappers import ConceptHierarchy, ConceptResolverRegistry
+from omop_alchemy.cdm.handlers.vocabs_and_mappers.lookup_snapshot import LookupSnapshotError
+from omop_alchemy.cdm.handlers.vocabs_and_mappers.vocab_handlers import OMOPConceptSource
+
+# (ancestor, descendant, min_levels, max_levels); self-links are added below
+EDGES = [
+    (32546, 201826, 1, 1),
+    (32546, 1147127, 2, 3),
+    (201826, 1147127, 1, 2),
+    (32546, 8527, 1, 1),
+    (8507, 32817, 1, 1),
+]
+NODES = sorted({c for a, d, _, _ in EDGES for c in (a, d)})
+
+
+@pytest.fixture
+def hierarchy_session(session):
+    """Session with a small closure where 8527 is non-standard (rolled back after the test)."""
+    session.add_all(
+        Concept_Ancestor(
+            ancestor_concept_id=a, descendant_concept_id=d, min_levels_of_separation=lo, max_levels_of_separation=hi
+        )
+        for a, d, lo, hi in EDGES + [(c, c, 0, 0) for c in NODES]
+    )
+    session.get(Concept, 8527).standard_concept = None
+    session.flush()
+    return session
+
+
+class TestConceptHierarchy:
+    def test_descendants_match_database(self, hierarchy_session):
+        hierarchy = ConceptHierarchy.from_database(hierarchy_session)
+
+        for parents in ([32546], [201826], [8507, 201826], [1147127], [999]):
+            for include_non_standard in (False, True):
+                expected = OMOPConceptSource.descendants(
+                    hierarchy_session, parents, include_non_standard=include_non_standard
+                )
+                assert hierarchy.descendants(parents, include_non_standard=include_non_standard) == sorted(expected)
+
+    def test_descendants_via_hierarchy_argument(self, hierarchy_session):
+        hierarchy = ConceptHierarchy.from_database(hierarchy_session)
+
+        assert OMOPConceptSource.descendants(hierarchy_session, [32546], hierarchy=hierarchy) == [
+            32546,
+            201826,
+            1147127,
+        ]
+
+    def test_ancestors_and_membership(self, hierarchy_session):
+        hierarchy = ConceptHierarchy.from_database(hierarchy_session)
+
+        assert hierarchy.ancestors([1147127]) == [32546, 201826, 1147127]
+        assert hierarchy.ancestors([1147127], min_separation=1) == [32546, 201826]
+        assert hierarchy.is_descendant_of(1147127, [8507, 32546])
+        assert hierarchy.is_descendant_of(201826, [201826])
+        assert not hierarchy.is_descendant_of(32546, [201826])
+
+    def test_separation_levels(self, hierarchy_session):
+        hierarchy = ConceptHierarchy.from_database(hierarchy_session)
+
+        assert hierarchy.separation(32546, 1147127) == (2, 3)
+        assert hierarchy.separation(201826, 32546) is None
+        assert hierarchy.descendants([32546], min_separation=1, max_separation=1) == [201826]
+        assert hierarchy.descendants([32546], max_separation=1, include_non_standard=True) == [8527, 32546, 201826]
+
+    def test_file_round_trip_is_memory_mapped(self, hierarchy_session, tmp_path):
+        built = ConceptHierarchy.from_database(hierarchy_session)
+        opened = ConceptHierarchy.open(built.write(tmp_path / "h.oahier", fingerprint="abc"))
+
+        assert opened.fingerprint == "abc"
+        assert len(opened) == len(built) == len(EDGES) + len(NODES)
+        assert opened.descendants([32546], include_non_standard=True) == built.descendants(
+            [32546], include_non_standard=True
+        )
+        assert opened.separation(32546, 1147127) == (2, 3)
+
+        restored = pickle.loads(pickle.dumps(opened))
+        assert restored.path == opened.path
+        assert restored.ancestors([1147127]) == opened.ancestors([1147127])
+
+    def test_in_memory_hierarchy_pickles(self, hierarchy_session):
+        hierarchy = ConceptHierarchy.from_database(hierarchy_session)
+
+        restored = pickle.loads(pickle.dumps(hierarchy))
+
+        assert restored.descendants([32546]) == hierarchy.descendants([32546])
+
+    def test_empty_closure(self, session, tmp_path):
+        hierarchy = ConceptHierarchy.open(ConceptHierarchy.from_database(session).write(tmp_path / "e.oahier"))
+
+        assert len(hierarchy) == 0
+        assert hierarchy.descendants([32546]) == []
+        assert not hierarchy.is_descendant_of(32546, [32546])
+
+    def test_rejects_foreign_file(self, tmp_path):
+        path = tmp_path / "bogus.oahier"
+        path.write_bytes(b"not a hierarchy")
+
+        with pytest.raises(LookupSnapshotError):
+            ConceptHierarchy.open(path)
+
+    def test_load_reuses_cache_file(self, hierarchy_session, tmp_path, monkeypatch):
+        first = ConceptHierarchy.load(hierarchy_session, cache_dir=tmp_path)
+        assert first.path is not None and first.path.parent == tmp_path
+
+        def _fail(*args, **kwargs):
+            raise AssertionError("closure should come from the cache file")
+
+        monkeypatch.setattr(ConceptHierarchy, "from_database", _fail)
+        second = ConceptHierarchy.load(hierarchy_session, cache_dir=tmp_path)
+
+        assert second.path == first.path
+        assert second.descendants([32546]) == first.descendants([32546])
+
+    def test_registry_loads_hierarchy_once(self, engine, tmp_path, monkeypatch):
+        registry = ConceptResolverRegistry(engine, snapshot_dir=tmp_path)
+        calls = []
+        load = ConceptHierarchy.load.__func__
+
+        def _load(cls, session, **kwargs):
+            calls.append(kwargs)
+            return load(cls, session, **kwargs)
+
+        monkeypatch.setattr(ConceptHierarchy, "load", classmethod(_load))
+
+        assert registry.hierarchy() is registry.hierarchy()
+        assert calls == [{"cache_dir": tmp_path}]
@@ -0,0 +1,144 @@
+"""Tests for bulk source-to-standard concept mapping."""
+
+from datetime import date
+
+import pytest
+import sqlalchemy as sa
+
+from omop_alchemy.cdm.model.vocabulary import Concept, Concept_Relationship, Source_To_Concept_Map
+from omop_alchemy.cdm.handlers.vocabs_and_mappers import ConceptMapper, SourceMapping
+
+START, END = date(1970, 1, 1), date(2099, 12, 31)
+
+
+@pytest.fixture
+def mapping_session(session):
+    """
+    Session with source concepts and mappings (rolled back after the test):
+
+    - SNOMED/SRC1 maps to 201826, with value 8507
+    - SNOMED/SRC2 maps to both 201826 and 32546
+    - SNOMED/SRC3 only has an invalidated mapping
+    - LOCAL/abc maps to 201826 via source_to_concept_map
+    """
+    session.add_all(
+        Concept(
+            concept_id=cid,
+            concept_name=f"source {code}",
+            domain_id="Condition",
+            vocabulary_id="SNOMED",
+            concept_class_id="Clinical Finding",
+            standard_concept=None,
+            concept_code=code,
+            valid_start_date=START,
+            valid_end_date=END,
+        )
+        for cid, code in [(45000001, "SRC1"), (45000002, "SRC2"), (45000003, "SRC3")]
+    )
+    session.add_all(
+        Concept_Relationship(
+            concept_id_1=source,
+            concept_id_2=target,
+            relationship_id=relationship,
+            valid_start_date=START,
+            valid_end_date=END,
+            invalid_reason=invalid,
+        )
+        for source, target, relationship, invalid in [
+            (45000001, 201826, "Maps to", None),
+            (45000001, 8507, "Maps to value", None),
+            (45000002, 201826, "Maps to", None),
+            (45000002, 32546, "Maps to", ""),
+            (45000003, 8527, "Maps to", "D"),
+            (45000003, 32817, "Is a", None),
+        ]
+    )
+    session.add(
+        Source_To_Concept_Map(
+            source_code="abc",
+            source_concept_id=0,
+            source_vocabulary_id="LOCAL",
+            target_concept_id=201826,
+            target_vocabulary_id="SNOMED",
+            valid_start_date=START,
+            valid_end_date=END,
+            start_date=START,
+        )
+    )
+    session.flush()
+    return session
+
+
+EXPECTED_CODES = {
+    ("SNOMED", "SRC1"): SourceMapping(targets=(201826,), value_targets=(8507,)),
+    ("SNOMED", "SRC2"): SourceMapping(targets=(32546, 201826)),
+    ("LOCAL", "abc"): SourceMapping(targets=(201826,)),
+}
+CODES = [*EXPECTED_CODES, ("SNOMED", "SRC3"), ("SNOMED", "nope"), ("SNOMED", "SRC1")]
+
+
+class TestConceptMapper:
+    def test_map_codes(self, mapping_session):
+        result = ConceptMapper(chunk_size=2).map_codes(mapping_session, CODES)
+
+        assert result == EXPECTED_CODES
+        assert result[("SNOMED", "SRC1")].target == 201826
+        assert result[("SNOMED", "SRC2")].target is None
+
+    def test_map_concept_ids(self, mapping_session):
+        result = ConceptMapper().map_concept_ids(mapping_session, [45000001, 45000002, 45000003, 0, 999])
+
+        assert result == {
+            45000001: SourceMapping(targets=(201826,), value_targets=(8507,)),
+            45000002: SourceMapping(targets=(32546, 201826)),
+        }
+
+    def test_relationship_and_validity_options(self, mapping_session):
+        mapper = ConceptMapper(relationships=["Maps to"], use_source_to_concept_map=False, valid_only=False)
+
+        result = mapper.map_codes(mapping_session, CODES)
+
+        assert result[("SNOMED", "SRC1")] == SourceMapping(targets=(201826,))
+        assert result[("SNOMED", "SRC3")] == SourceMapping(targets=(8527,))
+        assert ("LOCAL", "abc") not in result
+
+    def test_one_query_per_chunk(self, mapping_session, engine):
+        statements: list[str] = []
+
+        def _record(conn, cursor, statement, *args):
+            statements.append(statement)
+
+        sa.event.listen(engine, "before_cursor_execute", _record)
+        try:
+            ConceptMapper(chunk_size=4).map_codes(mapping_session, CODES)
+        finally:
+            sa.event.remove(engine, "before_cursor_execute", _record)
+
+        # six distinct codes in chunks of four
+        assert len(statements) == 2
+
+    def test_preload_answers_from_memory(self, mapping_session, monkeypatch):
+        mapper = ConceptMapper()
+
+        assert mapper.preload(mapping_session, ["SNOMED", "LOCAL"]) == 3
+        assert mapper.preloaded == {"SNOMED", "LOCAL"}
+
+        def _fail(*args, **kwargs):
+            raise AssertionError("preloaded vocabularies should not be queried")
+
+        monkeypatch.setattr(mapper, "_code_rows", _fail)
+        monkeypatch.setattr(mapper, "_concept_rows", _fail)
+        assert mapper.map_codes(mapping_session, CODES) == EXPECTED_CODES
+        assert mapper.map_concept_ids(mapping_session, [45000002]) == {
+            45000002: SourceMapping(targets=(32546, 201826))
+        }
+
+    def test_preload_is_incremental_and_clearable(self, mapping_session):
+        mapper = ConceptMapper()
+        mapper.preload(mapping_session, ["LOCAL"])
+
+        assert mapper.preload(mapping_session, ["LOCAL"]) == 0
+        assert mapper.map_codes(mapping_session, CODES) == EXPECTED_CODES
+
+        mapper.clear()
+        assert mapper.preloaded == frozenset()
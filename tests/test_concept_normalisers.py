@@ -0,0 +1,99 @@
+"""Tests for compiled normaliser pipelines."""
+
+import pytest
+
+from omop_alchemy.cdm.handlers.vocabs_and_mappers import (
+    compile_normalizers,
+    compose_normalizers,
+    concept_normalisers,
+    make_stage,
+    normalize_default,
+    strip_uicc,
+)
+from omop_alchemy.cdm.handlers.vocabs_and_mappers.concept_normalisers import (
+    Lower,
+    Replace,
+    Strip,
+    _fuse,
+    _single_pass_safe,
+)
+
+TERMS = [
+    "",
+    "  Stage-III NOS ",
+    "AJCC Stage-IV",
+    "stage-iiia",
+    "Stage-I",
+    "nos",
+    "C50.9",
+    "  Type 2 Diabetes Mellitus  ",
+]
+
+
+@pytest.mark.parametrize(
+    "fns",
+    [
+        (normalize_default,),
+        (normalize_default, make_stage),
+        (normalize_default, strip_uicc, make_stage),
+        (make_stage, str.upper, normalize_default),
+    ],
+)
+def test_compiled_matches_composed(fns):
+    composed = compose_normalizers(*fns)
+    compiled = compile_normalizers(*fns)
+
+    assert [compiled(t) for t in TERMS] == [composed(t) for t in TERMS]
+
+
+def test_single_pass_paths_match_chained_replace(monkeypatch):
+    monkeypatch.setattr(concept_normalisers, "_SINGLE_PASS_MIN_PATTERNS", 1)
+
+    stage = compile_normalizers(normalize_default, make_stage)
+    translated = compile_normalizers(Replace((("-", " "), ("/", " "))))
+
+    assert [stage(t) for t in TERMS] == [make_stage(normalize_default(t)) for t in TERMS]
+    assert translated("ajcc/uicc-iii") == "ajcc uicc iii"
+
+
+def test_compiled_bare_steps_match_str_methods():
+    compiled = compile_normalizers(Strip(), Lower(), Strip(), str.upper, Lower(), Replace((("x", ""),)), Strip())
+    composed = compose_normalizers(
+        str.strip, str.lower, str.strip, str.upper, str.lower, lambda s: s.replace("x", ""), str.strip
+    )
+
+    assert [compiled(t) for t in TERMS + [" Xx  max "]] == [composed(t) for t in TERMS + [" Xx  max "]]
+
+
+def test_compiled_normaliser_has_a_descriptive_name():
+    compiled = compile_normalizers(normalize_default, make_stage)
+
+    assert compiled.__qualname__ == "compile_normalizers(normalize_default, make_stage)"
+
+
+def test_fuse_drops_redundant_steps():
+    steps = [Strip(), Lower(), Lower(), Replace((("-iii", "-3"),)), Replace((("x", "y"),)), Lower(), Strip()]
+
+    assert _fuse(steps) == [Strip(), Lower(), Replace((("-iii", "-3"), ("x", "y"))), Strip()]
+
+
+@pytest.mark.parametrize(
+    "table, safe",
+    [
+        ((("-iii", "-3"), ("-iv", "-4"), ("-ii", "-2"), ("-i", "-1"), ("nos", "")), True),
+        # a later pattern that starts inside an earlier one wins a left-to-right scan
+        ((("aab", "X"), ("aa", "Y")), False),
+        # the deletion can splice neighbours into a later match
+        ((("x", ""), ("ab", "Y")), False),
+        # the first replacement produces text the second one matches
+        ((("a", "b"), ("b", "c")), False),
+    ],
+)
+def test_single_pass_safety(table, safe):
+    assert _single_pass_safe(table) is safe
+
+
+def test_compiled_name_is_descriptive():
+    assert compile_normalizers(normalize_default, make_stage).__qualname__ == (
+        "compile_normalizers(normalize_default, make_stage)"
+    )
@@ -0,0 +1,829 @@
+"""Tests for vocabulary lookup indexes, resolvers and the resolver registry."""
+
+import types
+from datetime import date
+
+import pytest
+
+from omop_alchemy.cdm.handlers.vocabs_and_mappers import (
+    ConceptResolver,
+    ConceptResolverRegistry,
+    FuzzyIndex,
+    LookupCollision,
+    LookupCollisionError,
+    LookupDelta,
+    LookupIndex,
+    LookupSnapshotCache,
+    LookupSpec,
+    LookupStats,
+    SharedLookupMapping,
+    open_lookup_snapshot,
+    read_lookup_snapshot,
+    write_lookup_snapshot,
+)
+from omop_alchemy.cdm.handlers.vocabs_and_mappers.lookup_snapshot import (
+    LookupSnapshotError,
+    spec_fingerprint,
+)
+from omop_alchemy.cdm.handlers.vocabs_and_mappers.vocab_handlers import (
+    OMOPConceptSource,
+)
+from omop_alchemy.cdm.model import ConceptRow
+from omop_alchemy.cdm.model.vocabulary import Concept, Concept_Ancestor, Concept_Synonym
+
+
+@pytest.fixture
+def synonym_session(session):
+    """Session with a couple of concept synonyms added (rolled back after the test)."""
+    session.add_all(
+        [
+            Concept_Synonym(concept_id=201826, concept_synonym_name="T2DM", language_concept_id=8507),
+            Concept_Synonym(concept_id=8507, concept_synonym_name="Male sex", language_concept_id=8507),
+        ]
+    )
+    session.flush()
+    return session
+
+
+@pytest.fixture
+def ancestor_session(session):
+    """Session with a small hierarchy: 32546 -> 201826, plus self-links (rolled back after the test)."""
+    session.add_all(
+        [
+            Concept_Ancestor(ancestor_concept_id=201826, descendant_concept_id=201826, min_levels_of_separation=0, max_levels_of_separation=0),
+            Concept_Ancestor(ancestor_concept_id=32546, descendant_concept_id=32546, min_levels_of_separation=0, max_levels_of_separation=0),
+            Concept_Ancestor(ancestor_concept_id=32546, descendant_concept_id=201826, min_levels_of_separation=1, max_levels_of_separation=2),
+        ]
+    )
+    session.flush()
+    return session
+
+
+def _stage_index() -> LookupIndex:
+    return LookupIndex(
+        name="stage",
+        unknown=0,
+        mapping={
+            "stage iii": 3,
+            "stage-3": 3,
+            "stage ii": 2,
+            "stade ⅱ": 2,
+        },
+    )
+
+
+class TestOMOPConceptSource:
+    def test_iter_concepts_streams_concept_rows(self, session):
+        rows = OMOPConceptSource.iter_concepts(session, domain_id="Condition", batch_size=1)
+
+        assert isinstance(rows, types.GeneratorType)
+        assert list(rows) == [
+            ConceptRow(
+                concept_id=201826,
+                concept_name="Type 2 diabetes mellitus",
+                concept_code="44054006",
+                domain_id="Condition",
+                concept_class_id="Clinical Finding",
+                vocabulary_id="SNOMED",
+                standard_concept="S",
+            )
+        ]
+
+    def test_fetch_concepts_from_overlapping_parents_is_distinct(self, ancestor_session):
+        rows = OMOPConceptSource.fetch_concepts(ancestor_session, parents=[201826, 32546])
+
+        assert sorted(r.concept_id for r in rows) == [32546, 201826]
+
+    def test_synonyms_are_scoped_to_spec_in_sql(self, synonym_session):
+        spec = LookupSpec(name="conditions", domain_id="Condition", include_synonyms=True)
+
+        index = OMOPConceptSource.build_lookup(synonym_session, spec)
+
+        assert index.lookup("t2dm") == 201826
+        assert "male sex" not in index
+
+    def test_synonym_scopes_agree(self, synonym_session):
+        spec = LookupSpec(name="conditions", domain_id="Condition", include_synonyms=True)
+
+        scoped = OMOPConceptSource.build_lookup(synonym_session, spec, synonym_scope="spec")
+        full = OMOPConceptSource.build_lookup(synonym_session, spec, synonym_scope="all")
+
+        assert scoped == full
+
+    def test_descendants_many_matches_per_set_expansion(self, ancestor_session):
+        ancestor_session.get(Concept, 201826).standard_concept = None
+        ancestor_session.flush()
+        parent_sets = {"episodes": [32546], "diabetes": [201826], "both": [201826, 32546], "none": [], "unknown": [999]}
+
+        for include_non_standard in (False, True):
+            expanded = OMOPConceptSource.descendants_many(
+                ancestor_session, parent_sets, include_non_standard=include_non_standard, chunk_size=2
+            )
+
+            assert list(expanded) == list(parent_sets)
+            for name, parents in parent_sets.items():
+                rows = OMOPConceptSource.fetch_concepts(
+                    ancestor_session,
+                    parents=parents,
+                    standard_only=not include_non_standard,
+                    include_non_standard_descendants=include_non_standard,
+                ) if parents else []
+                assert expanded[name] == sorted(r.concept_id for r in rows)
+        assert expanded["both"] == [32546, 201826]
+
+    def test_descendants_skip_ids_without_concept_row_and_are_sorted(self, ancestor_session):
+        ancestor_session.add(
+            Concept_Ancestor(ancestor_concept_id=32546, descendant_concept_id=999, min_levels_of_separation=1, max_levels_of_separation=1)
+        )
+        ancestor_session.flush()
+
+        for include_non_standard in (False, True):
+            assert OMOPConceptSource.descendants(
+                ancestor_session, [201826, 32546], include_non_standard=include_non_standard
+            ) == [32546, 201826]
+
+    def test_descendants_many_issues_one_query(self, ancestor_session):
+        import sqlalchemy as sa
+
+        statements: list[str] = []
+
+        def _record(conn, cursor, statement, *args):
+            statements.append(statement)
+
+        engine = ancestor_session.get_bind()
+        sa.event.listen(engine, "before_cursor_execute", _record)
+        try:
+            expanded = OMOPConceptSource.descendants_many(ancestor_session, {"a": [32546], "b": [201826]})
+        finally:
+            sa.event.remove(engine, "before_cursor_execute", _record)
+
+        assert expanded == {"a": [32546, 201826], "b": [201826]}
+        assert len(statements) == 1
+        assert "concept_name" not in statements[0]
+
+    def test_build_lookups_matches_individual_builds(self, ancestor_session):
+        ancestor_session.add(
+            Concept_Synonym(concept_id=201826, concept_synonym_name="T2DM", language_concept_id=8507)
+        )
+        ancestor_session.flush()
+        specs = [
+            LookupSpec(name="conditions", domain_id="Condition", include_synonyms=True),
+            LookupSpec(name="genders", domain_id="Gender", include=("concept_code",)),
+            LookupSpec(name="episodes", parents=[32546]),
+            LookupSpec(name="everything", standard_only=False, include_synonyms=True),
+        ]
+
+        combined = OMOPConceptSource.build_lookups(ancestor_session, specs)
+
+        assert list(combined) == [spec.name for spec in specs]
+        for spec in specs:
+            assert combined[spec.name] == OMOPConceptSource.build_lookup(ancestor_session, spec)
+        assert combined["everything"].lookup("t2dm") == 201826
+
+    def test_build_lookups_uses_one_concept_scan(self, synonym_session):
+        import sqlalchemy as sa
+
+        statements: list[str] = []
+
+        def _record(conn, cursor, statement, *args):
+            statements.append(statement)
+
+        engine = synonym_session.get_bind()
+        specs = [LookupSpec(name=f"spec{i}", domain_id=d, include_synonyms=True) for i, d in enumerate(["Condition", "Gender", "Visit"])]
+
+        sa.event.listen(engine, "before_cursor_execute", _record)
+        try:
+            OMOPConceptSource.build_lookups(synonym_session, specs)
+        finally:
+            sa.event.remove(engine, "before_cursor_execute", _record)
+
+        assert sum("concept_synonym" not in s.lower() for s in statements) == 1
+        assert sum("concept_synonym" in s.lower() for s in statements) == 1
+
+    def test_build_lookups_rejects_duplicate_names(self, session):
+        with pytest.raises(ValueError):
+            OMOPConceptSource.build_lookups(session, [LookupSpec(name="a"), LookupSpec(name="a")])
+
+    def test_iter_synonyms_without_scope_returns_all(self, synonym_session):
+        pairs = set(OMOPConceptSource.iter_synonyms(synonym_session, batch_size=1))
+
+        assert pairs == {(201826, "T2DM"), (8507, "Male sex")}
+
+
+RELEASE = date(2024, 8, 30)
+
+
+def _apply_release(session):
+    """Simulate a vocabulary release: one new condition, one deprecated, one renamed."""
+    session.add(
+        Concept(
+            concept_id=201254,
+            concept_name="Type 1 diabetes mellitus",
+            domain_id="Condition",
+            vocabulary_id="SNOMED",
+            concept_class_id="Clinical Finding",
+            standard_concept="S",
+            concept_code="46635009",
+            valid_start_date=RELEASE,
+            valid_end_date=date(2099, 12, 31),
+        )
+    )
+    deprecated = session.get(Concept, 201826)
+    deprecated.standard_concept = None
+    deprecated.invalid_reason = "D"
+    deprecated.valid_end_date = RELEASE
+    renamed = session.get(Concept, 8507)
+    renamed.concept_name = "Male"
+    renamed.valid_start_date = RELEASE
+    session.flush()
+
+
+class TestLookupDelta:
+    def test_apply_delta_replaces_concept_keys(self):
+        delta = LookupDelta(upserts={3: ("stage 3",), 4: ("stage iv",)}, removed=frozenset({2}))
+
+        updated = _stage_index().apply_delta(delta)
+
+        assert updated.mapping == {"stage 3": 3, "stage iv": 4}
+        assert _stage_index().lookup("stage ii") == 2
+
+    def test_lookup_delta_reads_only_changes(self, session):
+        _apply_release(session)
+        spec = LookupSpec(name="conditions", domain_id="Condition")
+
+        delta = OMOPConceptSource.lookup_delta(session, spec, since=RELEASE)
+
+        assert delta.upserts == {201254: ("type 1 diabetes mellitus", "46635009")}
+        assert delta.removed == {201826, 8507}
+
+    def test_delta_matches_full_rebuild(self, session):
+        spec = LookupSpec(name="everything", standard_only=False)
+        before = OMOPConceptSource.build_lookup(session, spec)
+
+        _apply_release(session)
+        delta = OMOPConceptSource.lookup_delta(session, spec, since=RELEASE)
+
+        assert before.apply_delta(delta) == OMOPConceptSource.build_lookup(session, spec)
+
+
+@pytest.fixture
+def colliding_session(session):
+    """Two conditions named "Diabetes": a valid non-standard one and a deprecated standard one."""
+    common = dict(
+        concept_name="Diabetes",
+        domain_id="Condition",
+        vocabulary_id="SNOMED",
+        concept_class_id="Clinical Finding",
+        valid_start_date=date(1970, 1, 1),
+        valid_end_date=date(2099, 12, 31),
+    )
+    session.add_all(
+        [
+            Concept(concept_id=201254, concept_code="73211009", standard_concept=None, **common),
+            Concept(concept_id=4000001, concept_code="11530004", standard_concept="S", invalid_reason="D", **common),
+        ]
+    )
+    session.flush()
+    return session
+
+
+class TestCollisions:
+    @staticmethod
+    def _spec(policy: str) -> LookupSpec:
+        return LookupSpec(name="condition", domain_id="Condition", standard_only=False, collision_policy=policy)
+
+    @pytest.mark.parametrize(
+        "policy, winner",
+        [
+            ("last_wins", 4000001),
+            ("first_wins", 201254),
+            ("prefer_standard", 4000001),
+            ("prefer_valid", 201254),
+        ],
+    )
+    def test_policy_picks_winner(self, colliding_session, policy, winner):
+        index = OMOPConceptSource.build_lookup(colliding_session, self._spec(policy))
+
+        assert index.lookup("diabetes") == winner
+        assert index.collisions == (
+            LookupCollision(key="diabetes", concept_id=winner, candidates=(201254, 4000001)),
+        )
+
+    def test_error_policy_lists_collisions(self, colliding_session):
+        with pytest.raises(LookupCollisionError, match="diabetes") as excinfo:
+            OMOPConceptSource.build_lookup(colliding_session, self._spec("error"))
+
+        assert [c.key for c in excinfo.value.collisions] == ["diabetes"]
+
+    def test_no_collisions_reported_for_unique_keys(self, session):
+        index = OMOPConceptSource.build_lookup(session, self._spec("error"))
+
+        assert index.collisions == ()
+
+    def test_batched_build_reports_same_collisions(self, colliding_session):
+        specs = [self._spec("prefer_valid"), LookupSpec(name="gender", domain_id="Gender")]
+
+        built = OMOPConceptSource.build_lookups(colliding_session, specs)
+
+        single = OMOPConceptSource.build_lookup(colliding_session, specs[0])
+        assert built["condition"].mapping == single.mapping
+        assert built["condition"].collisions == single.collisions
+        assert built["gender"].collisions == ()
+
+    def test_synonym_shared_with_other_concept_collides(self, session):
+        session.add(Concept_Synonym(concept_id=201826, concept_synonym_name="Male", language_concept_id=8507))
+        session.flush()
+        spec = LookupSpec(name="all", include_synonyms=True, collision_policy="first_wins")
+
+        index = OMOPConceptSource.build_lookup(session, spec)
+
+        assert index.lookup("male") == 8507
+        assert index.collisions == (LookupCollision(key="male", concept_id=8507, candidates=(8507, 201826)),)
+
+    def test_collisions_survive_snapshot_and_pickle(self, colliding_session, tmp_path):
+        import pickle
+
+        index = OMOPConceptSource.build_lookup(colliding_session, self._spec("first_wins"))
+        path = write_lookup_snapshot(index, tmp_path / "condition.oaidx")
+
+        assert read_lookup_snapshot(path)[0].collisions == index.collisions
+        assert open_lookup_snapshot(path).collisions == index.collisions
+        assert pickle.loads(pickle.dumps(index)).collisions == index.collisions
+
+    def test_apply_delta_drops_collisions_of_changed_concepts(self, colliding_session):
+        index = OMOPConceptSource.build_lookup(colliding_session, self._spec("first_wins"))
+
+        refreshed = index.apply_delta(LookupDelta(upserts={}, removed=frozenset({4000001})))
+
+        assert refreshed.collisions == ()
+
+    def test_apply_delta_rejects_ranked_policies(self, colliding_session):
+        index = OMOPConceptSource.build_lookup(colliding_session, self._spec("prefer_valid"))
+
+        with pytest.raises(ValueError, match="last_wins"):
+            index.apply_delta(LookupDelta(upserts={}, removed=frozenset()), collision_policy="prefer_valid")
+
+    def test_policy_is_part_of_fingerprint(self):
+        assert spec_fingerprint(self._spec("first_wins"), ()) != spec_fingerprint(self._spec("last_wins"), ())
+
+
+class TestLookupSnapshot:
+    def test_round_trip_preserves_mapping(self, tmp_path):
+        index = _stage_index()
+        path = write_lookup_snapshot(index, tmp_path / "stage.oaidx", fingerprint="abc")
+
+        loaded, fingerprint = read_lookup_snapshot(path)
+
+        assert fingerprint == "abc"
+        assert loaded == index
+
+    def test_round_trip_of_empty_index(self, tmp_path):
+        index = LookupIndex(name="empty", unknown=None, mapping={})
+        loaded, _ = read_lookup_snapshot(write_lookup_snapshot(index, tmp_path / "e.oaidx"))
+
+        assert loaded == index
+
+    def test_rejects_foreign_file(self, tmp_path):
+        path = tmp_path / "bogus.oaidx"
+        path.write_bytes(b"not a snapshot at all")
+
+        with pytest.raises(LookupSnapshotError):
+            read_lookup_snapshot(path)
+
+    def test_fingerprint_tracks_vocabulary_version(self):
+        spec = LookupSpec(name="conditions", domain_id="Condition")
+
+        v1 = spec_fingerprint(spec, (("SNOMED", "2023"),))
+        v2 = spec_fingerprint(spec, (("SNOMED", "2024"),))
+
+        assert v1 != v2
+        assert v1 == spec_fingerprint(LookupSpec(name="conditions", domain_id="Condition"), (("SNOMED", "2023"),))
+
+    def test_cache_builds_once_then_loads(self, session, tmp_path, monkeypatch):
+        cache = LookupSnapshotCache(tmp_path)
+        spec = LookupSpec(name="conditions", domain_id="Condition")
+
+        built = cache.get_or_build(session, spec)
+        assert built.lookup("type 2 diabetes mellitus") == 201826
+
+        def _fail(*args, **kwargs):
+            raise AssertionError("index should have been served from the snapshot")
+
+        monkeypatch.setattr(
+            "omop_alchemy.cdm.handlers.vocabs_and_mappers.lookup_snapshot.OMOPConceptSource.build_lookup",
+            _fail,
+        )
+        assert cache.get_or_build(session, spec) == built
+
+
+def _attached_lookup(shared, term):
+    """Worker-side half of the share/attach test (module level so it pickles)."""
+    import sqlalchemy as sa
+
+    registry = ConceptResolverRegistry(sa.create_engine("sqlite://"))
+    registry.register_spec("condition", LookupSpec(name="condition", domain_id="Condition"))
+    registry.attach(shared)
+    resolver = registry.get("condition")
+    return type(resolver.index.mapping).__name__, resolver.lookup(term)
+
+
+class TestSharedLookup:
+    def test_shared_mapping_matches_dict(self, tmp_path):
+        index = _stage_index()
+        shared = open_lookup_snapshot(write_lookup_snapshot(index, tmp_path / "stage.oaidx"))
+
+        assert isinstance(shared.mapping, SharedLookupMapping)
+        assert shared == index
+        assert shared.lookup("stade ⅱ") == 2
+        assert shared.lookup("stage iv") == 0
+        assert "stage-3" in shared and 3 in shared and 4 not in shared
+        assert shared.all_concepts == {2, 3}
+        assert shared.keys_for(3) == ("stage iii", "stage-3")
+        assert shared.keys_for(99) == ()
+
+    def test_resolver_over_shared_index(self, tmp_path):
+        index = open_lookup_snapshot(write_lookup_snapshot(_stage_index(), tmp_path / "stage.oaidx"))
+        resolver = ConceptResolver(index, corrections=[lambda t: t.replace("3", "iii")])
+
+        assert resolver.lookup(" Stage III ") == 3
+        assert resolver.lookup_many(["stage 3", "stage ii"]).concept_ids == [3, 2]
+
+    def test_pickles_as_path(self, tmp_path):
+        import pickle
+
+        index = open_lookup_snapshot(write_lookup_snapshot(_stage_index(), tmp_path / "stage.oaidx"))
+        payload = pickle.dumps(index)
+
+        assert len(payload) < 512
+        assert pickle.loads(payload) == index
+
+    def test_empty_index(self, tmp_path):
+        index = LookupIndex(name="empty", unknown=None, mapping={})
+        shared = open_lookup_snapshot(write_lookup_snapshot(index, tmp_path / "e.oaidx"))
+
+        assert shared.lookup("anything") is None
+        assert len(shared.all_concepts) == 0
+
+    def test_registry_share_and_attach_across_processes(self, engine, tmp_path):
+        import multiprocessing
+        from concurrent.futures import ProcessPoolExecutor
+
+        registry = ConceptResolverRegistry(engine)
+        registry.register_spec("condition", LookupSpec(name="condition", domain_id="Condition"))
+        shared = registry.share(directory=tmp_path)
+
+        ctx = multiprocessing.get_context("spawn")
+        with ProcessPoolExecutor(max_workers=1, mp_context=ctx) as pool:
+            kind, concept_id = pool.submit(_attached_lookup, shared, "Type 2 diabetes mellitus").result()
+
+        assert kind == "SharedLookupMapping"
+        assert concept_id == 201826
+
+    def test_share_requires_spec_registration(self, engine):
+        registry = ConceptResolverRegistry(engine)
+        registry.register("stage", lambda session: ConceptResolver(_stage_index()))
+
+        with pytest.raises(KeyError):
+            registry.share(["stage"])
+
+
+class TestConceptResolverRegistry:
+    def test_register_spec_uses_snapshot_dir(self, engine, tmp_path):
+        registry = ConceptResolverRegistry(engine, snapshot_dir=tmp_path)
+        registry.register_spec("condition", LookupSpec(name="condition", domain_id="Condition"))
+
+        resolver = registry.get("condition")
+
+        assert isinstance(resolver, ConceptResolver)
+        assert resolver.lookup("44054006") == 201826
+        assert list(tmp_path.glob("condition-*.oaidx"))
+
+
+class TestLookupMany:
+    def _resolver(self) -> ConceptResolver:
+        return ConceptResolver(_stage_index(), corrections=[lambda t: t.replace("3", "iii")])
+
+    def test_matches_scalar_lookup(self):
+        resolver = self._resolver()
+        terms = [" Stage III", "stage 3", "stage ii", "stage iii", None, "", "stage iv", "STAGE III"]
+
+        result = resolver.lookup_many(terms)
+
+        assert result.concept_ids == [resolver.lookup(t) for t in terms]
+        assert result.stats == LookupStats(total=8, unique=7, hits=4, correction_hits=1, misses=3)
+
+    def test_series_input_keeps_index(self):
+        import pandas as pd
+
+        terms = pd.Series(["stage ii", None, "stage iii"], index=[10, 20, 30], name="stage")
+
+        result = self._resolver().lookup_many(terms)
+
+        assert list(result.concept_ids.index) == [10, 20, 30]
+        assert result.concept_ids.name == "stage"
+        assert result.concept_ids.tolist() == [2, 0, 3]
+
+    def test_custom_normalizer_is_used_for_unique_values(self):
+        calls: list[str] = []
+
+        def _norm(term: str) -> str:
+            calls.append(term)
+            return term.lower()
+
+        resolver = ConceptResolver(_stage_index(), normalizer=_norm)
+        result = resolver.lookup_many(["Stage II"] * 5)
+
+        assert result.concept_ids == [2] * 5
+        assert calls == ["Stage II"]
+
+
+class TestResolverCache:
+    def test_disabled_by_default(self):
+        resolver = ConceptResolver(_stage_index())
+
+        assert resolver.cache_info() is None
+        assert resolver.lookup("stage ii") == 2
+
+    def test_misses_are_cached_without_rerunning_corrections(self):
+        calls: list[str] = []
+
+        def _correction(term: str) -> str:
+            calls.append(term)
+            return term
+
+        resolver = ConceptResolver(_stage_index(), corrections=[_correction], cache_size=16)
+
+        assert [resolver.lookup("stage x") for _ in range(3)] == [0, 0, 0]
+        assert calls == ["stage x"]
+
+        info = resolver.cache_info()
+        assert (info.hits, info.misses, info.currsize) == (2, 1, 1)
+
+    def test_cache_is_bounded(self):
+        resolver = ConceptResolver(_stage_index(), cache_size=2)
+
+        for term in ("stage ii", "stage iii", "stage-3", "stage ii"):
+            resolver.lookup(term)
+
+        info = resolver.cache_info()
+        assert info.currsize == 2
+        assert info.misses == 4
+
+        resolver.cache_clear()
+        assert resolver.cache_info().currsize == 0
+
+    def test_repr_reports_cache_size_only_when_enabled(self):
+        assert "cache=" not in repr(ConceptResolver(_stage_index()))
+        assert "cache=0" in repr(ConceptResolver(_stage_index(), cache_size=4))
+
+
+class TestLookupIndexReverse:
+    def test_concept_membership_and_keys(self):
+        index = _stage_index()
+
+        assert 3 in index
+        assert 4 not in index
+        assert index.all_concepts == {2, 3}
+        assert sorted(index.keys_for(3)) == ["stage iii", "stage-3"]
+        assert index.keys_for(99) == ()
+
+    def test_resolver_membership_uses_index(self):
+        resolver = ConceptResolver(_stage_index())
+
+        assert 2 in resolver
+        assert 5 not in resolver
+        assert resolver.all_concepts is resolver.index.all_concepts
+
+    def test_reverse_index_does_not_affect_equality(self):
+        assert _stage_index() == _stage_index()
+
+
+class TestFuzzyTier:
+    def test_bounded_distance_counts_transpositions_once(self):
+        from omop_alchemy.cdm.handlers.vocabs_and_mappers.fuzzy_index import (
+            bounded_distance,
+        )
+
+        assert bounded_distance("stage", "stgae", 2) == 1
+        assert bounded_distance("stage", "stag", 2) == 1
+        assert bounded_distance("stage iii", "stage i", 1) is None
+
+    def test_bounded_distance_matches_full_osa(self):
+        import random
+
+        from omop_alchemy.cdm.handlers.vocabs_and_mappers.fuzzy_index import (
+            bounded_distance,
+        )
+
+        def osa(a, b):
+            d = [[i + j if i * j == 0 else 0 for j in range(len(b) + 1)] for i in range(len(a) + 1)]
+            for i in range(1, len(a) + 1):
+                for j in range(1, len(b) + 1):
+                    d[i][j] = min(d[i - 1][j] + 1, d[i][j - 1] + 1, d[i - 1][j - 1] + (a[i - 1] != b[j - 1]))
+                    if i > 1 and j > 1 and a[i - 1] == b[j - 2] and a[i - 2] == b[j - 1]:
+                        d[i][j] = min(d[i][j], d[i - 2][j - 2] + 1)
+            return d[-1][-1]
+
+        rng = random.Random(0)
+        for _ in range(2000):
+            a = "".join(rng.choice("abc ") for _ in range(rng.randint(0, 9)))
+            b = "".join(rng.choice("abc ") for _ in range(rng.randint(0, 9)))
+            for bound in (0, 1, 2, 3):
+                expected = osa(a, b)
+                assert bounded_distance(a, b, bound) == (expected if expected <= bound else None), (a, b, bound)
+
+    def test_shared_stems_keep_candidate_fan_out_small(self):
+        sites = [f"{site} {n}" for site in ("breast", "lung", "colon", "kidney", "liver") for n in range(400)]
+        keys = [f"{stem} {site}" for stem in ("malignant neoplasm of", "benign neoplasm of") for site in sites]
+        fuzzy = FuzzyIndex(keys)
+
+        # a prefix alone would admit all 2000 "malignant neoplasm of" keys
+        assert len(fuzzy.candidates("malignant neoplasm of lugn 17")) < 100
+        assert fuzzy.best_match("malignant neoplasm of lugn 17").key == "malignant neoplasm of lung 17"
+        assert fuzzy.best_match("malignnt neoplasm of colon 399").key == "malignant neoplasm of colon 399"
+
+    def test_best_match_prefers_lowest_distance(self):
+        fuzzy = FuzzyIndex(["stage iii", "stage ii", "stage iv"])
+
+        match = fuzzy.best_match("stage iiii")
+
+        assert match.key == "stage iii"
+        assert match.distance == 1
+        assert fuzzy.best_match("completely different") is None
+
+    def test_typo_in_prefix_is_found(self):
+        fuzzy = FuzzyIndex(["type 2 diabetes mellitus"], max_edit_distance=2)
+
+        assert fuzzy.best_match("tpye 2 diabetes melitus").key == "type 2 diabetes mellitus"
+
+    def test_resolver_tier_is_opt_in(self):
+        plain = ConceptResolver(_stage_index())
+        fuzzy = ConceptResolver(_stage_index(), fuzzy_threshold=0.8)
+
+        assert plain.lookup("stgae iii") == 0
+        assert fuzzy.lookup("stgae iii") == 3
+        assert fuzzy.match_fuzzy("Stgae III").key == "stage iii"
+
+    def test_threshold_rejects_weak_matches(self):
+        resolver = ConceptResolver(_stage_index(), fuzzy_threshold=0.95)
+
+        assert resolver.lookup("stgae iii") == 0
+
+    def test_fuzzy_index_is_shared_per_lookup_index(self):
+        index = _stage_index()
+
+        assert index.fuzzy_index() is index.fuzzy_index()
+
+    def test_lookup_many_counts_fuzzy_hits(self):
+        resolver = ConceptResolver(_stage_index(), fuzzy_threshold=0.8)
+
+        result = resolver.lookup_many(["stage ii", "stgae iii", "nothing like it"])
+
+        assert result.concept_ids == [2, 3, 0]
+        assert (result.stats.hits, result.stats.fuzzy_hits, result.stats.misses) == (1, 1, 1)
+
+    def _slow_registry(self, engine, calls, *, fail_first=False):
+        import threading
+        import time
+
+        registry = ConceptResolverRegistry(engine)
+        lock = threading.Lock()
+
+        def _build(session):
+            with lock:
+                calls.append(threading.get_ident())
+                attempt = len(calls)
+            time.sleep(0.05)
+            if fail_first and attempt == 1:
+                raise RuntimeError("vocabulary unavailable")
+            return ConceptResolver(_stage_index())
+
+        registry.register("stage", _build)
+        return registry
+
+    def test_concurrent_get_builds_once(self, engine):
+        from concurrent.futures import ThreadPoolExecutor
+
+        calls: list[int] = []
+        registry = self._slow_registry(engine, calls)
+
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            resolvers = list(pool.map(lambda _: registry.get("stage"), range(8)))
+
+        assert len(calls) == 1
+        assert all(r is resolvers[0] for r in resolvers)
+
+    def test_failed_build_reaches_waiters_and_is_retried(self, engine):
+        from concurrent.futures import ThreadPoolExecutor
+
+        calls: list[int] = []
+        registry = self._slow_registry(engine, calls, fail_first=True)
+
+        with ThreadPoolExecutor(max_workers=4) as pool:
+            futures = [pool.submit(registry.get, "stage") for _ in range(4)]
+        errors = [f.exception() for f in futures]
+
+        assert len(calls) == 1
+        assert all(isinstance(e, RuntimeError) for e in errors)
+        assert registry.get("stage").lookup("stage ii") == 2
+        assert len(calls) == 2
+
+    def test_aget_shares_single_build(self, engine):
+        import asyncio
+
+        calls: list[int] = []
+        registry = self._slow_registry(engine, calls)
+
+        async def _main():
+            return await asyncio.gather(*(registry.aget("stage") for _ in range(5)))
+
+        resolvers = asyncio.run(_main())
+
+        assert len(calls) == 1
+        assert all(r is resolvers[0] for r in resolvers)
+
+    def test_warm_builds_all_registered(self, engine):
+        registry = ConceptResolverRegistry(engine)
+        registry.register_spec("condition", LookupSpec(name="condition", domain_id="Condition"))
+        registry.register_spec("gender", LookupSpec(name="gender", domain_id="Gender"))
+
+        results = registry.warm(max_workers=2)
+
+        assert [r.name for r in results] == ["condition", "gender"]
+        assert all(r.ok and not r.already_built and r.keys > 0 for r in results)
+        assert registry.warm(["gender"])[0].already_built
+
+    def test_warm_reports_failures_without_stopping(self, engine):
+        registry = ConceptResolverRegistry(engine)
+
+        def _broken(session):
+            raise RuntimeError("boom")
+
+        registry.register("broken", _broken)
+        registry.register("stage", lambda session: ConceptResolver(_stage_index()))
+
+        broken, stage = registry.warm()
+
+        assert not broken.ok and broken.error == "boom"
+        assert stage.ok and (stage.keys, stage.concepts) == (4, 2)
+
+    def test_warm_rejects_unknown_names(self, engine):
+        with pytest.raises(KeyError):
+            ConceptResolverRegistry(engine).warm(["missing"])
+
+    def test_refresh_updates_built_resolvers_in_place(self, engine, monkeypatch):
+        registry = ConceptResolverRegistry(engine)
+        registry.register_spec("condition", LookupSpec(name="condition", domain_id="Condition"), cache_size=8)
+        registry.register_spec("gender", LookupSpec(name="gender", domain_id="Gender"))
+        resolver = registry.get("condition")
+        assert resolver.lookup("type 2 diabetes mellitus") == 201826
+
+        delta = LookupDelta(upserts={201254: ("type 1 diabetes mellitus",)}, removed=frozenset({201826}))
+        monkeypatch.setattr(
+            "omop_alchemy.cdm.handlers.vocabs_and_mappers.concept_registry.OMOPConceptSource.lookup_delta",
+            lambda session, spec, since: delta,
+        )
+
+        (result,) = registry.refresh(since=RELEASE)
+
+        assert (result.name, result.upserted, result.removed) == ("condition", 1, 1)
+        assert registry.get("condition") is resolver
+        assert resolver.lookup("type 2 diabetes mellitus") == 0
+        assert resolver.lookup("type 1 diabetes mellitus") == 201254
+
+    def test_refresh_does_not_snapshot_delta_applied_index(self, engine, monkeypatch, tmp_path):
+        registry = ConceptResolverRegistry(engine, snapshot_dir=tmp_path)
+        spec = LookupSpec(name="condition", domain_id="Condition")
+        registry.register_spec("condition", spec)
+        resolver = registry.get("condition")
+        (path,) = tmp_path.glob("condition-*.oaidx")
+        stored = path.read_bytes()
+
+        delta = LookupDelta(upserts={}, removed=frozenset({201826}))
+        monkeypatch.setattr(
+            "omop_alchemy.cdm.handlers.vocabs_and_mappers.concept_registry.OMOPConceptSource.lookup_delta",
+            lambda session, spec, since: delta,
+        )
+        registry.refresh(since=RELEASE)
+
+        assert resolver.lookup("type 2 diabetes mellitus") == 0
+        assert list(tmp_path.glob("condition-*.oaidx")) == [path]
+        assert path.read_bytes() == stored
+
+    def test_refresh_rebuilds_specs_with_ranked_collision_policy(self, engine, monkeypatch):
+        registry = ConceptResolverRegistry(engine)
+        spec = LookupSpec(name="condition", domain_id="Condition", collision_policy="first_wins")
+        registry.register_spec("condition", spec)
+        resolver = registry.get("condition")
+
+        # a delta that would wrongly drop the concept if it were applied
+        delta = LookupDelta(upserts={}, removed=frozenset({201826}))
+        monkeypatch.setattr(
+            "omop_alchemy.cdm.handlers.vocabs_and_mappers.concept_registry.OMOPConceptSource.lookup_delta",
+            lambda session, spec, since: delta,
+        )
+
+        (result,) = registry.refresh(since=RELEASE)
+
+        assert result.removed == 1
+        assert resolver.lookup("type 2 diabetes mellitus") == 201826
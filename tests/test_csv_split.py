@@ -0,0 +1,138 @@
+import io
+from pathlib import Path
+
+from omop_alchemy.maintenance._csv_split import (
+    CsvRangeStream,
+    copy_csv_range,
+    csv_byte_ranges,
+    plan_csv_split,
+)
+
+
+def _write_tab_csv(path: Path, rows: int, *, newline: str = "\n") -> Path:
+    lines = ["concept_id_1\tconcept_id_2\trelationship_id"]
+    lines += [f"{i}\t{i * 7}\tMaps to" for i in range(1, rows + 1)]
+    path.write_bytes((newline.join(lines) + newline).encode("utf-8"))
+    return path
+
+
+def _read_range(path: Path, start: int, end: int, block: int = 1 << 20) -> bytes:
+    out = b""
+    with open(path, "rb") as f:
+        stream = CsvRangeStream(f, start, end)
+        while data := stream.read(block):
+            out += data
+    return out
+
+
+def test_plan_csv_split_reads_tab_delimited_header(tmp_path):
+    path = _write_tab_csv(tmp_path / "CONCEPT_RELATIONSHIP.csv", 3)
+
+    plan = plan_csv_split(path, quote_mode="literal")
+
+    assert plan is not None
+    assert plan.columns == ("concept_id_1", "concept_id_2", "relationship_id")
+    assert plan.delimiter == "\t"
+    assert plan.body_start == len(b"concept_id_1\tconcept_id_2\trelationship_id\n")
+    assert plan.size == path.stat().st_size
+
+
+def test_plan_csv_split_rejects_quoted_comma_csv(tmp_path):
+    """Quoted fields may embed newlines, so a newline is not a safe cut point."""
+    path = tmp_path / "CONCEPT.csv"
+    path.write_text('concept_id,concept_name\n1,"a, b"\n2,"c\nd"\n', encoding="utf-8")
+
+    assert plan_csv_split(path) is None
+
+
+def test_plan_csv_split_rejects_tab_delimited_csv_quote_mode(tmp_path):
+    """In csv mode a quoted tab-delimited field can embed a newline just the same."""
+    path = tmp_path / "CONCEPT.csv"
+    path.write_text('concept_id\tconcept_name\n1\t"a"\n2\t"c\nd"\n', encoding="utf-8")
+
+    assert plan_csv_split(path) is None
+    assert plan_csv_split(_write_tab_csv(tmp_path / "CONCEPT_RELATIONSHIP.csv", 3), quote_mode="csv") is None
+
+
+def test_csv_byte_ranges_cut_on_record_boundaries(tmp_path):
+    path = _write_tab_csv(tmp_path / "CONCEPT_RELATIONSHIP.csv", 1000)
+    plan = plan_csv_split(path, quote_mode="literal")
+    body = path.read_bytes()[plan.body_start:]
+
+    ranges = csv_byte_ranges(plan, 4)
+
+    assert len(ranges) == 4
+    assert ranges[0][0] == plan.body_start and ranges[-1][1] == plan.size
+    assert all(a[1] == b[0] for a, b in zip(ranges, ranges[1:]))
+    chunks = [_read_range(path, start, end) for start, end in ranges]
+    assert b"".join(chunks) == body
+    assert all(chunk.endswith(b"\n") and chunk.count(b"\t") == 2 * chunk.count(b"\n") for chunk in chunks)
+
+
+def test_csv_byte_ranges_drop_empty_ranges(tmp_path):
+    path = _write_tab_csv(tmp_path / "CONCEPT_RELATIONSHIP.csv", 2)
+    plan = plan_csv_split(path, quote_mode="literal")
+
+    ranges = csv_byte_ranges(plan, 16)
+
+    assert 1 <= len(ranges) <= 2
+    assert b"".join(_read_range(path, s, e) for s, e in ranges) == path.read_bytes()[plan.body_start:]
+
+
+def test_csv_range_stream_normalises_crlf_across_reads(tmp_path):
+    path = _write_tab_csv(tmp_path / "CONCEPT_RELATIONSHIP.csv", 50, newline="\r\n")
+    plan = plan_csv_split(path, quote_mode="literal")
+    expected = path.read_bytes()[plan.body_start:].replace(b"\r\n", b"\n")
+
+    # tiny blocks force CRLF pairs to straddle reads
+    for block in (1, 2, 3, 7):
+        ranges = csv_byte_ranges(plan, 3)
+        assert b"".join(_read_range(path, s, e, block) for s, e in ranges) == expected
+
+
+def test_copy_csv_range_streams_range_without_header(tmp_path):
+    path = _write_tab_csv(tmp_path / "CONCEPT_RELATIONSHIP.csv", 10)
+    plan = plan_csv_split(path, quote_mode="literal")
+    start, end = csv_byte_ranges(plan, 2)[1]
+
+    class FakeCopy:
+        def __init__(self):
+            self.data = io.BytesIO()
+
+        def __enter__(self):
+            return self
+
+        def __exit__(self, *exc):
+            return False
+
+        def write(self, data):
+            self.data.write(data)
+
+    class FakeCursor:
+        rowcount = 5
+
+        def __init__(self):
+            self.sql = None
+            self.copy_obj = FakeCopy()
+            self.closed = False
+
+        def copy(self, sql):
+            self.sql = sql
+            return self.copy_obj
+
+        def close(self):
+            self.closed = True
+
+    cursor = FakeCursor()
+
+    class FakeConnection:
+        def cursor(self):
+            return cursor
+
+    rows = copy_csv_range(FakeConnection(), plan, table_ref='"staging"."_staging_x"', start=start, end=end)
+
+    assert rows == 5
+    assert cursor.closed
+    assert cursor.sql.startswith('COPY "staging"."_staging_x" ("concept_id_1", "concept_id_2", "relationship_id")')
+    assert "HEADER false" in cursor.sql
+    assert cursor.copy_obj.data.getvalue() == path.read_bytes()[start:end]
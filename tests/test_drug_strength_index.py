@@ -0,0 +1,93 @@
+"""Tests for the columnar drug_strength lookup."""
+
+from datetime import date
+
+import pandas as pd
+import pytest
+
+from omop_alchemy.cdm.model.vocabulary import Drug_Strength
+from omop_alchemy.cdm.handlers.vocabs_and_mappers import DrugStrengthIndex
+
+START, END = date(1970, 1, 1), date(2099, 12, 31)
+MG, ML = 8576, 8587
+
+
+@pytest.fixture
+def strength_session(session):
+    """
+    Session with drug strengths (rolled back after the test):
+
+    - drug 1: single ingredient 101, 500 mg
+    - drug 2: two ingredients 101 (250 mg) and 102 (10 mg/mL)
+    - drug 3: only an invalidated row
+    """
+    session.add_all(
+        [
+            Drug_Strength(drug_concept_id=1, ingredient_concept_id=101, amount_value=500.0, amount_unit_concept_id=MG,
+                          valid_start_date=START, valid_end_date=END),
+            Drug_Strength(drug_concept_id=2, ingredient_concept_id=102, numerator_value=10.0, numerator_unit_concept_id=MG,
+                          denominator_value=1.0, denominator_unit_concept_id=ML, valid_start_date=START, valid_end_date=END),
+            Drug_Strength(drug_concept_id=2, ingredient_concept_id=101, amount_value=250.0, amount_unit_concept_id=MG,
+                          box_size=30, valid_start_date=START, valid_end_date=END),
+            Drug_Strength(drug_concept_id=3, ingredient_concept_id=103, amount_value=1.0, amount_unit_concept_id=MG,
+                          valid_start_date=START, valid_end_date=END, invalid_reason="D"),
+        ]
+    )
+    session.flush()
+    return session
+
+
+class TestDrugStrengthIndex:
+    def test_loads_valid_rows_sorted(self, strength_session):
+        index = DrugStrengthIndex.from_database(strength_session)
+
+        assert len(index) == 3
+        assert index.drug_count == 2
+        assert 2 in index and 3 not in index and "2" not in index
+        assert index.lookup(2)["ingredient_concept_id"].tolist() == [101, 102]
+        assert index.lookup(99).empty
+
+    def test_include_invalid_and_restrict_drugs(self, strength_session):
+        index = DrugStrengthIndex.from_database(strength_session, drug_concept_ids=[3, 1], valid_only=False)
+
+        assert index.frame["drug_concept_id"].tolist() == [1, 3]
+
+    def test_attach_expands_ingredients_and_keeps_index(self, strength_session):
+        index = DrugStrengthIndex.from_database(strength_session)
+        exposures = pd.DataFrame(
+            {"drug_concept_id": pd.array([2, 1, 99, None], dtype="Int64"), "quantity": [2, 1, 1, 1]},
+            index=[10, 11, 12, 13],
+        )
+
+        out = index.attach(exposures)
+
+        assert out.index.tolist() == [10, 10, 11, 12, 13]
+        assert out["ingredient_concept_id"].tolist() == [101, 102, 101, pd.NA, pd.NA]
+        assert out["amount_value"].tolist() == [250.0, pd.NA, 500.0, pd.NA, pd.NA]
+        assert out["numerator_unit_concept_id"].tolist() == [pd.NA, MG, pd.NA, pd.NA, pd.NA]
+        assert out["box_size"].tolist() == [30, pd.NA, pd.NA, pd.NA, pd.NA]
+        assert str(out["amount_value"].dtype) == "Float64"
+        assert (out["quantity"] * out["amount_value"]).tolist() == [500.0, pd.NA, 500.0, pd.NA, pd.NA]
+
+    def test_attach_can_drop_unmatched(self, strength_session):
+        index = DrugStrengthIndex.from_database(strength_session)
+        exposures = pd.DataFrame({"drug": [3, 1, 2]})
+
+        out = index.attach(exposures, drug_column="drug", keep_unmatched=False)
+
+        assert out.index.tolist() == [1, 2, 2]
+        assert out["ingredient_concept_id"].tolist() == [101, 101, 102]
+
+    def test_attach_on_empty_index(self, session):
+        index = DrugStrengthIndex.from_database(session)
+
+        out = index.attach(pd.DataFrame({"drug_concept_id": [1, 2]}))
+
+        assert len(index) == 0
+        assert out["amount_value"].isna().all()
+
+    def test_attach_rejects_clashing_columns(self, strength_session):
+        index = DrugStrengthIndex.from_database(strength_session)
+
+        with pytest.raises(ValueError, match="amount_value"):
+            index.attach(pd.DataFrame({"drug_concept_id": [1], "amount_value": [1.0]}))
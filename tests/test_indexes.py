@@ -1,3 +1,5 @@
+import threading
+
 import pytest
 import sqlalchemy as sa
 from typer.testing import CliRunner
@@ -8,7 +10,7 @@ from omop_alchemy.cdm.base.indexing import OMOP_CLUSTER_INDEX_INFO_KEY, omop_ind
 from omop_alchemy.maintenance.cli import app
 from omop_alchemy.maintenance.cli_schema import create_missing_tables
 from omop_alchemy.maintenance._cli_utils import ReservedSchema, Status, reject_reserved_schema
-from omop_alchemy.maintenance.ui import render_index_summary
+from omop_alchemy.maintenance.ui import render_index_results, render_index_summary
 from omop_alchemy.maintenance.cli_indexes import (
     IndexManagementResult,
     _DROPPED_INDEXES_TABLE_NAME,
@@ -418,11 +420,16 @@ def test_enable_indexes_cli_no_cluster_flag_passes_through(monkeypatch):
         vocabulary_included: bool = False,
         dry_run: bool = False,
         cluster: bool = True,
+        parallel: int = 1,
+        maintenance_work_mem: str | None = None,
+        max_parallel_maintenance_workers: int | None = None,
     ) -> list[IndexManagementResult]:
         calls["enable"] = enable
         calls["vocabulary_included"] = vocabulary_included
         calls["dry_run"] = dry_run
         calls["cluster"] = cluster
+        calls["parallel"] = parallel
+        calls["maintenance_work_mem"] = maintenance_work_mem
         return [
             IndexManagementResult(
                 operation="index",
@@ -449,6 +456,10 @@ def test_enable_indexes_cli_no_cluster_flag_passes_through(monkeypatch):
             "indexes",
             "enable",
             "--no-cluster",
+            "--parallel",
+            "4",
+            "--maintenance-work-mem",
+            "1GB",
             "--dry-run",
         ],
     )
@@ -457,6 +468,8 @@ def test_enable_indexes_cli_no_cluster_flag_passes_through(monkeypatch):
     assert calls["cluster"] is False
     assert calls["enable"] is True
     assert calls["dry_run"] is True
+    assert calls["parallel"] == 4
+    assert calls["maintenance_work_mem"] == "1GB"
 
 
 # ── Column-set equivalence helpers ──────────────────────────────────────────────
@@ -814,6 +827,114 @@ def test_render_index_summary_omits_warnings_row_when_none():
     assert "Warnings" not in text
 
 
+def test_render_index_results_shows_build_time_when_timed():
+    timed = IndexManagementResult(
+        operation="index",
+        table_name="person",
+        category=TableCategory.CLINICAL,
+        index_name=PERSON_GENDER_INDEX,
+        column_names=("gender_concept_id",),
+        unique=False,
+        clustered=False,
+        enable=True,
+        status=Status.APPLIED,
+        detail="metadata-defined index created",
+        duration_seconds=12.34,
+    )
+
+    assert "12.3s" in _render_to_text(render_index_results([timed]))
+    assert "Time" not in _render_to_text(render_index_results([_warning_result()]))
+
+
+# ── Concurrent index builds ──────────────────────────────────────────────────────
+
+
+def _record_build_sessions(monkeypatch) -> list[tuple[str, dict[str, object]]]:
+    """Record (thread name, settings) for every index build transaction."""
+    sessions: list[tuple[str, dict[str, object]]] = []
+    lock = threading.Lock()
+
+    def recording_configure(self, conn, **settings):
+        with lock:
+            sessions.append((threading.current_thread().name, settings))
+
+    monkeypatch.setattr(SQLiteBackend, "configure_index_build_session", recording_configure)
+    return sessions
+
+
+def test_manage_indexes_enable_reports_build_durations(tmp_path):
+    engine = _fresh_engine(tmp_path)
+    manage_indexes(engine, enable=False)
+
+    planned = manage_indexes(engine, enable=True, dry_run=True)
+    enabled = manage_indexes(engine, enable=True)
+
+    assert all(result.duration_seconds is None for result in planned)
+    built = [result for result in enabled if result.operation == "index" and result.status == Status.APPLIED]
+    assert built
+    assert all(result.duration_seconds is not None and result.duration_seconds >= 0 for result in built)
+
+
+def test_manage_indexes_parallel_is_sequential_on_sqlite(tmp_path, monkeypatch):
+    """SQLite serialises writers, so parallel builds stay on the calling thread."""
+    engine = _fresh_engine(tmp_path)
+    manage_indexes(engine, enable=False)
+    sessions = _record_build_sessions(monkeypatch)
+
+    manage_indexes(engine, enable=True, parallel=4, maintenance_work_mem="64MB")
+
+    assert sessions
+    assert {thread for thread, _ in sessions} == {threading.current_thread().name}
+    assert all(
+        settings == {"maintenance_work_mem": "64MB", "max_parallel_maintenance_workers": None}
+        for _, settings in sessions
+    )
+
+
+def test_manage_indexes_parallel_builds_on_worker_connections(tmp_path, monkeypatch):
+    """With a backend that allows concurrent builds, indexes are built by the pool and all come back."""
+    # SQLite cannot really run DDL from two connections at once; a one-connection
+    # pool makes the workers take turns while still exercising the pool path.
+    engine = sa.create_engine(f"sqlite:///{tmp_path / 'indexes.db'}", pool_size=1, max_overflow=0)
+    create_missing_tables(engine)
+    expected = {(target.table_name, target.index_name) for target in collect_index_targets(engine)}
+    manage_indexes(engine, enable=False)
+    sessions = _record_build_sessions(monkeypatch)
+    monkeypatch.setattr(SQLiteBackend, "supports_concurrent_index_builds", property(lambda self: True))
+
+    enabled = manage_indexes(engine, enable=True, parallel=3)
+
+    assert sessions and all(thread.startswith("index-build") for thread, _ in sessions)
+    assert {(target.table_name, target.index_name) for target in collect_index_targets(engine)} == expected
+    tables = [result.table_name for result in enabled]
+    # results stay grouped per table in selection order, as in a sequential run
+    assert tables == sorted(tables, key=tables.index)
+    assert any(result.table_name == "person" and result.status == Status.APPLIED for result in enabled)
+
+
+def test_manage_indexes_rejects_non_positive_parallel(tmp_path):
+    engine = _fresh_engine(tmp_path)
+
+    with pytest.raises(ValueError, match="parallel"):
+        manage_indexes(engine, enable=True, parallel=0)
+
+
+@pytest.mark.filterwarnings(
+    "ignore:Skipped unsupported reflection of expression-based index:sqlalchemy.exc.SAWarning"
+)
+def test_manage_indexes_tables_limits_the_selection(tmp_path):
+    engine = _fresh_engine(tmp_path)
+
+    disabled = manage_indexes(engine, enable=False, vocabulary_included=True, tables=["concept_synonym"])
+
+    assert disabled and {result.table_name for result in disabled} == {"concept_synonym"}
+    assert PERSON_GENDER_INDEX in {index["name"] for index in sa.inspect(engine).get_indexes("person")}
+    assert not any(
+        target.table_name == "concept_synonym"
+        for target in collect_index_targets(engine, vocabulary_included=True)
+    )
+
+
 # ── Review-round-2 regression tests ──────────────────────────────────────────────
 
 
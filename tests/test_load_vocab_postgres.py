@@ -222,3 +222,41 @@ def test_db_schema_search_path_on_postgres(pg_engine, tmp_path):
         with pg_engine.connect() as conn:
             conn.execute(sa.text(f"DROP SCHEMA IF EXISTS {quoted_schema} CASCADE"))
             conn.commit()
+
+
+
+@pytest.mark.requires_resource(OmopAlchemyConfig.TEST_DB)
+def test_split_copy_load_on_postgres(pg_session, pg_engine, tmp_path):
+    """A CSV split across concurrent COPY streams lands in full through one merge."""
+    source_path = tmp_path / "athena_source"
+    source_path.mkdir()
+    for table_name, data in _ATHENA_FIXTURE_DATA.items():
+        if table_name != "concept":
+            _write_fixture_csv(source_path, table_name, data)
+
+    concept_cols = list(_ATHENA_FIXTURE_DATA["concept"].keys())
+    rows = [list(row) for row in zip(*_ATHENA_FIXTURE_DATA["concept"].values())]
+    rows += [
+        [900_000 + i, f"split concept {i}", "Gender", "Gender", "Gender", "S", f"SPLIT{i}", "19700101", "20991231", None]
+        for i in range(500)
+    ]
+    # a stray quote makes the CSV literal-quoted, which is what allows splitting it
+    rows[7][1] = '"split concept 0'
+    _write_fixture_csv(source_path, "concept", {col: tuple(values) for col, values in zip(concept_cols, zip(*rows))})
+
+    report = load_vocab_source(
+        pg_engine,
+        source_path=source_path,
+        copy_streams=3,
+        split_threshold_mb=0,
+        merge_batch_size=None,
+    )
+
+    result_by_name = {r.table_name: r for r in report.results}
+    assert result_by_name["concept"].status == "loaded"
+    assert "3 concurrent COPY streams" in result_by_name["concept"].detail
+    assert result_by_name["concept"].row_count == 507
+    count = pg_session.execute(sa.text("SELECT COUNT(*) FROM concept WHERE concept_id >= 900000")).scalar()
+    assert count == 500
+    name = pg_session.execute(sa.text("SELECT concept_name FROM concept WHERE concept_id = 900000")).scalar()
+    assert name == '"split concept 0'
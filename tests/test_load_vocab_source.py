@@ -1,9 +1,12 @@
+import os
+import threading
+from contextlib import contextmanager
 from pathlib import Path
 
 import pytest
 import sqlalchemy as sa
 from oa_configurator import StackConfig, DatabaseConfig
-from sqlalchemy.orm import sessionmaker
+from sqlalchemy.orm import Session, sessionmaker
 from typer.testing import CliRunner
 
 from omop_alchemy.maintenance.cli import app
@@ -13,11 +16,23 @@ from omop_alchemy.maintenance.cli_vocab import (
     OPTIONAL_VOCAB_MODELS,
     REQUIRED_VOCAB_MODELS,
     MergeStrategy,
+    VocabularyLoadError,
+    _largest_first,
     _load_vocab_model_csv,
+    _load_vocab_model_csv_split,
     load_vocab_source,
 )
+from omop_alchemy.maintenance._csv_split import csv_byte_ranges, plan_csv_split
+from omop_alchemy.maintenance._vocab_journal import (
+    JournalStatus,
+    bulk_mode_interrupted,
+    fingerprint_csv,
+    read_load_journal,
+    stat_csv,
+)
 from omop_alchemy.maintenance.tables import TableCategory
-from omop_alchemy.cdm.model.vocabulary import Drug_Strength
+from omop_alchemy.cdm.handlers.vocabs_and_mappers import concept_attribute_cache
+from omop_alchemy.cdm.model.vocabulary import Concept, Concept_Relationship, Domain, Drug_Strength
 from omop_alchemy.config import OmopAlchemyConfig
 
 
@@ -184,6 +199,10 @@ def test_load_vocab_source_cli_uses_configured_athena_source(monkeypatch, tmp_pa
         chunksize: int | None = None,
         bulk_mode: bool = True,
         merge_batch_size: int = 1_000_000,
+        parallel: int = 1,
+        copy_streams: int = 1,
+        split_threshold_mb: int = 1024,
+        skip_unchanged: bool = False,
         progress_callback=None,
     ):
         calls["source_path"] = str(source_path)
@@ -655,6 +674,8 @@ def test_load_vocab_source_bulk_mode_surfaces_index_warnings(monkeypatch, tmp_pa
         "omop_alchemy.maintenance.cli_vocab.ensure_schema",
         lambda engine, schema: None,
     )
+    # likewise keep the load journal out of the (PostgreSQL-only) staging schema
+    monkeypatch.setattr("omop_alchemy.maintenance._vocab_journal._journal_schema", lambda engine: None)
     monkeypatch.setattr(
         "omop_alchemy.maintenance.cli_vocab.manage_foreign_key_triggers",
         lambda engine, **kwargs: [],
@@ -713,6 +734,539 @@ def test_load_vocab_source_bulk_mode_surfaces_index_warnings(monkeypatch, tmp_pa
     )
 
 
+def _fake_postgres_bulk_mode(monkeypatch, engine) -> None:
+    """Pretend engine is PostgreSQL and stub out the bulk-mode DDL around the table loads."""
+    monkeypatch.setattr(engine.dialect, "name", "postgresql")
+    monkeypatch.setattr("omop_alchemy.maintenance.cli_vocab.ensure_schema", lambda engine, schema: None)
+    monkeypatch.setattr("omop_alchemy.maintenance._vocab_journal._journal_schema", lambda engine: None)
+    monkeypatch.setattr(
+        "omop_alchemy.maintenance.cli_vocab.manage_foreign_key_triggers",
+        lambda engine, **kwargs: [],
+    )
+    monkeypatch.setattr("omop_alchemy.maintenance.cli_vocab.manage_indexes", lambda engine, **kwargs: [])
+    monkeypatch.setattr("omop_alchemy.maintenance.cli_vocab.reset_model_sequences", lambda engine, **kwargs: [])
+
+
+def test_load_vocab_source_parallel_loads_tables_concurrently(monkeypatch, tmp_path):
+    """With --parallel 2 in bulk mode the two largest tables are in flight at the same time."""
+    engine = sa.create_engine(f"sqlite:///{tmp_path / 'load_vocab_source_parallel.db'}", future=True)
+    source_path = _build_required_athena_source(tmp_path, include_optional=("drug_strength",))
+    _write_csv_with_size(source_path, "concept_relationship", 500)
+    _write_csv_with_size(source_path, "concept_ancestor", 400)
+    _fake_postgres_bulk_mode(monkeypatch, engine)
+
+    # Both big tables must reach the barrier before either can finish; a sequential
+    # load would time out here.
+    barrier = threading.Barrier(2, timeout=5)
+    loaded: list[str] = []
+    lock = threading.Lock()
+
+    def fake_load_vocab_model_csv(session, *, model, csv_path, merge_strategy, **kwargs) -> int:
+        with lock:
+            loaded.append(model.__tablename__)
+        if model.__tablename__ in {"concept_relationship", "concept_ancestor"}:
+            barrier.wait()
+        return csv_path.stat().st_size
+
+    monkeypatch.setattr(
+        "omop_alchemy.maintenance.cli_vocab._load_vocab_model_csv",
+        fake_load_vocab_model_csv,
+    )
+    events: list[object] = []
+
+    report = load_vocab_source(engine, source_path=source_path, parallel=2, progress_callback=events.append)
+
+    assert set(loaded[:2]) == {"concept_relationship", "concept_ancestor"}
+    assert sorted(loaded) == sorted([m.__tablename__ for m in REQUIRED_VOCAB_MODELS] + ["drug_strength"])
+    assert [r.table_name for r in report.results] == [
+        m.__tablename__ for m in REQUIRED_VOCAB_MODELS + OPTIONAL_VOCAB_MODELS
+    ]
+    result_by_name = {r.table_name: r for r in report.results}
+    assert result_by_name["concept_relationship"].row_count == 500
+    assert result_by_name["drug_strength"].status == Status.LOADED
+    assert result_by_name["source_to_concept_map"].status == Status.SKIPPED
+    percents = [event.percent for event in events]  # type: ignore[attr-defined]
+    assert percents == sorted(percents) and percents[-1] == pytest.approx(100.0)
+
+
+def test_largest_first_orders_jobs_by_csv_size(tmp_path):
+    """Parallel loads are scheduled biggest CSV first."""
+    source_path = _build_required_athena_source(tmp_path)
+    _write_csv_with_size(source_path, "concept", 300)
+    _write_csv_with_size(source_path, "concept_relationship", 500)
+    jobs = [
+        (model, source_path / f"{model.__tablename__.upper()}.csv", True)
+        for model in REQUIRED_VOCAB_MODELS
+    ]
+
+    ordered = [model.__tablename__ for model, _, _ in _largest_first(jobs)]
+
+    assert ordered[:2] == ["concept_relationship", "concept"]
+    # equal-sized files keep their FK dependency order
+    assert ordered[2:] == [
+        m.__tablename__ for m in REQUIRED_VOCAB_MODELS
+        if m.__tablename__ not in {"concept", "concept_relationship"}
+    ]
+
+
+def test_load_vocab_source_parallel_without_bulk_mode_keeps_fk_order(monkeypatch, tmp_path):
+    """Parallel loading is ignored when FK triggers stay enabled."""
+    engine = sa.create_engine(f"sqlite:///{tmp_path / 'load_vocab_source_parallel_seq.db'}", future=True)
+    source_path = _build_required_athena_source(tmp_path)
+    _write_csv_with_size(source_path, "concept_synonym", 500)
+    loaded: list[tuple[str, str]] = []
+
+    def fake_load_vocab_model_csv(session, *, model, **kwargs) -> int:
+        loaded.append((model.__tablename__, threading.current_thread().name))
+        return 1
+
+    monkeypatch.setattr(
+        "omop_alchemy.maintenance.cli_vocab._load_vocab_model_csv",
+        fake_load_vocab_model_csv,
+    )
+
+    load_vocab_source(engine, source_path=source_path, parallel=4)
+
+    assert [name for name, _ in loaded] == [m.__tablename__ for m in REQUIRED_VOCAB_MODELS]
+    assert {thread for _, thread in loaded} == {threading.current_thread().name}
+
+
+def test_load_vocab_source_parallel_wraps_failed_table_load(monkeypatch, tmp_path):
+    """A failing table in a parallel load surfaces as VocabularyLoadError and still rebuilds indexes."""
+    engine = sa.create_engine(f"sqlite:///{tmp_path / 'load_vocab_source_parallel_error.db'}", future=True)
+    source_path = _build_required_athena_source(tmp_path)
+    _fake_postgres_bulk_mode(monkeypatch, engine)
+    index_calls: list[bool] = []
+    monkeypatch.setattr(
+        "omop_alchemy.maintenance.cli_vocab.manage_indexes",
+        lambda engine, *, enable, **kwargs: index_calls.append(enable) or [],
+    )
+
+    def fake_load_vocab_model_csv(session, *, model, **kwargs) -> int:
+        if model.__tablename__ == "concept":
+            raise ValueError("bad row")
+        return 1
+
+    monkeypatch.setattr(
+        "omop_alchemy.maintenance.cli_vocab._load_vocab_model_csv",
+        fake_load_vocab_model_csv,
+    )
+
+    with pytest.raises(VocabularyLoadError, match="table `concept`.*bad row"):
+        load_vocab_source(engine, source_path=source_path, parallel=3)
+
+    assert index_calls == [False, True]
+
+
+def test_load_vocab_source_rejects_non_positive_parallel(tmp_path):
+    engine = sa.create_engine(f"sqlite:///{tmp_path / 'load_vocab_source_parallel_zero.db'}", future=True)
+    source_path = _build_required_athena_source(tmp_path)
+
+    with pytest.raises(RuntimeError, match="parallel"):
+        load_vocab_source(engine, source_path=source_path, parallel=0)
+
+
+def _write_tab_csv(source_path: Path, table_name: str, rows: int) -> Path:
+    """A tab-delimited CSV whose stray double quote makes its quote mode resolve to literal."""
+    csv_path = source_path / f"{table_name.upper()}.csv"
+    lines = ["concept_id_1\tconcept_id_2\trelationship_id"]
+    lines += [f"{i}\t{i}\tMaps to" for i in range(rows)]
+    lines[1] = '0\t0\t"Maps to'
+    csv_path.write_text("\n".join(lines) + "\n", encoding="utf-8")
+    return csv_path
+
+
+def _record_split_loads(monkeypatch) -> list[tuple[str, int]]:
+    split: list[tuple[str, int]] = []
+
+    def fake_split(session, *, model, plan, streams, **kwargs) -> int:
+        split.append((model.__tablename__, streams))
+        return 7
+
+    monkeypatch.setattr("omop_alchemy.maintenance.cli_vocab._load_vocab_model_csv_split", fake_split)
+    monkeypatch.setattr(
+        "omop_alchemy.maintenance.cli_vocab._load_vocab_model_csv",
+        lambda session, *, model, **kwargs: 1,
+    )
+    return split
+
+
+def test_load_vocab_source_splits_large_tab_delimited_csvs(monkeypatch, tmp_path):
+    """Only splittable CSVs at or above the threshold go through concurrent COPY streams."""
+    engine = sa.create_engine(f"sqlite:///{tmp_path / 'load_vocab_source_split.db'}", future=True)
+    source_path = _build_required_athena_source(tmp_path)
+    _write_tab_csv(source_path, "concept_relationship", 10)
+    _fake_postgres_bulk_mode(monkeypatch, engine)
+    split = _record_split_loads(monkeypatch)
+
+    report = load_vocab_source(
+        engine,
+        source_path=source_path,
+        copy_streams=3,
+        split_threshold_mb=0,
+        merge_batch_size=None,
+    )
+
+    # the single-column stub CSVs cannot be split and fall back to one stream
+    assert split == [("concept_relationship", 3)]
+    result_by_name = {r.table_name: r for r in report.results}
+    assert result_by_name["concept_relationship"].row_count == 7
+    assert "3 concurrent COPY streams" in result_by_name["concept_relationship"].detail
+    assert result_by_name["concept"].row_count == 1
+
+
+def test_load_vocab_source_does_not_split_below_threshold_or_with_merge_batches(monkeypatch, tmp_path):
+    """Paginated merges need a gap-free staging _rownum, so they disable splitting."""
+    engine = sa.create_engine(f"sqlite:///{tmp_path / 'load_vocab_source_no_split.db'}", future=True)
+    source_path = _build_required_athena_source(tmp_path)
+    _write_tab_csv(source_path, "concept_relationship", 10)
+    _fake_postgres_bulk_mode(monkeypatch, engine)
+    split = _record_split_loads(monkeypatch)
+
+    load_vocab_source(engine, source_path=source_path, copy_streams=3, merge_batch_size=None)
+    load_vocab_source(
+        engine,
+        source_path=source_path,
+        copy_streams=3,
+        split_threshold_mb=0,
+        merge_batch_size=1000,
+    )
+
+    assert split == []
+
+
+def test_load_vocab_model_csv_split_copies_ranges_then_merges_once(monkeypatch, tmp_path):
+    """Every byte range is COPYed on its own connection before the single merge."""
+    engine = sa.create_engine(f"sqlite:///{tmp_path / 'split_loader.db'}", future=True)
+    csv_path = _write_tab_csv(tmp_path, "concept_relationship", 100)
+    plan = plan_csv_split(csv_path)
+    events: list[object] = []
+
+    Concept_Relationship.__table__.create(engine)
+
+    class FakeModel:
+        __tablename__ = "concept_relationship"
+        __table__ = Concept_Relationship.__table__
+
+        @staticmethod
+        def create_staging_table(session, staging_schema=None):
+            events.append("create")
+
+        @staticmethod
+        @contextmanager
+        def manage_indices(session, index_strategy="auto", staging_schema=None):
+            events.append(("indices", index_strategy))
+            yield
+
+        @staticmethod
+        def merge_from_staging(session, merge_strategy, merge_batch_size=None, staging_schema=None):
+            events.append(("merge", merge_strategy))
+
+        @staticmethod
+        def drop_staging_table(session, staging_schema=None):
+            events.append("drop")
+
+    copied: list[tuple[int, int]] = []
+    lock = threading.Lock()
+
+    def fake_copy_csv_range(dbapi_connection, plan, *, table_ref, start, end) -> int:
+        with lock:
+            copied.append((start, end))
+            events.append("copy")
+        return 10
+
+    monkeypatch.setattr("omop_alchemy.maintenance.cli_vocab.copy_csv_range", fake_copy_csv_range)
+
+    with sessionmaker(bind=engine)() as session:
+        sa.event.listen(session, "after_commit", lambda s: events.append("commit"))
+        total = _load_vocab_model_csv_split(
+            session,
+            load_engine=engine,
+            model=FakeModel,  # type: ignore[arg-type]
+            plan=plan,
+            streams=4,
+            merge_strategy="insert_if_empty",
+            index_strategy="keep",
+        )
+
+    assert total == 40
+    assert sorted(copied) == csv_byte_ranges(plan, 4)
+    # the staging table is committed before any COPY connection uses it
+    assert events == ["create", "commit", *["copy"] * 4, ("indices", "keep"), ("merge", "insert_if_empty"), "drop"]
+
+
+def test_load_vocab_source_rejects_non_positive_copy_streams(tmp_path):
+    engine = sa.create_engine(f"sqlite:///{tmp_path / 'load_vocab_source_streams_zero.db'}", future=True)
+    source_path = _build_required_athena_source(tmp_path)
+
+    with pytest.raises(RuntimeError, match="copy_streams"):
+        load_vocab_source(engine, source_path=source_path, copy_streams=0)
+
+
+def test_fingerprint_csv_ignores_mtime_for_identical_content(tmp_path):
+    first = tmp_path / "a.csv"
+    second = tmp_path / "b.csv"
+    first.write_text("concept_id\n1\n", encoding="utf-8")
+    second.write_text("concept_id\n1\n", encoding="utf-8")
+    os.utime(second, ns=(0, 0))
+
+    assert fingerprint_csv(first).same_content(fingerprint_csv(second))
+    assert not stat_csv(first).same_content(stat_csv(first))
+    second.write_text("concept_id\n2\n", encoding="utf-8")
+    assert not fingerprint_csv(first).same_content(fingerprint_csv(second))
+
+
+def _record_table_loads(monkeypatch, *, fail_on: set[str] | None = None) -> list[tuple[str, bool]]:
+    """Replace the per-table loader; record (table, truncate_first) and optionally fail some tables.
+
+    Nothing is loaded: each table reports the rows it already holds, as the
+    real loader reports what it merged.
+    """
+    loaded: list[tuple[str, bool]] = []
+
+    def fake_load_vocab_table(load_engine, *, model, csv_path, truncate_first=False, **kwargs):
+        loaded.append((model.__tablename__, truncate_first))
+        if fail_on and model.__tablename__ in fail_on:
+            raise VocabularyLoadError(f"table `{model.__tablename__}` failed")
+        with load_engine.connect() as connection:
+            rows = connection.execute(sa.select(sa.func.count()).select_from(model.__table__)).scalar_one()
+        return rows, 1
+
+    monkeypatch.setattr("omop_alchemy.maintenance.cli_vocab._load_vocab_table", fake_load_vocab_table)
+    return loaded
+
+
+def test_load_vocab_source_journals_every_table(monkeypatch, tmp_path):
+    engine = sa.create_engine(f"sqlite:///{tmp_path / 'load_vocab_source_journal.db'}", future=True)
+    source_path = _build_required_athena_source(tmp_path)
+    _record_table_loads(monkeypatch)
+
+    load_vocab_source(engine, source_path=source_path, merge_strategy="upsert")
+
+    journal = read_load_journal(engine, db_schema=None)
+    assert set(journal) == {m.__tablename__ for m in REQUIRED_VOCAB_MODELS}
+    entry = journal["concept"]
+    assert entry.status == JournalStatus.LOADED
+    assert entry.row_count == 0
+    assert entry.merge_strategy == "upsert"
+    assert entry.fingerprint == fingerprint_csv(source_path / "CONCEPT.csv")
+
+
+def test_load_vocab_source_clears_the_concept_attribute_cache(monkeypatch, tmp_path):
+    engine = sa.create_engine(f"sqlite:///{tmp_path / 'load_vocab_source_cache.db'}", future=True)
+    source_path = _build_required_athena_source(tmp_path)
+    _record_table_loads(monkeypatch)
+    Concept.__table__.create(engine)
+    cache = concept_attribute_cache(engine)
+    cache.cache_missing = True
+    with Session(engine) as session:
+        assert cache.get(session, 999) is None
+    assert len(cache) == 1
+
+    load_vocab_source(engine, source_path=source_path)
+
+    assert len(cache) == 0
+
+
+def test_load_vocab_source_skip_unchanged_skips_tables_loaded_from_identical_csvs(monkeypatch, tmp_path):
+    engine = sa.create_engine(f"sqlite:///{tmp_path / 'load_vocab_source_resume.db'}", future=True)
+    source_path = _build_required_athena_source(tmp_path)
+    loaded = _record_table_loads(monkeypatch)
+    load_vocab_source(engine, source_path=source_path)
+    loaded.clear()
+    (source_path / "CONCEPT.csv").write_text("stub\nchanged\n", encoding="utf-8")
+
+    report = load_vocab_source(engine, source_path=source_path, skip_unchanged=True)
+
+    assert loaded == [("concept", False)]
+    result_by_name = {r.table_name: r for r in report.results}
+    assert result_by_name["concept"].status == Status.LOADED
+    assert result_by_name["domain"].status == Status.SKIPPED
+    assert result_by_name["domain"].row_count == 0
+    assert "unchanged" in result_by_name["domain"].detail
+
+
+def test_load_vocab_source_skip_unchanged_resumes_after_failed_table(monkeypatch, tmp_path):
+    """Tables before the failure are skipped; the failed one is reloaded and, for insert_if_empty, truncated first."""
+    engine = sa.create_engine(f"sqlite:///{tmp_path / 'load_vocab_source_resume_failed.db'}", future=True)
+    source_path = _build_required_athena_source(tmp_path)
+    _record_table_loads(monkeypatch, fail_on={"concept"})
+    with pytest.raises(VocabularyLoadError):
+        load_vocab_source(engine, source_path=source_path, merge_strategy="insert_if_empty")
+    journal = read_load_journal(engine, db_schema=None)
+    assert journal["concept"].status == JournalStatus.FAILED
+    assert "concept_ancestor" not in journal
+
+    loaded = _record_table_loads(monkeypatch)
+    load_vocab_source(engine, source_path=source_path, merge_strategy="insert_if_empty", skip_unchanged=True)
+
+    names = [m.__tablename__ for m in REQUIRED_VOCAB_MODELS]
+    assert loaded == [(name, name == "concept") for name in names[names.index("concept"):]]
+    assert all(e.status == JournalStatus.LOADED for e in read_load_journal(engine, db_schema=None).values())
+
+
+def test_load_vocab_source_hashes_each_csv_once(monkeypatch, tmp_path):
+    """Loads hash their CSV in the job; skip_unchanged pre-hashes only CSVs of the journaled size."""
+    engine = sa.create_engine(f"sqlite:///{tmp_path / 'load_vocab_source_hashing.db'}", future=True)
+    source_path = _build_required_athena_source(tmp_path)
+    loaded = _record_table_loads(monkeypatch)
+    load_vocab_source(engine, source_path=source_path)
+    loaded.clear()
+    (source_path / "CONCEPT.csv").write_text("stub\nchanged, and longer\n", encoding="utf-8")
+    hashed: list[str] = []
+
+    def recording_fingerprint_csv(path):
+        hashed.append(path.name)
+        return fingerprint_csv(path)
+
+    monkeypatch.setattr("omop_alchemy.maintenance.cli_vocab.fingerprint_csv", recording_fingerprint_csv)
+
+    load_vocab_source(engine, source_path=source_path, skip_unchanged=True)
+
+    assert loaded == [("concept", False)]
+    assert sorted(hashed) == sorted(f"{m.__tablename__.upper()}.csv" for m in REQUIRED_VOCAB_MODELS)
+    assert read_load_journal(engine, db_schema=None)["concept"].fingerprint == fingerprint_csv(
+        source_path / "CONCEPT.csv"
+    )
+
+
+def test_load_vocab_source_without_skip_unchanged_reloads_everything(monkeypatch, tmp_path):
+    engine = sa.create_engine(f"sqlite:///{tmp_path / 'load_vocab_source_reload.db'}", future=True)
+    source_path = _build_required_athena_source(tmp_path)
+    loaded = _record_table_loads(monkeypatch)
+    load_vocab_source(engine, source_path=source_path)
+    loaded.clear()
+
+    load_vocab_source(engine, source_path=source_path)
+
+    assert [name for name, _ in loaded] == [m.__tablename__ for m in REQUIRED_VOCAB_MODELS]
+
+
+def test_load_vocab_source_skip_unchanged_scopes_bulk_index_rebuild(monkeypatch, tmp_path):
+    """Unchanged tables keep their indexes: bulk mode drops and rebuilds only the reloaded ones."""
+    engine = sa.create_engine(f"sqlite:///{tmp_path / 'load_vocab_source_unchanged_bulk.db'}", future=True)
+    source_path = _build_required_athena_source(tmp_path)
+    _fake_postgres_bulk_mode(monkeypatch, engine)
+    index_calls: list[tuple[bool, list[str] | None]] = []
+    monkeypatch.setattr(
+        "omop_alchemy.maintenance.cli_vocab.manage_indexes",
+        lambda engine, *, enable, tables=None, **kwargs: index_calls.append((enable, tables)) or [],
+    )
+    _record_table_loads(monkeypatch)
+    load_vocab_source(engine, source_path=source_path)
+    index_calls.clear()
+    (source_path / "CONCEPT_SYNONYM.csv").write_text("stub\nnew synonym\n", encoding="utf-8")
+
+    load_vocab_source(engine, source_path=source_path, skip_unchanged=True)
+
+    assert index_calls == [(False, ["concept_synonym"]), (True, ["concept_synonym"])]
+
+
+def test_load_vocab_source_skip_unchanged_with_nothing_to_load_skips_bulk_mode(monkeypatch, tmp_path):
+    engine = sa.create_engine(f"sqlite:///{tmp_path / 'load_vocab_source_all_unchanged.db'}", future=True)
+    source_path = _build_required_athena_source(tmp_path)
+    _fake_postgres_bulk_mode(monkeypatch, engine)
+    fk_calls: list[bool] = []
+    monkeypatch.setattr(
+        "omop_alchemy.maintenance.cli_vocab.manage_foreign_key_triggers",
+        lambda engine, *, enable, **kwargs: fk_calls.append(enable) or [],
+    )
+    loaded = _record_table_loads(monkeypatch)
+    load_vocab_source(engine, source_path=source_path)
+    loaded.clear()
+    fk_calls.clear()
+
+    report = load_vocab_source(engine, source_path=source_path, skip_unchanged=True)
+
+    assert loaded == [] and fk_calls == []
+    assert all(r.status == Status.SKIPPED for r in report.results)
+
+
+class _ProcessKilled(BaseException):
+    """Stands in for the process dying: raised where a real crash would stop everything."""
+
+
+def test_load_vocab_source_resume_restores_bulk_mode_of_interrupted_run(monkeypatch, tmp_path):
+    """A run killed before restoring indexes/triggers is repaired by --resume, even with nothing to load."""
+    engine = sa.create_engine(f"sqlite:///{tmp_path / 'load_vocab_source_bulk_crash.db'}", future=True)
+    source_path = _build_required_athena_source(tmp_path)
+    _fake_postgres_bulk_mode(monkeypatch, engine)
+    calls: list[tuple[str, bool, list[str] | None]] = []
+    killed = {"on": True}
+
+    def fake_manage_indexes(engine, *, enable, tables=None, **kwargs):
+        if enable and killed["on"]:
+            # every table is loaded and journaled; the process dies during the rebuild
+            raise _ProcessKilled
+        calls.append(("indexes", enable, tables))
+        return []
+
+    monkeypatch.setattr("omop_alchemy.maintenance.cli_vocab.manage_indexes", fake_manage_indexes)
+    monkeypatch.setattr(
+        "omop_alchemy.maintenance.cli_vocab.manage_foreign_key_triggers",
+        lambda engine, *, enable, **kwargs: calls.append(("triggers", enable, None)) or [],
+    )
+    loaded = _record_table_loads(monkeypatch)
+    with pytest.raises(_ProcessKilled):
+        load_vocab_source(engine, source_path=source_path)
+    assert bulk_mode_interrupted(engine, db_schema=None)
+    assert all(e.status == JournalStatus.LOADED for e in read_load_journal(engine, db_schema=None).values())
+    killed["on"] = False
+    loaded.clear()
+    calls.clear()
+
+    report = load_vocab_source(engine, source_path=source_path, skip_unchanged=True)
+
+    assert loaded == []
+    assert all(r.status == Status.SKIPPED for r in report.results)
+    assert calls == [("indexes", True, None), ("triggers", True, None)]
+    assert not bulk_mode_interrupted(engine, db_schema=None)
+
+    calls.clear()
+    load_vocab_source(engine, source_path=source_path, skip_unchanged=True)
+    assert calls == []
+
+
+def test_load_vocab_source_skip_unchanged_reloads_dropped_table(monkeypatch, tmp_path):
+    """An identical CSV is not enough if the target table has been dropped since."""
+    engine = sa.create_engine(f"sqlite:///{tmp_path / 'load_vocab_source_dropped.db'}", future=True)
+    source_path = _build_required_athena_source(tmp_path)
+    loaded = _record_table_loads(monkeypatch)
+    load_vocab_source(engine, source_path=source_path)
+    loaded.clear()
+    with engine.begin() as connection:
+        connection.execute(sa.text("DROP TABLE concept_synonym"))
+
+    load_vocab_source(engine, source_path=source_path, skip_unchanged=True)
+
+    assert loaded == [("concept_synonym", False)]
+
+
+def test_load_vocab_source_skip_unchanged_reloads_table_whose_rows_changed(monkeypatch, tmp_path):
+    """An identical CSV is not enough if the table no longer holds the journaled row count."""
+    engine = sa.create_engine(f"sqlite:///{tmp_path / 'load_vocab_source_truncated.db'}", future=True)
+    source_path = _build_required_athena_source(tmp_path)
+    Domain.__table__.create(engine)
+    with engine.begin() as connection:
+        connection.execute(
+            sa.insert(Domain.__table__),
+            [
+                {"domain_id": "Condition", "domain_name": "Condition", "domain_concept_id": 19},
+                {"domain_id": "Drug", "domain_name": "Drug", "domain_concept_id": 13},
+            ],
+        )
+    loaded = _record_table_loads(monkeypatch)
+    load_vocab_source(engine, source_path=source_path)
+    assert read_load_journal(engine, db_schema=None)["domain"].row_count == 2
+    loaded.clear()
+    with engine.begin() as connection:
+        connection.execute(sa.text("DELETE FROM domain"))
+
+    load_vocab_source(engine, source_path=source_path, skip_unchanged=True)
+
+    assert loaded == [("domain", False)]
+
+
 def test_render_vocab_index_warnings_none_when_no_warnings():
     from omop_alchemy.maintenance.cli_vocab import VocabularyLoadReport
     from omop_alchemy.maintenance.ui import render_vocab_index_warnings